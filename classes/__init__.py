@@ -1,11 +1,21 @@
-"""Contains modules that primarily contain classes and related functions.
-
-Modules
--------
-file_manager
-    Encapsulation of operations to occur on local files.
-nodes
-    Classes for the node objects in the database, and their related methods.
-ryu_connector
-    Class containing the connection details to the database.
+"""Contains modules that primarily contain classes and related functions.
+
+Modules
+-------
+file_manager
+    Encapsulation of operations to occur on local files.
+name_index
+    Class for finding and ranking names that resemble a search.
+nodes
+    Classes for the node objects in the database, and their related methods.
+ryu_backend
+    Classes for the storage backends that serve reads of the Ryu database.
+ryu_cache
+    Classes for caching the results of reads from the Ryu database.
+ryu_connector
+    Class containing the connection details to the database.
+ryu_graph
+    Class for holding the Ryu database as an in-memory bipartite graph.
+ryu_snapshot
+    Class for reading and writing the whole Ryu database as one binary file.
 """
\ No newline at end of file
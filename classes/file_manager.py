@@ -1,410 +1,723 @@
-"""Encapsulation of operations to occur on local files.
-
-All methods within this module serve the purpose of interacting with
-local files, allowing changes made to the database to be accurately
-reflected in local text files.
-
-The files that can be changed include the following:
-    The `.txt` files holding all information about games and characters.
-    The `.csv` file holding all information about character aliases.
-"""
-
-import os
-from typing import Dict, Optional, List
-
-import csv
-
-from classes.nodes import GameCharacter
-from main import GAMES_PATH, TABLES_PATH
-
-
-ALIAS_FILE = f"{TABLES_PATH}/alias.csv"
-TEMP_FILE = f"{TABLES_PATH}/temp.csv"
-ALIAS_HEADER = ["cname", "aname"]
-CSV_PROPERTIES = {
-    "delimiter": ",",
-    "quotechar": ":",
-    "quoting": csv.QUOTE_MINIMAL
-}
-
-ERROR_MESSAGES = {
-    "default":      lambda e: f"ERROR: {e}",
-    "os_open":      lambda f: f"Could not open file: {f}",
-    "os_make":      lambda f: f"Could not create file: {f}",
-    "os_nopath":    lambda f: f"Path to {f} does not exist"
-}
-
-
-#======================#
-# GAME FILE OPERATIONS #
-#======================#
-
-def replaceLine(oldLine: str, newLine: str, filePath: str, end: str='\n') -> bool:
-    """Replace a given line in a file with another line.
-    
-    Parameters
-    ----------
-    oldLine: str
-        The line that can be found in the file, that will be replaced. This
-        does not include the newline character found at the end of each line.
-    newLine: str
-        The new line to insert to the file in place of the oldLine.
-    filePath: str
-        The path by which to find the file, including the extension and leading
-        folders.
-    end: str
-        What to insert at the end of the line. Default is a newline character.
-        Altering this to not produce a new line may cause unintended side-
-        effects.
-    
-    Return
-    ------
-    bool
-        Whether or not the file was successfully altered.
-    """
-    try:
-        with open(filePath, "r+") as f:
-            lines = f.readlines()
-            for i in range(len(lines)):
-                if lines[i].strip('\n') == oldLine:
-                    if i < len(lines) - 1:
-                        lines[i] = f"{newLine}{end}"
-                    else:
-                        lines[i] = f"{newLine}"
-                        if end == '':
-                            lines[i-1] = lines[i-1].strip('\n')
-            f.seek(0)
-            f.truncate()
-            f.seek(0)
-            f.writelines(lines)
-        return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def parseGameFile(filename: str) -> Optional[Dict[str, tuple]]:
-    """Parse a game's text file and return its dictionary representation.
-    
-    Since every file is saved in an identical format, parsing each file is
-    repetitive and can be done in a similar fashion for each text file.
-
-    Return
-    ------
-    Dict[str, tuple] | None
-        A dictionary representation of the game. Specifically, with keys "game"
-        and "GameCharacters", which relate to a tuple (title, release_date)
-        and list of names respectively. If any errors occur, None is returned.
-    """
-    try:
-        data = open("%s/%s" % (GAMES_PATH, filename), "r").read().splitlines()
-        returnVal = {}
-        filename = filename[:-4]
-        returnVal["game"] = (filename, data.pop(0))
-        returnVal["game_characters"] = []
-        for c in data:
-            returnVal["game_characters"].append(c)
-        return returnVal
-    except OSError:
-        print(ERROR_MESSAGES["os_open"](filename))
-        return None
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return None
-
-def getGameFiles() -> List[str]:
-    """Return an array containing the names of all files in `main.PATH`."""
-    return os.listdir(GAMES_PATH)
-
-def writeGameFile(gtitle: str, release_date: str, characters: List[str]) -> bool:
-    """Create a file for a game according to the database format.
-    
-    The file is created such that the filename is `gtitle`.txt, the first
-    line is the game's release date, and each subsequent line is a character
-    name, which can be found in the `characters` list. 
-
-    Returns whether or not the file was created successfully.
-    """
-    try:
-        with open("%s/%s.txt" % (GAMES_PATH, gtitle), "w") as f:
-            f.write("%s" % release_date)
-            for c in characters:
-                f.write("\n%s" % c)
-        return True
-    except OSError:
-        print(ERROR_MESSAGES["os_make"](gtitle))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def appendGameFile(gtitle: str, characters: List[str]) -> bool:
-    """Add characters to the end of a game's text file.
-    
-    The title of the game is passed, and any additional characters are
-    passed in the `characters` list. This method does not check for
-    duplicate entries, so it is up to the caller to ensure this method does
-    not allow for duplicate entries, which may lead to unintended side-
-    effects.
-
-    Returns whether or not the characters were appended to the file
-    successfully.
-    """
-    try:
-        with open("%s/%s.txt" % (GAMES_PATH, gtitle), "a") as f:
-            for c in characters:
-                f.write("\n%s" % c)
-        return True
-    except OSError:
-        print(ERROR_MESSAGES["os_open"](gtitle))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def removeCharacterFromGame(cname: str, gtitle: str) -> bool:
-    """Remove a character's name from a game's text file.
-    
-    Returns whether or not the character's name was removed successfully.
-    """
-    try:
-        replaceLine(cname, "", "%s/%s.txt" % (GAMES_PATH, gtitle), end = "")
-        return True
-    except OSError:
-        print(ERROR_MESSAGES["os_open"](gtitle))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def removeGame(gtitle: str) -> bool:
-    """Remove a game's text file from the local files.
-    
-    Returns whether or not the file was removed successfully.
-    """
-    try:
-        if os.path.exists("%s/%s.txt" % (GAMES_PATH, gtitle)):
-            os.remove("%s/%s.txt" % (GAMES_PATH, gtitle))
-            return True
-        else:
-            raise OSError()
-    except OSError:
-        print(ERROR_MESSAGES["os_nopath"](gtitle))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def updateCharacterName(c: GameCharacter, new_name: str) -> bool:
-    """Update a character's name in all games for which they appear.
-    
-    Returns whether or not the character's name was updated in all games.
-    """
-    try:
-        for gtitle in c.appears_in:
-            replaceLine(c.name, new_name, "%s/%s.txt" % (GAMES_PATH, gtitle))
-        if updateAliasCname(c.name, new_name):
-            return True
-        return False
-    except OSError:
-        print(ERROR_MESSAGES["os_open"](gtitle))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def updateGameTitle(old_title: str, new_title: str) -> bool:
-    """Update the title of a game's text file locally.
-    
-    Returns whether or not the game's title was updated successfully.
-    """
-    try:
-        os.rename("%s/%s.txt" % (GAMES_PATH, old_title), "%s/%s.txt" % (GAMES_PATH, new_title))
-        return True
-    except OSError:
-        print(ERROR_MESSAGES["os_nopath"](old_title))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def updateGameReleaseDate(gtitle: str, new_release_date: str) -> bool:
-    """Update the release date of a game's local text file.
-    
-    Returns whether or not the game's release date was updated
-    successfully.
-    """
-    try:
-        lines: List[str] = []
-        with open("%s/%s.txt" % (GAMES_PATH, gtitle), "r") as f:
-            lines = f.readlines()
-            lines[0] = "%s\n" % new_release_date    # The release date is the first line of the text file
-        with open("%s/%s.txt" % (GAMES_PATH, gtitle), "w") as f:
-            f.writelines(lines)
-        return True
-    except OSError:
-        print(ERROR_MESSAGES["os_open"](gtitle))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-#=======================#
-# ALIAS FILE OPERATIONS #
-#=======================#
-
-def appendAlias(cname: str, aname: str) -> bool:
-    """Add a character's alias to local files.
-    
-    Returns whether or not the file was written successfully.
-    """
-    try:
-        write_mode = "a" if os.path.exists(ALIAS_FILE) else "w"
-        with open(ALIAS_FILE, write_mode) as f:
-            csv_writer = csv.DictWriter(f, 
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            if write_mode == "w": csv_writer.writeheader()
-            csv_writer.writerow(dict(zip(ALIAS_HEADER, (cname, aname))))
-        return True
-    except OSError as e:
-        print(ERROR_MESSAGES["os_open"](ALIAS_FILE))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def removeAlias(aname: str) -> bool:
-    """Remove a character's alias from local files.
-    
-    Returns whether or not the item was removed from files successfully.
-    """
-    try:
-        if not os.path.exists(ALIAS_FILE): 
-            return True     # If the file doesn't exist, there's nothing to remove! True by default
-        with open(ALIAS_FILE, "r") as f_in, open(TEMP_FILE, "w+") as f_out:
-            # Set up reader and writer
-            csv_reader = csv.DictReader(f_in, 
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            csv_writer = csv.DictWriter(f_out,
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            # Iterate, only writing the line if it isn't the one we want to remove
-            for row in csv_reader:
-                if row[ALIAS_HEADER[1]] != aname:
-                    csv_writer.writerow(row)
-        os.rename(TEMP_FILE, ALIAS_FILE)    # temp file is now our new alias.csv
-        return True
-    except OSError as e:
-        print(ERROR_MESSAGES["os_open"](ALIAS_FILE))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def updateAliasCname(old_cname: str, new_cname: str) -> bool:
-    """Update a character's name in local csv files.
-    
-    Returns whether or not the item was updated from files successfully.
-    """
-    try:
-        if not os.path.exists(ALIAS_FILE): 
-            return True     # If the file doesn't exist, there's nothing to remove! True by default
-        with open(ALIAS_FILE, "r") as f_in, open(TEMP_FILE, "w+") as f_out:
-            # Set up reader and writer
-            csv_reader = csv.DictReader(f_in, 
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            csv_writer = csv.DictWriter(f_out,
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            # Iterate, only rewriting the line we want to change
-            for row in csv_reader:
-                if row[ALIAS_HEADER[0]] != old_cname:
-                    csv_writer.writerow(row)
-                else:
-                    row[ALIAS_HEADER[0]] = new_cname
-                    csv_writer.writerow(row)
-        os.rename(TEMP_FILE, ALIAS_FILE)    # temp file is now our new alias.csv
-        return True
-    except OSError as e:
-        print(ERROR_MESSAGES["os_open"](ALIAS_FILE))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def updateAlias(old_aname: str, new_aname: str) -> bool:
-    """Update a character's alias from local files.
-    
-    Returns whether or not the item was updated from files successfully.
-    """
-    try:
-        if not os.path.exists(ALIAS_FILE): 
-            return True     # If the file doesn't exist, there's nothing to remove! True by default
-        with open(ALIAS_FILE, "r") as f_in, open(TEMP_FILE, "w+") as f_out:
-            # Set up reader and writer
-            csv_reader = csv.DictReader(f_in, 
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            csv_writer = csv.DictWriter(f_out,
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            # Iterate, only rewriting the line we want to change
-            for row in csv_reader:
-                if row[ALIAS_HEADER[1]] != old_aname:
-                    csv_writer.writerow(row)
-                else:
-                    row[ALIAS_HEADER[1]] = new_aname
-                    csv_writer.writerow(row)
-        os.rename(TEMP_FILE, ALIAS_FILE)    # temp file is now our new alias.csv
-        return True
-    except OSError as e:
-        print(ERROR_MESSAGES["os_open"](ALIAS_FILE))
-        return False
-    except Exception as e:
-        print(ERROR_MESSAGES["default"](e))
-        return False
-
-def parseAliases() -> Optional[List[Dict[str, str]]]:
-    """Return a dictionary mapping all alias tables.
-    
-    The resulting dictionary has multiple dictionaries mapping cname and
-    aname. If any errors occur, None is returned.
-    """
-    try:
-        with open(ALIAS_FILE, "r") as f:
-            csv_reader = csv.DictReader(f,
-                fieldnames=ALIAS_HEADER,
-                delimiter=CSV_PROPERTIES["delimiter"],
-                quotechar=CSV_PROPERTIES["quotechar"],
-                quoting=CSV_PROPERTIES["quoting"]
-            )
-            result: List[Dict[str, str]] = []
-            for row in csv_reader:
-                result.append(row)
-        return result
-    except Exception as e:
-        print(ERROR_MESSAGES["os_open"](ALIAS_FILE))
-        return None
+"""Encapsulation of operations to occur on local files.
+
+All methods within this module serve the purpose of interacting with
+local files, allowing changes made to the database to be accurately
+reflected in local text files.
+
+The files that can be changed include the following:
+    The `.txt` files holding all information about games and characters.
+    The `.csv` file holding all information about character aliases.
+
+Changes are not written to those files straight away. Each one is instead
+appended to a change log (`CHANGE_LOG`), which is compacted into the files
+once it grows past `COMPACT_THRESHOLD` changes (in a background thread),
+before the files are read, and when the program exits. Compacting rewrites
+each file that was changed only once, however many changes it received.
+
+Aliases are also held in an `AliasIndex`, which is read from the alias
+file the first time it is needed and kept up to date by every alias
+change, so that looking up (or changing) an alias never scans the file.
+"""
+
+import atexit
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, List, Tuple
+
+import csv
+
+from classes.nodes import GameCharacter
+from ryu.config import GAMES_PATH, TABLES_PATH, validDate
+
+
+ALIAS_FILE = f"{TABLES_PATH}/alias.csv"
+TEMP_FILE = f"{TABLES_PATH}/temp.csv"
+CHANGE_LOG = f"{TABLES_PATH}/changes.log"
+SNAPSHOT_FILE = f"{TABLES_PATH}/ryu_number.snapshot"
+ALIAS_HEADER = ["cname", "aname"]
+CSV_PROPERTIES = {
+    "delimiter": ",",
+    "quotechar": ":",
+    "quoting": csv.QUOTE_MINIMAL
+}
+
+ERROR_MESSAGES = {
+    "default":      lambda e: f"ERROR: {e}",
+    "os_open":      lambda f: f"Could not open file: {f}",
+    "os_make":      lambda f: f"Could not create file: {f}",
+    "os_nopath":    lambda f: f"Path to {f} does not exist",
+    "bad_date":     lambda d: f"Invalid release date: {d}",
+    "duplicate":    lambda c: f"Duplicate character: {c}"
+}
+
+PARSE_WORKERS = 1       # How many processes to parse game files with (raise this for large corpora)
+PARSE_CHUNK_SIZE = 64   # How many files to hand each worker process at a time
+COMPACT_THRESHOLD = 256 # How many changes to log before compacting them in the background
+
+# Kinds of changes held in the change log
+WRITE_GAME          = "write_game"
+APPEND_CHARACTERS   = "append_characters"
+REMOVE_CHARACTER    = "remove_character"
+RENAME_CHARACTER    = "rename_character"
+REMOVE_GAME         = "remove_game"
+RENAME_GAME         = "rename_game"
+SET_RELEASE_DATE    = "set_release_date"
+APPEND_ALIASES      = "append_aliases"
+REMOVE_ALIAS        = "remove_alias"
+RENAME_ALIAS        = "rename_alias"
+RENAME_ALIAS_CNAME  = "rename_alias_cname"
+
+_log_lock = threading.RLock()
+_logged = 0                             # How many changes have been logged since the last compaction
+_pending_games: Dict[str, bool] = {}    # Whether each game changed by the log will have a file once compacted
+_compactor: Optional[threading.Thread] = None
+_alias_index: Optional["AliasIndex"] = None
+
+
+class GameRecord(NamedTuple):
+    """A game as parsed from its local text file.
+
+    Attributes
+    ----------
+    title: str
+        The title of the game, taken from the file's name.
+    release_date: str | None
+        The game's release date in YYYY-MM-DD format, or None if the file's
+        first line is not a valid date.
+    characters: List[str]
+        The names of every character in the game, in file order, without
+        blank lines or duplicates.
+    problems: List[str]
+        Descriptions of anything that had to be corrected while parsing.
+    """
+    title: str
+    release_date: Optional[str]
+    characters: List[str]
+    problems: List[str]
+
+
+class AliasIndex:
+    """An in-memory index of aliases, mapping each alias to its character and back.
+
+    Every alias belongs to exactly one character, so adding an alias that
+    already belongs to someone else moves it to the new character.
+
+    Attributes
+    ----------
+    characters: Dict[str, str]
+        The name of the character each alias belongs to.
+    aliases: Dict[str, Dict[str, None]]
+        The aliases of each character, in the order they were added. (The
+        dictionaries are used as ordered sets, so their values are unused)
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str]]=()) -> None:
+        self.characters: Dict[str, str] = {}
+        self.aliases: Dict[str, Dict[str, None]] = {}
+        for cname, aname in rows:
+            self.add(cname, aname)
+
+    def __len__(self) -> int:
+        return len(self.characters)
+
+    def add(self, cname: str, aname: str) -> None:
+        """Give a character an alias."""
+        self.remove(aname)
+        self.characters[aname] = cname
+        self.aliases.setdefault(cname, {})[aname] = None
+
+    def remove(self, aname: str) -> bool:
+        """Remove an alias, returning whether or not it existed."""
+        cname = self.characters.pop(aname, None)
+        if cname is None:
+            return False
+        del self.aliases[cname][aname]
+        if not self.aliases[cname]:
+            del self.aliases[cname]
+        return True
+
+    def rename(self, old_aname: str, new_aname: str) -> bool:
+        """Rename an alias, returning whether or not it existed."""
+        cname = self.characters.get(old_aname)
+        if cname is None:
+            return False
+        self.remove(old_aname)
+        self.add(cname, new_aname)
+        return True
+
+    def renameCharacter(self, old_cname: str, new_cname: str) -> bool:
+        """Move every alias of a character to a new name, returning whether or not there were any."""
+        moved = self.aliases.pop(old_cname, None)
+        if not moved:
+            return False
+        target = self.aliases.setdefault(new_cname, {})
+        for aname in moved:
+            self.characters[aname] = new_cname
+            target[aname] = None
+        return True
+
+    def characterOf(self, aname: str) -> Optional[str]:
+        """Return the name of the character with an alias, or None if nobody has it."""
+        return self.characters.get(aname)
+
+    def aliasesOf(self, cname: str) -> List[str]:
+        """Return every alias of a character."""
+        return list(self.aliases.get(cname, ()))
+
+    def pairs(self) -> List[Tuple[str, str]]:
+        """Return every alias as a `(cname, aname)` tuple."""
+        return [(cname, aname) for aname, cname in self.characters.items()]
+
+
+#============#
+# CHANGE LOG #
+#============#
+
+def _logChange(kind: str, *args) -> None:
+    """Append a change to the change log, compacting the log in the background once it is long enough.
+
+    Any errors writing to the log are raised to the caller.
+    """
+    global _logged, _compactor
+    with _log_lock:
+        with open(CHANGE_LOG, "a") as f:
+            f.write("%s\n" % json.dumps([kind, *args]))
+        _logged += 1
+        if _logged >= COMPACT_THRESHOLD and (_compactor is None or not _compactor.is_alive()):
+            _compactor = threading.Thread(target=compact, daemon=True)
+            _compactor.start()
+
+def _gameExists(gtitle: str) -> bool:
+    """Return whether a game will have a text file once the change log is compacted."""
+    with _log_lock:
+        if _logged == 0:
+            compact()   # Anything left in the log was written by an earlier run
+        if gtitle in _pending_games:
+            return _pending_games[gtitle]
+        return os.path.exists("%s/%s.txt" % (GAMES_PATH, gtitle))
+
+def _readChanges() -> List[list]:
+    """Return every change in the change log, in the order they were made."""
+    changes: List[list] = []
+    with open(CHANGE_LOG, "r") as f:
+        for line in f:
+            try:
+                changes.append(json.loads(line))
+            except ValueError:
+                continue    # Only a write cut short by a crash can be malformed
+    return changes
+
+def _readGameLines(gtitle: str) -> Optional[List[str]]:
+    """Return a game file's release date followed by its characters, or None if there is no file."""
+    path = "%s/%s.txt" % (GAMES_PATH, gtitle)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        lines = [line.rstrip("\r\n") for line in f]
+    return (lines[:1] or [""]) + [line for line in lines[1:] if line]
+
+def _readAliasRows() -> List[List[str]]:
+    """Return every row of the alias file, header included."""
+    if not os.path.exists(ALIAS_FILE):
+        return [list(ALIAS_HEADER)]
+    with open(ALIAS_FILE, "r") as f:
+        return list(csv.reader(f,
+            delimiter=CSV_PROPERTIES["delimiter"],
+            quotechar=CSV_PROPERTIES["quotechar"],
+            quoting=CSV_PROPERTIES["quoting"]
+        ))
+
+def _readAliasIndex() -> AliasIndex:
+    """Return an `AliasIndex` of every row of the alias file."""
+    rows = _readAliasRows()
+    if rows[:1] == [ALIAS_HEADER]:
+        rows = rows[1:]
+    return AliasIndex((row[0], row[1]) for row in rows if len(row) > 1)
+
+def _applyChanges(changes: List[list]) -> None:
+    """Apply logged changes to the local files, rewriting each file that changed only once.
+
+    Every file a change touches is read into memory the first time it is
+    needed, all of the changes are applied there, and only then is each file
+    written back (or removed). Changes are applied such that replaying a log
+    that was already partly applied does not corrupt anything: aliases are
+    applied through an `AliasIndex`, so each alias is only ever written once,
+    for the last character it was given to.
+    """
+    games: Dict[str, Optional[List[str]]] = {}  # title -> [release date, *characters], or None for no file
+    aliases: Optional[AliasIndex] = None
+
+    def game(gtitle: str) -> Optional[List[str]]:
+        if gtitle not in games:
+            games[gtitle] = _readGameLines(gtitle)
+        return games[gtitle]
+
+    for kind, *args in changes:
+        if kind == WRITE_GAME:
+            gtitle, release_date, characters = args
+            games[gtitle] = [release_date, *characters]
+        elif kind == APPEND_CHARACTERS:
+            gtitle, characters = args
+            lines = game(gtitle)
+            if lines is None:
+                lines = games[gtitle] = [""]
+            lines.extend(c for c in characters if c not in lines[1:])
+        elif kind == REMOVE_CHARACTER:
+            cname, gtitle = args
+            lines = game(gtitle)
+            if lines is not None:
+                lines[1:] = [c for c in lines[1:] if c != cname]
+        elif kind == RENAME_CHARACTER:
+            old_cname, new_cname, gtitles = args
+            for gtitle in gtitles:
+                lines = game(gtitle)
+                if lines is not None:
+                    lines[1:] = [new_cname if c == old_cname else c for c in lines[1:]]
+        elif kind == REMOVE_GAME:
+            games[args[0]] = None
+        elif kind == RENAME_GAME:
+            old_title, new_title = args
+            lines = game(old_title)
+            if lines is not None:
+                games[new_title] = lines
+                games[old_title] = None
+        elif kind == SET_RELEASE_DATE:
+            gtitle, release_date = args
+            lines = game(gtitle)
+            if lines is not None:
+                lines[0] = release_date
+        else:
+            if aliases is None:
+                aliases = _readAliasIndex()
+            if kind == APPEND_ALIASES:
+                for cname, aname in args[0]:
+                    aliases.add(cname, aname)
+            elif kind == REMOVE_ALIAS:
+                aliases.remove(args[0])
+            elif kind == RENAME_ALIAS:
+                aliases.rename(args[0], args[1])
+            elif kind == RENAME_ALIAS_CNAME:
+                aliases.renameCharacter(args[0], args[1])
+
+    for gtitle, lines in games.items():
+        path = "%s/%s.txt" % (GAMES_PATH, gtitle)
+        if lines is None:
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        with open("%s.tmp" % path, "w") as f:
+            f.write("\n".join(lines))
+        os.replace("%s.tmp" % path, path)
+    if aliases is not None:
+        with open(TEMP_FILE, "w") as f:
+            csv.writer(f,
+                delimiter=CSV_PROPERTIES["delimiter"],
+                quotechar=CSV_PROPERTIES["quotechar"],
+                quoting=CSV_PROPERTIES["quoting"]
+            ).writerows([ALIAS_HEADER, *aliases.pairs()])
+        os.replace(TEMP_FILE, ALIAS_FILE)   # temp file is now our new alias.csv
+
+def compact() -> bool:
+    """Apply every change in the change log to the local files, then clear the log.
+
+    This happens on its own in a background thread once `COMPACT_THRESHOLD`
+    changes have been logged, whenever the local files are read through this
+    module, and when the program exits. It only needs calling directly
+    before reading the files some other way.
+
+    Returns whether or not the log was compacted successfully.
+    """
+    global _logged
+    with _log_lock:
+        try:
+            if not os.path.exists(CHANGE_LOG):
+                return True
+            _applyChanges(_readChanges())
+            os.remove(CHANGE_LOG)
+            _logged = 0
+            _pending_games.clear()
+            return True
+        except Exception as e:
+            print(ERROR_MESSAGES["default"](e))
+            return False
+
+atexit.register(compact)
+
+#======================#
+# GAME FILE OPERATIONS #
+#======================#
+
+def readGameFile(filename: str) -> GameRecord:
+    """Parse a game's text file into a `GameRecord`.
+
+    The file is read one line at a time. A release date that is not in
+    YYYY-MM-DD format is dropped, and blank lines and repeated character
+    names are skipped; each of these is noted in the record's `problems`.
+    Any errors opening or reading the file are raised to the caller.
+    """
+    problems: List[str] = []
+    characters: List[str] = []
+    seen = set()
+    with open("%s/%s" % (GAMES_PATH, filename), "r") as f:
+        release_date: Optional[str] = f.readline().strip()
+        if not validDate(release_date):
+            problems.append(ERROR_MESSAGES["bad_date"](release_date))
+            release_date = None
+        for line in f:
+            cname = line.rstrip("\r\n")
+            if not cname:
+                continue
+            if cname in seen:
+                problems.append(ERROR_MESSAGES["duplicate"](cname))
+                continue
+            seen.add(cname)
+            characters.append(cname)
+    return GameRecord(filename[:-4], release_date, characters, problems)
+
+def _readGameFileSafely(filename: str) -> Tuple[str, Optional[GameRecord], Optional[str]]:
+    """Return `(filename, record, None)`, or `(filename, None, error)` if the file can't be parsed.
+
+    Exceptions are turned into messages here so that they can be sent back
+    from worker processes without stopping the rest of the run.
+    """
+    try:
+        return filename, readGameFile(filename), None
+    except OSError:
+        return filename, None, ERROR_MESSAGES["os_open"](filename)
+    except Exception as e:
+        return filename, None, ERROR_MESSAGES["default"](e)
+
+def _printProblem(filename: str, message: str) -> None:
+    """The default way of reporting a problem found while streaming game files."""
+    print(f"{filename}: {message}")
+
+def streamGameFiles(filenames: Optional[Iterable[str]]=None, workers: Optional[int]=None, onProblem: Callable[[str, str], None]=_printProblem) -> Iterator[GameRecord]:
+    """Yield a `GameRecord` for every game file, one at a time.
+
+    Parameters
+    ----------
+    filenames: Iterable[str] | None
+        The names of the files in `config.GAMES_PATH` to parse. (Default is every
+        `.txt` file in the folder, which are listed lazily)
+    workers: int | None
+        How many processes to parse files with. With more than one, files are
+        handed out to a process pool `PARSE_CHUNK_SIZE` at a time, and records
+        are still yielded in the order of `filenames`. (Default is
+        `PARSE_WORKERS`)
+    onProblem: Callable[[str, str], None]
+        Called with a file's name and a message for every problem found. Files
+        that cannot be parsed at all are reported and skipped, and the rest of
+        the files are still parsed. (Default prints the problem)
+    """
+    if workers is None:
+        workers = PARSE_WORKERS
+    compact()
+    if filenames is None:
+        filenames = (entry.name for entry in os.scandir(GAMES_PATH) if entry.name.endswith(".txt"))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from _reportProblems(executor.map(_readGameFileSafely, filenames, chunksize=PARSE_CHUNK_SIZE), onProblem)
+    else:
+        yield from _reportProblems(map(_readGameFileSafely, filenames), onProblem)
+
+def _reportProblems(results: Iterable[Tuple[str, Optional[GameRecord], Optional[str]]], onProblem: Callable[[str, str], None]) -> Iterator[GameRecord]:
+    """Report the problems of parsed files, and yield every record that was parsed."""
+    for filename, record, error in results:
+        if record is None:
+            onProblem(filename, error)
+            continue
+        for problem in record.problems:
+            onProblem(filename, problem)
+        yield record
+
+def parseGameFile(filename: str) -> Optional[Dict[str, tuple]]:
+    """Parse a game's text file and return its dictionary representation.
+    
+    Since every file is saved in an identical format, parsing each file is
+    repetitive and can be done in a similar fashion for each text file.
+
+    Return
+    ------
+    Dict[str, tuple] | None
+        A dictionary representation of the game. Specifically, with keys "game"
+        and "GameCharacters", which relate to a tuple (title, release_date)
+        and list of names respectively. If any errors occur, None is returned.
+    """
+    compact()
+    _, record, error = _readGameFileSafely(filename)
+    if record is None:
+        print(error)
+        return None
+    return {"game": (record.title, record.release_date), "game_characters": record.characters}
+
+def getGameFiles() -> List[str]:
+    """Return an array containing the names of all files in `config.GAMES_PATH`."""
+    compact()
+    return os.listdir(GAMES_PATH)
+
+def writeGameFile(gtitle: str, release_date: str, characters: List[str]) -> bool:
+    """Create a file for a game according to the database format.
+    
+    The file is created such that the filename is `gtitle`.txt, the first
+    line is the game's release date, and each subsequent line is a character
+    name, which can be found in the `characters` list. 
+
+    Returns whether or not the file was created successfully.
+    """
+    try:
+        with _log_lock:
+            _logChange(WRITE_GAME, gtitle, release_date, list(characters))
+            _pending_games[gtitle] = True
+        return True
+    except OSError:
+        print(ERROR_MESSAGES["os_make"](gtitle))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def appendGameFile(gtitle: str, characters: List[str]) -> bool:
+    """Add characters to the end of a game's text file.
+    
+    The title of the game is passed, and any additional characters are
+    passed in the `characters` list. This method does not check for
+    duplicate entries, so it is up to the caller to ensure this method does
+    not allow for duplicate entries, which may lead to unintended side-
+    effects.
+
+    Returns whether or not the characters were appended to the file
+    successfully.
+    """
+    try:
+        with _log_lock:
+            _logChange(APPEND_CHARACTERS, gtitle, list(characters))
+            _pending_games[gtitle] = True
+        return True
+    except OSError:
+        print(ERROR_MESSAGES["os_open"](gtitle))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def removeCharacterFromGame(cname: str, gtitle: str) -> bool:
+    """Remove a character's name from a game's text file.
+    
+    Returns whether or not the character's name was removed successfully.
+    """
+    try:
+        _logChange(REMOVE_CHARACTER, cname, gtitle)
+        return True
+    except OSError:
+        print(ERROR_MESSAGES["os_open"](gtitle))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def removeGame(gtitle: str) -> bool:
+    """Remove a game's text file from the local files.
+    
+    Returns whether or not the file was removed successfully.
+    """
+    try:
+        with _log_lock:
+            if not _gameExists(gtitle):
+                raise OSError()
+            _logChange(REMOVE_GAME, gtitle)
+            _pending_games[gtitle] = False
+        return True
+    except OSError:
+        print(ERROR_MESSAGES["os_nopath"](gtitle))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def updateCharacterName(c: GameCharacter, new_name: str) -> bool:
+    """Update a character's name in all games for which they appear.
+    
+    Returns whether or not the character's name was updated in all games.
+    """
+    try:
+        _logChange(RENAME_CHARACTER, c.name, new_name, list(c.appears_in))
+        if updateAliasCname(c.name, new_name):
+            return True
+        return False
+    except OSError:
+        print(ERROR_MESSAGES["os_open"](CHANGE_LOG))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def updateGameTitle(old_title: str, new_title: str) -> bool:
+    """Update the title of a game's text file locally.
+    
+    Returns whether or not the game's title was updated successfully.
+    """
+    try:
+        with _log_lock:
+            if not _gameExists(old_title):
+                raise OSError()
+            _logChange(RENAME_GAME, old_title, new_title)
+            _pending_games[old_title] = False
+            _pending_games[new_title] = True
+        return True
+    except OSError:
+        print(ERROR_MESSAGES["os_nopath"](old_title))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def updateGameReleaseDate(gtitle: str, new_release_date: str) -> bool:
+    """Update the release date of a game's local text file.
+    
+    Returns whether or not the game's release date was updated
+    successfully.
+    """
+    try:
+        with _log_lock:
+            if not _gameExists(gtitle):
+                raise OSError()
+            _logChange(SET_RELEASE_DATE, gtitle, new_release_date)
+        return True
+    except OSError:
+        print(ERROR_MESSAGES["os_open"](gtitle))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+#=======================#
+# ALIAS FILE OPERATIONS #
+#=======================#
+
+def _aliasIndex() -> AliasIndex:
+    """Return the alias index, reading it from the alias file the first time.
+
+    Any errors reading the file are raised to the caller.
+    """
+    global _alias_index
+    with _log_lock:
+        if _alias_index is None:
+            compact()
+            _alias_index = _readAliasIndex()
+        return _alias_index
+
+def getAliasIndex() -> Optional[AliasIndex]:
+    """Return an index of every alias held in local files.
+
+    The index is read from the alias file once, and every change made through
+    this module afterwards is applied to it as well, so it should be treated
+    as read-only. If any errors occur, None is returned.
+    """
+    try:
+        return _aliasIndex()
+    except Exception as e:
+        print(ERROR_MESSAGES["os_open"](ALIAS_FILE))
+        return None
+
+def appendAlias(cname: str, aname: str) -> bool:
+    """Add a character's alias to local files.
+    
+    Returns whether or not the file was written successfully.
+    """
+    return appendAliases([(cname, aname)])
+
+def appendAliases(aliases: Iterable[Tuple[str, str]]) -> bool:
+    """Add many aliases to local files at once, as `(cname, aname)` tuples.
+
+    This logs a single change however many aliases are given, so bulk
+    imports should prefer it to calling `appendAlias()` once per alias.
+
+    Returns whether or not the aliases were written successfully.
+    """
+    try:
+        aliases = list(aliases)
+        with _log_lock:
+            index = _aliasIndex()
+            _logChange(APPEND_ALIASES, [[cname, aname] for cname, aname in aliases])
+            for cname, aname in aliases:
+                index.add(cname, aname)
+        return True
+    except OSError as e:
+        print(ERROR_MESSAGES["os_open"](CHANGE_LOG))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def removeAlias(aname: str) -> bool:
+    """Remove a character's alias from local files.
+    
+    Returns whether or not the item was removed from files successfully.
+    """
+    try:
+        with _log_lock:
+            index = _aliasIndex()
+            if index.characterOf(aname) is None:
+                return True     # If nobody has the alias, there's nothing to remove! True by default
+            _logChange(REMOVE_ALIAS, aname)
+            index.remove(aname)
+        return True
+    except OSError as e:
+        print(ERROR_MESSAGES["os_open"](CHANGE_LOG))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def updateAliasCname(old_cname: str, new_cname: str) -> bool:
+    """Update a character's name in local csv files.
+    
+    Returns whether or not the item was updated from files successfully.
+    """
+    try:
+        with _log_lock:
+            index = _aliasIndex()
+            if not index.aliasesOf(old_cname):
+                return True     # If the character has no aliases, there's nothing to update! True by default
+            _logChange(RENAME_ALIAS_CNAME, old_cname, new_cname)
+            index.renameCharacter(old_cname, new_cname)
+        return True
+    except OSError as e:
+        print(ERROR_MESSAGES["os_open"](CHANGE_LOG))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def updateAlias(old_aname: str, new_aname: str) -> bool:
+    """Update a character's alias from local files.
+    
+    Returns whether or not the item was updated from files successfully.
+    """
+    try:
+        with _log_lock:
+            index = _aliasIndex()
+            if index.characterOf(old_aname) is None:
+                return True     # If nobody has the alias, there's nothing to update! True by default
+            _logChange(RENAME_ALIAS, old_aname, new_aname)
+            index.rename(old_aname, new_aname)
+        return True
+    except OSError as e:
+        print(ERROR_MESSAGES["os_open"](CHANGE_LOG))
+        return False
+    except Exception as e:
+        print(ERROR_MESSAGES["default"](e))
+        return False
+
+def parseAliases() -> Optional[List[Dict[str, str]]]:
+    """Return a dictionary mapping all alias tables.
+    
+    The resulting dictionary has multiple dictionaries mapping cname and
+    aname, read from the alias index. If any errors occur, None is returned.
+    """
+    index = getAliasIndex()
+    if index is None:
+        return None
+    return [dict(zip(ALIAS_HEADER, pair)) for pair in index.pairs()]
@@ -0,0 +1,331 @@
+"""Class for finding and ranking names that resemble a search.
+
+Searches for characters (by name or alias) and games match anything that
+contains the search, and rank the matches in tiers of how closely they
+match. The tiers are decided in Python, so that the database (or an
+in-memory index) only has to find the candidates.
+
+Fuzzy searches instead match names whose words are each within a small
+edit distance of a word of the search, so that misspelled searches still
+find something.
+
+Names are compared after being case-folded and having their accents
+removed, much like the database's default collation does.
+
+Classes
+-------
+NameIndex
+    An n-gram inverted index of names, for finding every name that contains
+    a search.
+FuzzyIndex
+    A deletion index of the words of names, for finding the names closest to
+    a misspelled search.
+"""
+
+import heapq
+import re
+import unicodedata
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+
+NGRAM_SIZE = 3      # The longest n-grams held by a NameIndex
+FUZZY_PREFIX = 7    # How many letters of each word a FuzzyIndex indexes deletions of
+FUZZY_LIMIT = 20    # The most results a fuzzy search will return
+
+K = TypeVar('K')
+
+
+def fold(s: str) -> str:
+    """Return a string case-folded and without accents, for comparing names."""
+    return "".join(c for c in unicodedata.normalize("NFKD", s.casefold()) if not unicodedata.combining(c))
+
+def wordsOf(s: str) -> List[str]:
+    """Return the words of a string after `fold()`, ignoring any punctuation between them."""
+    return re.findall(r"\w+", fold(s))
+
+def likeTier(candidate: str, search: str) -> Optional[int]:
+    """Return how closely a name matches a search.
+
+    Lower is closer, and None means the name does not contain the search at
+    all. The tiers are (in order): an exact match, a match followed by a
+    bracketed series, the first word, the last word, a middle word, the
+    start of the name, the start of any word, and finally any substring.
+    Both strings are expected to have already been passed through `fold()`.
+    """
+    if candidate == search: return 0
+    if candidate.startswith(search + " (") and candidate.endswith(")"): return 1
+    if candidate.startswith(search + " "): return 2
+    if candidate.endswith(" " + search): return 3
+    if f" {search} " in candidate: return 4
+    if candidate.startswith(search): return 5
+    if f" {search}" in candidate: return 6
+    if search in candidate: return 7
+    return None
+
+def maxEditDistance(word: str) -> int:
+    """Return how many typos are tolerated in a word of a fuzzy search, based on its length."""
+    if len(word) <= 2: return 0
+    if len(word) <= 5: return 1
+    return 2
+
+def editDistance(a: str, b: str, limit: int) -> Optional[int]:
+    """Return the number of edits between two strings, or None if it is more than `limit`.
+
+    An edit is inserting, removing, or replacing a letter, or swapping two
+    adjacent letters (the optimal string alignment distance). Since close
+    words mostly differ in one spot, the letters they start and end with in
+    common are skipped before comparing the rest.
+    """
+    if abs(len(a) - len(b)) > limit: return None
+    if a == b: return 0
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if not a or not b: return max(len(a), len(b))
+    before: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], before[j - 2] + 1)
+        if min(cur) > limit: return None
+        before, prev = prev, cur
+    return prev[-1] if prev[-1] <= limit else None
+
+def deletions(word: str, distance: int) -> Set[str]:
+    """Return the word and every string made by removing up to `distance` of its letters."""
+    found = {word}
+    edge = {word}
+    for _ in range(distance):
+        edge = {w[:i] + w[i + 1:] for w in edge for i in range(len(w))} - found
+        found |= edge
+    return found
+
+def rankByTier(matches: Iterable[Tuple[str, K]], search: str, limit: Optional[int]=None) -> List[K]:
+    """Rank the keys of names that resemble a search, from closest to furthest.
+
+    Parameters
+    ----------
+    matches: Iterable[Tuple[str, K]]
+        Candidate `(name, key)` pairs, where several names (such as a
+        character's name and aliases) may share a key. Names that don't
+        contain the search are ignored.
+    search: str
+        What was searched for.
+    limit: int | None
+        The most keys to return. (Default is None, which returns them all)
+
+    Returns
+    -------
+    List[K]
+        Each matching key once, ordered by the closest tier of any of its
+        names, then by the key itself.
+    """
+    search = fold(search)
+    tiers: Dict[K, int] = {}
+    for name, key in matches:
+        tier = likeTier(fold(name), search)
+        if tier is not None and tier < tiers.get(key, tier + 1):
+            tiers[key] = tier
+    ranked = sorted(tiers, key=lambda k: (tiers[k], k))
+    return ranked if limit is None else ranked[:limit]
+
+
+class NameIndex(Generic[K]):
+    """An n-gram inverted index of names, for finding every name that contains a search.
+
+    Every substring of up to `NGRAM_SIZE` characters of each name is mapped to
+    the names it appears in. A search only looks at the names that contain
+    every n-gram of the search, rather than at every name.
+    """
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._keys: List[K] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, key: K) -> None:
+        """Add a name to the index, which will be found as the given key."""
+        i = len(self._names)
+        self._names.append(name)
+        self._keys.append(key)
+        folded = fold(name)
+        for n in range(1, NGRAM_SIZE + 1):
+            for j in range(len(folded) - n + 1):
+                self._postings.setdefault(folded[j:j + n], set()).add(i)
+
+    def candidates(self, search: str) -> List[Tuple[str, K]]:
+        """Return `(name, key)` for every name that contains the search."""
+        search = fold(search)
+        if not search:
+            return []
+        n = min(len(search), NGRAM_SIZE)
+        postings = []
+        for gram in {search[j:j + n] for j in range(len(search) - n + 1)}:
+            if gram not in self._postings:
+                return []
+            postings.append(self._postings[gram])
+        postings.sort(key=len)
+        found = set(postings[0]).intersection(*postings[1:])
+        return [(self._names[i], self._keys[i]) for i in found if search in fold(self._names[i])]
+
+    def search(self, search: str, limit: Optional[int]=None) -> List[K]:
+        """Return the keys of every name that contains the search, ranked by `rankByTier()`."""
+        return rankByTier(self.candidates(search), search, limit)
+
+
+class FuzzyIndex(Generic[K]):
+    """A deletion index of the words of names, for finding the names closest to a misspelled search.
+
+    This follows the approach of SymSpell: every string made by removing up
+    to two letters from (the first `FUZZY_PREFIX` letters of) each word is
+    mapped to the words it came from. Removing letters from a word of the
+    search then finds every indexed word within that many edits of it,
+    without comparing the search to every word. The index only grows with
+    the number of distinct words, rather than with the number of names.
+    """
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._keys: List[K] = []
+        self._nameWords: List[Tuple[str, ...]] = []     # The folded words of each name
+        self._words: Dict[str, List[int]] = {}          # word -> names it appears in
+        self._deletions: Dict[str, List[str]] = {}      # deletion -> words it came from
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, key: K) -> None:
+        """Add a name to the index, which will be found as the given key."""
+        i = len(self._names)
+        words = tuple(wordsOf(name))
+        self._names.append(name)
+        self._keys.append(key)
+        self._nameWords.append(words)
+        for word in set(words):
+            if word not in self._words:
+                self._words[word] = []
+                for d in deletions(word[:FUZZY_PREFIX], maxEditDistance(word)):
+                    self._deletions.setdefault(d, []).append(word)
+            self._words[word].append(i)
+
+    def closeWords(self, word: str, radius: int=2) -> Dict[str, int]:
+        """Return every indexed word within `maxEditDistance()` (and `radius`) edits of a word.
+
+        Each word found is mapped to its distance from the passed word.
+        """
+        limit = min(radius, maxEditDistance(word))
+        candidates = set()
+        for d in deletions(word[:FUZZY_PREFIX], limit):
+            candidates.update(self._deletions.get(d, ()))
+        found: Dict[str, int] = {}
+        for candidate in candidates:
+            distance = editDistance(word, candidate, min(limit, maxEditDistance(candidate)))
+            if distance is not None:
+                found[candidate] = distance
+        return found
+
+    def _closeWords(self, word: str, radius: int, cache: Dict[Tuple[str, int], Dict[str, int]]) -> Dict[str, int]:
+        """Return `closeWords()`, reusing the results of earlier calls with the same cache."""
+        radius = min(radius, maxEditDistance(word))
+        if (word, radius) not in cache:
+            cache[(word, radius)] = self.closeWords(word, radius)
+        return cache[(word, radius)]
+
+    def _splitWord(self, word: str, radius: int, cache: Dict[Tuple[str, int], Dict[str, int]]) -> Optional[List[Dict[str, int]]]:
+        """Return the close words of both halves of a word that was missing a space.
+
+        Of every way to split the word in two, the one whose halves are
+        closest to indexed words is used, or None if no split works.
+        """
+        best: Optional[Tuple[int, List[Dict[str, int]]]] = None
+        for j in range(1, len(word)):
+            halves = [self._closeWords(word[:j], radius, cache), self._closeWords(word[j:], radius, cache)]
+            if halves[0] and halves[1]:
+                cost = min(halves[0].values()) + min(halves[1].values())
+                if best is None or cost < best[0]:
+                    best = (cost, halves)
+        return best[1] if best else None
+
+    def _search(self, words: List[str], radius: int, limit: Optional[int],
+                cache: Dict[Tuple[str, int], Dict[str, int]]) -> Dict[K, Tuple[int, int]]:
+        """Return the rank of the keys whose names match the words within `radius` edits each.
+
+        Names are gathered from the rarest word of the search, from its closest
+        words to its furthest. Once `limit` keys are certain to rank above
+        anything further away, the rest are skipped.
+        """
+        penalty = 0
+        matchers: List[Dict[str, int]] = []
+        for word in words:
+            close = self._closeWords(word, radius, cache)
+            if close:
+                matchers.append(close)
+                continue
+            halves = self._splitWord(word, radius, cache)
+            if halves is None:
+                return {}
+            matchers.extend(halves)
+            penalty += 1
+        matchers.sort(key=lambda close: sum(len(self._words[w]) for w in close))
+        first, rest = matchers[0], matchers[1:]
+        ranks: Dict[K, Tuple[int, int]] = {}
+        for distance in sorted(set(first.values())):
+            if limit is not None and sum(1 for total, _ in ranks.values() if total < distance + penalty) >= limit:
+                break
+            for close in (w for w, d in first.items() if d == distance):
+                for i in self._words[close]:
+                    total = distance + penalty
+                    for other in rest:
+                        distances = [other[w] for w in self._nameWords[i] if w in other]
+                        if not distances:
+                            break
+                        total += min(distances)
+                    else:
+                        rank = (total, len(self._nameWords[i]) - len(words))
+                        key = self._keys[i]
+                        if key not in ranks or rank < ranks[key]:
+                            ranks[key] = rank
+        return ranks
+
+    def search(self, search: str, limit: Optional[int]=FUZZY_LIMIT) -> List[K]:
+        """Return the keys of the names closest to a search.
+
+        A name matches if every word of the search is close to some word of the
+        name. Matches are ranked by their total number of edits, then by how
+        many words of the name weren't searched for, then by key.
+
+        Since most typos are a single edit, words are first only matched within
+        one edit of each other. Only if that doesn't find enough close matches
+        are the longer words matched within two.
+
+        Parameters
+        ----------
+        search: str
+            What was searched for.
+        limit: int | None
+            The most keys to return. (Default is `FUZZY_LIMIT`)
+
+        Returns
+        -------
+        List[K]
+            Each matching key once, from closest to furthest.
+        """
+        words = wordsOf(search)
+        if not words:
+            return []
+        cache: Dict[Tuple[str, int], Dict[str, int]] = {}
+        ranks = self._search(words, 1, limit, cache)
+        if limit is None or sum(1 for total, _ in ranks.values() if total <= 1) < limit:
+            if any(maxEditDistance(word) > 1 for word in words):
+                ranks = self._search(words, 2, limit, cache)
+        if limit is None:
+            return sorted(ranks, key=lambda k: (ranks[k], k))
+        return heapq.nsmallest(limit, ranks, key=lambda k: (ranks[k], k))
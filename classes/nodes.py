@@ -1,217 +1,349 @@
-"""Classes for the node objects in the database, and their related methods.
-
-These "nodes" in the database are set to represent the important tables
-of the database.
-
-Classes
--------
-Node(ABC)
-    An abstract representation of a node in the Ryu database.
-game_character(Node)
-    A class meant to represent a character table in the database.
-game(Node)
-    A class meant to represent the game table in the database.
-"""
-
-from abc import ABC, abstractmethod
-from typing import List
-
-from methods import queries
-from classes.ryu_connector import RyuConnector
-
-
-class Node(ABC):
-    """An abstract representation of a node in the Ryu database.
-    
-    This Node is meant to be inherited by `game` and `game_character` tables
-    to better represent them.
-
-    Attributes
-    ----------
-    primary_key: str
-        An attribute representing the primary key field of the table.
-    ryu_number: int
-        The Ryu Number of the table.
-    
-    Methods
-    -------
-    printSelf(self, int, bool) -> str
-        An abstract method representing printing the contents of the node. Must
-        be overridden by child classes.
-    """
-    def __init__(self, pk: str, rn: int) -> None:
-        self.primary_key = pk
-        self.ryu_number = rn
-
-    @abstractmethod
-    def printSelf(self, limit: int=-1, withRn: bool=False) -> str:
-        """Return a string representation of the node object.
-        
-        This method is intended to be overridden by child classes to better
-        suit their attributes.
-
-        Parameters
-        ----------
-        limit: int
-            The limit of how many 'multiple' results to show. 
-        withRn: bool
-            Whether or not to include the node's Ryu Number when printing.
-        """
-        pass
-
-    def getMissingData(self, rdb: RyuConnector) -> bool:
-        """Retrieve any data that may be missing to the class.
-        
-        This method is intended to connect to the database to fill in any empty
-        fields that a Node may be missing. This is intended to abstract-ify the
-        data retrieval process, putting the onus on the object itself rather 
-        than the class retrieving the object itself.
-
-        Parameters
-        ----------
-        rdb: RyuConnector.cursor
-            A cursor object opened by a RyuConnector.
-        """
-        return True
-
-
-class GameCharacter(Node):
-    """A class meant to represent a character table in the database.
-    
-    The character object has related attributes for all fields it has in the
-    database, as well as a few others.
-
-    Attributes
-    ----------
-    name: str
-        The name of the character, directly related to the `name` field in the
-        database. This also doubles as the primary_key.
-    ryu_number: int
-        The character's Ryu Number, directly related to the `ryu_number` field
-        in the database.
-    appears_in: List[str]
-        A list of the titles of games that the character appears in. This is 
-        meant to illustrate the `appears_in` table in the database.
-    aliases: List[str]
-        A list of aliases that the character is known by. This is meant to
-        illustrate the `alias` table in the database.
-    """
-    def __init__ (self, name: str, ryu_number: int, appears_in: List[str]=None, aliases: List[str]=None) -> None:
-        super().__init__(name, ryu_number)
-        self.name = self.primary_key
-        if appears_in is not None:
-            self.appears_in = appears_in
-        else:
-            self.appears_in = []
-        if aliases is not None:
-            self.aliases = aliases
-        else:
-            self.aliases = []
-
-    def __str__ (self) -> str:
-        returnStr = "(%d) %s\n" % (self.ryu_number, self.name)
-        if self.aliases:
-            returnStr += f"\t(AKA {', '.join(self.aliases)})\n"
-        for g in self.appears_in:
-            returnStr += "\t%s\n" % g
-        return returnStr
-
-    def printSelf(self, limit: int=-1, withRn: bool=False) -> str:
-        """Return a string representation of the character object.
-        
-        This method has been overridden from its abstract parent Node.
-
-        Parameters
-        ----------
-        limit: int
-            The limit of how many 'appears_in' results to show. When set to -1, all
-            values will be printed.
-        withRn: bool
-            Whether or not to include the node's Ryu Number when printing. If true,
-            the Ryu Number will appear in square braces after the character's name.
-        """
-        if limit == -1: limit = len(self.appears_in)
-        elif limit < 0: limit = 0
-        returnStr = "%s" % self.name
-        if withRn: returnStr += " [%d]" % self.ryu_number
-        if self.aliases:
-            returnStr += f"\n\t(AKA {', '.join(self.aliases)})"
-        for i in range(min(limit, len(self.appears_in))):
-            returnStr += "\n\t%s" % self.appears_in[i]
-        if limit < len(self.appears_in) and limit != 0:
-            returnStr += "\n\t... and %d more" % (len(self.appears_in) - limit)
-        elif limit == 0:
-            returnStr += "\n\t(Appears in %d game%s)" % (len(self.appears_in), "" if len(self.appears_in) == 1 else "s")
-        return returnStr
-
-    def getMissingData(self, rdb: RyuConnector) -> bool:
-        """Retrieve any data that may be missing to the class.
-        
-        This method is overridden from its parent. The character will connect 
-        to the database and fill in the missing `self.appears_in` and 
-        `self.aliases` fields.
-        
-        Parameters
-        ----------
-        rdb: RyuConnector.cursor
-            A cursor object opened by a RyuConnector.
-        """
-        try:
-            # Get appears_in relations
-            if not self.appears_in:
-                rdb.execute(queries.getGamesByCharacter(self.name))
-                mygames = rdb.fetchall()
-                for row in mygames:
-                    self.appears_in.append(row[0])
-            # Get alias relations
-            if not self.aliases:
-                rdb.execute(queries.getAliasesFromName(self.name))
-                myaliases = rdb.fetchall()
-                for row in myaliases:
-                    self.aliases.append(row[1])
-            return True
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return False
-
-
-class Game(Node):
-    """A class meant to represent the game table in the database.
-    
-    The game object has related attributes for all fields it has in the
-    database.
-
-    Attributes
-    ----------
-    title: str
-        The title of the game, directly related to the `title` field in the
-        database. This also doubles as the primary_key.
-    ryu_number: int
-        The game's Ryu Number, directly related to the `ryu_number` field in the
-        database.
-    release_date: str
-        The date (in YYYY-MM-DD format) that the game was released.
-    """
-    def __init__ (self, title: str, ryu_number: int, release_date: str) -> None:
-        super().__init__(title, ryu_number)
-        self.title, self.release_date = self.primary_key, release_date
-
-    def __str__ (self) -> str:
-        return "%s (%s)" % (self.title, self.release_date)
-
-    def printSelf(self, limit: int=-1, withRn: bool=False) -> str:
-        """Return a string representation of the game object.
-        
-        This method has been overridden from its abstract parent Node.
-
-        Parameters
-        ----------
-        limit: int
-            The limit of how many 'multiple' results to show. In the case of games,
-            this field goes unused.
-        withRn: bool
-            Whether or not to include the node's Ryu Number when printing. If true,
-            the Ryu Number will appear in square braces after the game's title.
-        """
-        if withRn: return str(self) + " [%d]" % self.ryu_number
-        else: return str(self)
+"""Classes for the node objects in the database, and their related methods.
+
+These "nodes" in the database are set to represent the important tables
+of the database.
+
+Nodes are kept small, since whole result sets (and whole graphs) of them
+are held at once: they use `__slots__`, every name and title they hold is
+interned (so that a title shared by many characters is only stored once),
+and a character's games and aliases are only fetched when first read.
+
+Classes
+-------
+Node(ABC)
+    An abstract representation of a node in the Ryu database.
+game_character(Node)
+    A class meant to represent a character table in the database.
+game(Node)
+    A class meant to represent the game table in the database.
+RelationLoader
+    Fills in the games and aliases of a group of characters on first use.
+"""
+
+from abc import ABC, abstractmethod
+from sys import intern
+from typing import Callable, Iterable, List, Optional
+
+from methods import queries
+from classes.ryu_connector import RyuConnector
+
+
+class Node(ABC):
+    """An abstract representation of a node in the Ryu database.
+    
+    This Node is meant to be inherited by `game` and `game_character` tables
+    to better represent them.
+
+    Attributes
+    ----------
+    primary_key: str
+        An attribute representing the primary key field of the table.
+    ryu_number: int
+        The Ryu Number of the table.
+    
+    Methods
+    -------
+    printSelf(self, int, bool) -> str
+        An abstract method representing printing the contents of the node. Must
+        be overridden by child classes.
+    """
+    __slots__ = ("primary_key", "ryu_number")
+
+    def __init__(self, pk: str, rn: int) -> None:
+        self.primary_key = intern(pk)
+        self.ryu_number = rn
+
+    @abstractmethod
+    def printSelf(self, limit: int=-1, withRn: bool=False) -> str:
+        """Return a string representation of the node object.
+        
+        This method is intended to be overridden by child classes to better
+        suit their attributes.
+
+        Parameters
+        ----------
+        limit: int
+            The limit of how many 'multiple' results to show. 
+        withRn: bool
+            Whether or not to include the node's Ryu Number when printing.
+        """
+        pass
+
+    def getMissingData(self, rdb: RyuConnector) -> bool:
+        """Retrieve any data that may be missing to the class.
+        
+        This method is intended to connect to the database to fill in any empty
+        fields that a Node may be missing. This is intended to abstract-ify the
+        data retrieval process, putting the onus on the object itself rather 
+        than the class retrieving the object itself.
+
+        Parameters
+        ----------
+        rdb: RyuConnector.cursor
+            A cursor object opened by a RyuConnector.
+        """
+        return True
+
+
+class GameCharacter(Node):
+    """A class meant to represent a character table in the database.
+    
+    The character object has related attributes for all fields it has in the
+    database, as well as a few others.
+
+    Attributes
+    ----------
+    name: str
+        The name of the character, directly related to the `name` field in the
+        database. This also doubles as the primary_key.
+    ryu_number: int
+        The character's Ryu Number, directly related to the `ryu_number` field
+        in the database.
+    appears_in: List[str]
+        A list of the titles of games that the character appears in. This is 
+        meant to illustrate the `appears_in` table in the database.
+    aliases: List[str]
+        A list of aliases that the character is known by. This is meant to
+        illustrate the `alias` table in the database.
+
+    If `appears_in` or `aliases` are not given, they are fetched by `loader`
+    the first time either is read (or are empty, without a loader). Until
+    then, a preview of the character's first few games and how many there
+    are can be given with `setPreview()`, which `printSelf()` will use when
+    it shows no more games than that.
+    """
+    __slots__ = ("_appears_in", "_aliases", "_loader", "_firstGames", "_numGames")
+
+    def __init__ (self, name: str, ryu_number: int, appears_in: Optional[List[str]]=None, aliases: Optional[List[str]]=None,
+                  loader: Optional["RelationLoader"]=None) -> None:
+        super().__init__(name, ryu_number)
+        self._appears_in: Optional[List[str]] = None if appears_in is None else [intern(g) for g in appears_in]
+        self._aliases: Optional[List[str]] = None if aliases is None else [intern(a) for a in aliases]
+        self._loader: Optional[RelationLoader] = None
+        self._firstGames: Optional[List[str]] = None
+        self._numGames = 0
+        if loader is not None and not self.isLoaded():
+            loader.add(self)
+
+    @property
+    def name(self) -> str:
+        return self.primary_key
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self.primary_key = intern(name)
+
+    @property
+    def appears_in(self) -> List[str]:
+        if self._appears_in is None:
+            self._load()
+        return self._appears_in
+
+    @appears_in.setter
+    def appears_in(self, appears_in: Iterable[str]) -> None:
+        self._appears_in = [intern(g) for g in appears_in]
+
+    @property
+    def aliases(self) -> List[str]:
+        if self._aliases is None:
+            self._load()
+        return self._aliases
+
+    @aliases.setter
+    def aliases(self, aliases: Iterable[str]) -> None:
+        self._aliases = [intern(a) for a in aliases]
+
+    def isLoaded(self) -> bool:
+        """Return whether or not the character's games and aliases are already known."""
+        return self._appears_in is not None and self._aliases is not None
+
+    def hasPreview(self, limit: int) -> bool:
+        """Return whether or not the character's first `limit` games (and how many there are) are known.
+
+        A negative `limit` asks for every game.
+        """
+        if self._appears_in is not None:
+            return True
+        if self._firstGames is None:
+            return False
+        return 0 <= limit <= len(self._firstGames) or len(self._firstGames) == self._numGames
+
+    def setPreview(self, firstGames: Iterable[str], numGames: int) -> None:
+        """Give the character's first few games, and how many games they appear in altogether."""
+        self._firstGames = [intern(g) for g in firstGames]
+        self._numGames = numGames
+
+    def _load(self) -> None:
+        """Fetch the character's games and aliases through their loader (along with the rest of its batch)."""
+        if self._loader is not None:
+            self._loader.load(self)
+        if self._appears_in is None: self._appears_in = []
+        if self._aliases is None: self._aliases = []
+
+    def __str__ (self) -> str:
+        returnStr = "(%d) %s\n" % (self.ryu_number, self.name)
+        if self.aliases:
+            returnStr += f"\t(AKA {', '.join(self.aliases)})\n"
+        for g in self.appears_in:
+            returnStr += "\t%s\n" % g
+        return returnStr
+
+    def printSelf(self, limit: int=-1, withRn: bool=False) -> str:
+        """Return a string representation of the character object.
+        
+        This method has been overridden from its abstract parent Node.
+
+        Parameters
+        ----------
+        limit: int
+            The limit of how many 'appears_in' results to show. When set to -1, all
+            values will be printed.
+        withRn: bool
+            Whether or not to include the node's Ryu Number when printing. If true,
+            the Ryu Number will appear in square braces after the character's name.
+        """
+        # A preview is enough when it holds every game that will be shown
+        if self._appears_in is None and self.hasPreview(limit):
+            games, numGames = self._firstGames, self._numGames
+        else:
+            games, numGames = self.appears_in, len(self.appears_in)
+        if limit == -1: limit = numGames
+        elif limit < 0: limit = 0
+        returnStr = "%s" % self.name
+        if withRn: returnStr += " [%d]" % self.ryu_number
+        if self.aliases:
+            returnStr += f"\n\t(AKA {', '.join(self.aliases)})"
+        for i in range(min(limit, len(games))):
+            returnStr += "\n\t%s" % games[i]
+        if limit < numGames and limit != 0:
+            returnStr += "\n\t... and %d more" % (numGames - limit)
+        elif limit == 0:
+            returnStr += "\n\t(Appears in %d game%s)" % (numGames, "" if numGames == 1 else "s")
+        return returnStr
+
+    def getMissingData(self, rdb: RyuConnector) -> bool:
+        """Retrieve any data that may be missing to the class.
+        
+        This method is overridden from its parent. The character will connect 
+        to the database and fill in the missing `self.appears_in` and 
+        `self.aliases` fields.
+        
+        Parameters
+        ----------
+        rdb: RyuConnector.cursor
+            A cursor object opened by a RyuConnector.
+        """
+        try:
+            # Get appears_in relations
+            if not self._appears_in:
+                rdb.execute(*queries.getGamesByCharacter(self.name))
+                self.appears_in = [row[0] for row in rdb.fetchall()]
+            # Get alias relations
+            if not self._aliases:
+                rdb.execute(*queries.getAliasesFromName(self.name))
+                self.aliases = [row[1] for row in rdb.fetchall()]
+            return True
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return False
+
+
+class Game(Node):
+    """A class meant to represent the game table in the database.
+    
+    The game object has related attributes for all fields it has in the
+    database.
+
+    Attributes
+    ----------
+    title: str
+        The title of the game, directly related to the `title` field in the
+        database. This also doubles as the primary_key.
+    ryu_number: int
+        The game's Ryu Number, directly related to the `ryu_number` field in the
+        database.
+    release_date: str
+        The date (in YYYY-MM-DD format) that the game was released.
+    """
+    __slots__ = ("release_date",)
+
+    def __init__ (self, title: str, ryu_number: int, release_date: str) -> None:
+        super().__init__(title, ryu_number)
+        self.release_date = release_date
+
+    @property
+    def title(self) -> str:
+        return self.primary_key
+
+    @title.setter
+    def title(self, title: str) -> None:
+        self.primary_key = intern(title)
+
+    def __str__ (self) -> str:
+        return "%s (%s)" % (self.title, self.release_date)
+
+    def printSelf(self, limit: int=-1, withRn: bool=False) -> str:
+        """Return a string representation of the game object.
+        
+        This method has been overridden from its abstract parent Node.
+
+        Parameters
+        ----------
+        limit: int
+            The limit of how many 'multiple' results to show. In the case of games,
+            this field goes unused.
+        withRn: bool
+            Whether or not to include the node's Ryu Number when printing. If true,
+            the Ryu Number will appear in square braces after the game's title.
+        """
+        if withRn: return str(self) + " [%d]" % self.ryu_number
+        else: return str(self)
+
+
+class RelationLoader:
+    """Fills in the games and aliases of a group of characters, the first time any of them is read.
+
+    Characters that are fetched together (such as the results of one search)
+    share a loader, so that reading the games of any one of them fetches
+    those of the whole group at once, rather than one character at a time.
+
+    Attributes
+    ----------
+    fetch: Callable[[List[GameCharacter]], None]
+        Called with every character of the group still missing their games or
+        aliases, and expected to assign both to each of them (such as
+        `ryu_database.hydrateCharacters()`).
+    batchSize: int | None
+        If given, only the batch of this many characters (in the order they
+        were added) holding the character that was read is fetched, rather
+        than the whole group.
+    """
+    __slots__ = ("fetch", "batchSize", "_characters")
+
+    def __init__(self, fetch: Callable[[List[GameCharacter]], None], batchSize: Optional[int]=None) -> None:
+        self.fetch = fetch
+        self.batchSize = batchSize
+        self._characters: List[GameCharacter] = []
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def add(self, c: GameCharacter) -> None:
+        """Add a character to the group."""
+        c._loader = self
+        self._characters.append(c)
+
+    def load(self, c: Optional[GameCharacter]=None) -> None:
+        """Fetch the games and aliases of every character in the group (or in `c`'s batch) still missing them."""
+        if c is None or self.batchSize is None or c not in self._characters:
+            characters, self._characters = self._characters, []
+        else:
+            start = self._characters.index(c)
+            start -= start % self.batchSize
+            characters = self._characters[start:start + self.batchSize]
+            del self._characters[start:start + self.batchSize]
+        for c in characters:
+            c._loader = None
+        missing = [c for c in characters if not c.isLoaded()]
+        if missing:
+            self.fetch(missing)
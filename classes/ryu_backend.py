@@ -0,0 +1,424 @@
+"""Classes for the storage backends that serve reads of the Ryu database.
+
+Every read made through `methods.ryu_database` is answered by a backend.
+By default this is the MySQL database, but the data can also be served
+entirely from memory, built from the local text files or a snapshot,
+which needs no database server at all.
+
+Classes
+-------
+RyuBackend(ABC)
+    An abstract source of everything that can be read from the database.
+MemoryBackend(RyuBackend)
+    A backend that answers every read from an in-memory index.
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from classes import file_manager as fm
+from classes.name_index import FuzzyIndex, NameIndex, fold
+from classes.nodes import Node, Game, GameCharacter
+from classes.ryu_graph import RyuGraph, RyuStats, RYU
+from classes.ryu_snapshot import RyuSnapshot
+
+
+LIKE_LIMIT = 1000   # The most results a search by similar name will return
+
+T = TypeVar('T')
+
+
+def pageOf(items: Iterable[T], key: Callable[[T], str], after: str, limit: int) -> List[T]:
+    """Return the first `limit` items whose keys come after `after`, in order of key.
+
+    Keys are compared after `fold()`, much like the database compares names,
+    and only `limit` items are ever sorted.
+    """
+    after = fold(after)
+    return heapq.nsmallest(limit, (x for x in items if fold(key(x)) > after), key=lambda x: fold(key(x)))
+
+
+class RyuBackend(ABC):
+    """An abstract source of everything that can be read from the database.
+
+    Each method mirrors the function of the same name in
+    `methods.ryu_database`, and is expected to return the same kind of
+    result. Methods that return lists should return an empty list when
+    nothing is found, and None only if an error occurs.
+    """
+
+    def invalidate(self, tags: Optional[Iterable]=None) -> None:
+        """Forget anything derived from the data, since the database has been written to.
+
+        The tags (see `classes.ryu_cache`) describe exactly what was written,
+        and None means that anything may have changed. Backends that keep
+        nothing derived from the database don't need to override this.
+        """
+        pass
+
+    # CHARACTERS
+
+    @abstractmethod
+    def getCharacterByName(self, name: str) -> Optional[GameCharacter]:
+        """Get a character using their name or one of their aliases."""
+        pass
+
+    @abstractmethod
+    def getCharactersLikeName(self, name: str) -> Optional[List[GameCharacter]]:
+        """Get characters whose names or aliases are similar to the arg."""
+        pass
+
+    @abstractmethod
+    def getCharactersCloseToName(self, name: str) -> Optional[List[GameCharacter]]:
+        """Get characters whose names or aliases are close to the arg, allowing for typos."""
+        pass
+
+    @abstractmethod
+    def getCharactersByNames(self, names: Tuple[str]) -> Optional[List[GameCharacter]]:
+        """Get characters whose names or aliases are in the passed tuple."""
+        pass
+
+    @abstractmethod
+    def getCharactersByGame(self, title: str) -> Optional[List[GameCharacter]]:
+        """Get all characters who appear in a given game."""
+        pass
+
+    @abstractmethod
+    def getCharactersByRyuNumber(self, rn: int) -> Optional[List[GameCharacter]]:
+        """Get all characters who have a given Ryu Number."""
+        pass
+
+    @abstractmethod
+    def getCharacterByAlias(self, aname: str) -> Optional[GameCharacter]:
+        """Get a character based on their alias."""
+        pass
+
+    @abstractmethod
+    def getCharactersLikeAlias(self, aname: str) -> Optional[List[GameCharacter]]:
+        """Get characters who have an alias similar to the arg."""
+        pass
+
+    @abstractmethod
+    def getNumCharacters(self) -> Optional[int]:
+        """Get the total number of characters."""
+        pass
+
+    @abstractmethod
+    def getNumCharactersWithRN(self, rn: int) -> Optional[int]:
+        """Get the number of characters with a given Ryu Number."""
+        pass
+
+    # GAMES
+
+    @abstractmethod
+    def getGameByTitle(self, title: str) -> Optional[Game]:
+        """Get a game using its title."""
+        pass
+
+    @abstractmethod
+    def getGamesLikeTitle(self, title: str) -> Optional[List[Game]]:
+        """Get games whose titles are similar to the arg."""
+        pass
+
+    @abstractmethod
+    def getGamesCloseToTitle(self, title: str) -> Optional[List[Game]]:
+        """Get games whose titles are close to the arg, allowing for typos."""
+        pass
+
+    @abstractmethod
+    def getGamesByTitles(self, titles: Tuple[str]) -> Optional[List[Game]]:
+        """Get games whose titles are in the passed tuple."""
+        pass
+
+    @abstractmethod
+    def getGamesByCharacter(self, name: str) -> Optional[List[Game]]:
+        """Get all the games a given character appears in."""
+        pass
+
+    @abstractmethod
+    def getGamesByRyuNumber(self, rn: int) -> Optional[List[Game]]:
+        """Get all games that have a given Ryu Number."""
+        pass
+
+    @abstractmethod
+    def getNumGames(self) -> Optional[int]:
+        """Get the total number of games."""
+        pass
+
+    @abstractmethod
+    def getNumGamesWithRN(self, rn: int) -> Optional[int]:
+        """Get the number of games with a given Ryu Number."""
+        pass
+
+    # STATISTICS
+
+    @abstractmethod
+    def getStats(self) -> Optional[RyuStats]:
+        """Get every statistic about the database."""
+        pass
+
+    # PAGES
+    # Each page holds the first `limit` results (in order of name or title)
+    # that come after `after`, or from the very start if `after` is empty.
+    # By default, each is a page of the matching method's whole list.
+
+    def getCharactersByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        """Get one page of the characters who have a given Ryu Number."""
+        result = self.getCharactersByRyuNumber(rn)
+        return None if result is None else pageOf(result, lambda c: c.name, after, limit)
+
+    def getCharactersByGamePage(self, title: str, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        """Get one page of the characters who appear in a given game."""
+        result = self.getCharactersByGame(title)
+        return None if result is None else pageOf(result, lambda c: c.name, after, limit)
+
+    def getGamesByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[Game]]:
+        """Get one page of the games that have a given Ryu Number."""
+        result = self.getGamesByRyuNumber(rn)
+        return None if result is None else pageOf(result, lambda g: g.title, after, limit)
+
+    # ALIASES
+
+    @abstractmethod
+    def getAliasesFromName(self, cname: str) -> Optional[List[str]]:
+        """Get a list of aliases that a character goes by."""
+        pass
+
+    @abstractmethod
+    def getNameFromAlias(self, aname: str) -> Optional[str]:
+        """Get a character's name from their alias."""
+        pass
+
+    # RYU NUMBERS
+
+    @abstractmethod
+    def stepTowardsRyu(self, item: Node) -> Optional[List[str]]:
+        """Get one step of a path towards Ryu."""
+        pass
+
+    @abstractmethod
+    def getPathFromCharacter(self, name: str) -> Optional[List[Node]]:
+        """Get a random path of characters and games from a character to Ryu."""
+        pass
+
+    @abstractmethod
+    def getShortestPathGraph(self, name: str) -> Optional[Tuple[str, RyuGraph]]:
+        """Get a graph holding every shortest path from a character to Ryu.
+
+        Returns a tuple of the character's name (matching their name or an
+        alias) and a `RyuGraph` whose Ryu Numbers are filled in for at least
+        every node on those paths, or None if the character doesn't exist.
+        """
+        pass
+
+
+class MemoryBackend(RyuBackend):
+    """A backend that answers every read from an in-memory index.
+
+    The index is built once from a `RyuGraph` whose Ryu Numbers have been
+    computed, after which no reads touch the database. Each node's parents
+    (see `RyuGraph.computeParents()`) are also found, so that paths to Ryu
+    take one lookup per step. Names, titles, and
+    aliases are matched case-insensitively, like the database does.
+
+    Writes made through `methods.ryu_database` still only go to MySQL, so
+    the index should be rebuilt after any changes.
+    """
+    def __init__(self, graph: RyuGraph, aliases: Iterable[Tuple[str, str]]=()) -> None:
+        """Build the index.
+
+        Parameters
+        ----------
+        graph: RyuGraph
+            A graph of every character, game, and relation. Its Ryu Numbers are
+            computed first if they have not been already.
+        aliases: Iterable[Tuple[str, str]]
+            Every alias, as `(cname, aname)` tuples. Aliases of characters that
+            are not in the graph are left out.
+        """
+        if not graph.characterRN and not graph.gameRN:
+            graph.computeRyuNumbers()
+        graph.computeParents()
+        self.graph = graph
+        self._characterKeys: Dict[str, str] = {c.casefold(): c for c in graph.characterGames}
+        self._gameKeys: Dict[str, str] = {g.casefold(): g for g in graph.gameCharacters}
+        self._aliasKeys: Dict[str, str] = {}    # casefolded alias -> name
+        self._aliases: Dict[str, List[str]] = {}    # name -> [alias]
+        self._nameIndex: NameIndex[str] = NameIndex()   # names and aliases -> name
+        self._titleIndex: NameIndex[str] = NameIndex()  # titles -> title
+        self._fuzzyNames: FuzzyIndex[str] = FuzzyIndex()
+        self._fuzzyTitles: FuzzyIndex[str] = FuzzyIndex()
+        for cname in graph.characterGames:
+            self._nameIndex.add(cname, cname)
+            self._fuzzyNames.add(cname, cname)
+        for gtitle in graph.gameCharacters:
+            self._titleIndex.add(gtitle, gtitle)
+            self._fuzzyTitles.add(gtitle, gtitle)
+        for cname, aname in aliases:
+            if cname in graph.characterGames and aname.casefold() not in self._aliasKeys:
+                self._aliasKeys[aname.casefold()] = cname
+                self._aliases.setdefault(cname, []).append(aname)
+                self._nameIndex.add(aname, cname)
+                self._fuzzyNames.add(aname, cname)
+        self._stats: Optional[RyuStats] = None
+        # Each character's games, in order of release date
+        self._characterGames: Dict[str, List[str]] = {
+            c: sorted(games, key=self._releaseOrder) for c, games in graph.characterGames.items()
+        }
+
+    @classmethod
+    def fromFiles(cls) -> "MemoryBackend":
+        """Build a backend from the local text files and `alias.csv`."""
+        aliases = fm.getAliasIndex()
+        return cls(RyuGraph.fromFiles(), aliases.pairs() if aliases else [])
+
+    @classmethod
+    def fromSnapshot(cls, path: Optional[str]=None) -> "MemoryBackend":
+        """Build a backend from a snapshot file (by default, `file_manager.SNAPSHOT_FILE`)."""
+        with RyuSnapshot(path or fm.SNAPSHOT_FILE) as snapshot:
+            return cls(snapshot.toGraph(), snapshot.aliases())
+
+    # HELPERS
+
+    def _releaseOrder(self, gtitle: str) -> Tuple[str, str]:
+        """Sort games by release date, where games without a date come first."""
+        return (self.graph.releaseDates.get(gtitle) or "", gtitle)
+
+    def _resolveName(self, name: str) -> Optional[str]:
+        """Return the stored name of a character, matching their name or an alias."""
+        key = name.casefold()
+        return self._characterKeys.get(key) or self._aliasKeys.get(key)
+
+    def _character(self, cname: str) -> GameCharacter:
+        """Return a fully filled character object."""
+        return GameCharacter(cname, self.graph.characterRN[cname], self._characterGames[cname], self._aliases.get(cname, []))
+
+    def _game(self, gtitle: str) -> Game:
+        """Return a game object."""
+        return Game(gtitle, self.graph.gameRN[gtitle], self.graph.releaseDates.get(gtitle))
+
+    # CHARACTERS
+
+    def getCharacterByName(self, name: str) -> Optional[GameCharacter]:
+        cname = self._resolveName(name)
+        return self._character(cname) if cname else None
+
+    def getCharactersLikeName(self, name: str) -> Optional[List[GameCharacter]]:
+        return [self._character(c) for c in self._nameIndex.search(name, LIKE_LIMIT)]
+
+    def getCharactersCloseToName(self, name: str) -> Optional[List[GameCharacter]]:
+        return [self._character(c) for c in self._fuzzyNames.search(name)]
+
+    def getCharactersByNames(self, names: Tuple[str]) -> Optional[List[GameCharacter]]:
+        found = {self._resolveName(n) for n in names} - {None}
+        return sorted((self._character(c) for c in found), key=lambda c: c.ryu_number)
+
+    def getCharactersByGame(self, title: str) -> Optional[List[GameCharacter]]:
+        gtitle = self._gameKeys.get(title.casefold())
+        if gtitle is None: return []
+        return [self._character(c) for c in sorted(self.graph.gameCharacters[gtitle])]
+
+    def getCharactersByRyuNumber(self, rn: int) -> Optional[List[GameCharacter]]:
+        return [self._character(c) for c, crn in self.graph.characterRN.items() if crn == int(rn)]
+
+    def getCharacterByAlias(self, aname: str) -> Optional[GameCharacter]:
+        cname = self._aliasKeys.get(aname.casefold())
+        return self._character(cname) if cname else None
+
+    def getCharactersLikeAlias(self, aname: str) -> Optional[List[GameCharacter]]:
+        key = aname.casefold()
+        found = {cname for alias, cname in self._aliasKeys.items() if key in alias}
+        return [self._character(c) for c in sorted(found)]
+
+    def getNumCharacters(self) -> Optional[int]:
+        return len(self.graph.characterGames)
+
+    def getNumCharactersWithRN(self, rn: int) -> Optional[int]:
+        return sum(1 for crn in self.graph.characterRN.values() if crn == rn)
+
+    # GAMES
+
+    def getGameByTitle(self, title: str) -> Optional[Game]:
+        gtitle = self._gameKeys.get(title.casefold())
+        return self._game(gtitle) if gtitle else None
+
+    def getGamesLikeTitle(self, title: str) -> Optional[List[Game]]:
+        found = [g for _, g in self._titleIndex.candidates(title)]
+        found.sort(key=lambda g: (self.graph.releaseDates.get(g) or "", self.graph.gameRN[g]))
+        return [self._game(g) for g in found]
+
+    def getGamesCloseToTitle(self, title: str) -> Optional[List[Game]]:
+        return [self._game(g) for g in self._fuzzyTitles.search(title)]
+
+    def getGamesByTitles(self, titles: Tuple[str]) -> Optional[List[Game]]:
+        found = {self._gameKeys.get(t.casefold()) for t in titles} - {None}
+        return sorted((self._game(g) for g in found), key=lambda g: g.ryu_number)
+
+    def getGamesByCharacter(self, name: str) -> Optional[List[Game]]:
+        cname = self._characterKeys.get(name.casefold())
+        if cname is None: return []
+        return [self._game(g) for g in self._characterGames[cname]]
+
+    def getGamesByRyuNumber(self, rn: int) -> Optional[List[Game]]:
+        return [self._game(g) for g, grn in self.graph.gameRN.items() if grn == rn]
+
+    def getNumGames(self) -> Optional[int]:
+        return len(self.graph.gameCharacters)
+
+    def getNumGamesWithRN(self, rn: int) -> Optional[int]:
+        return sum(1 for grn in self.graph.gameRN.values() if grn == rn)
+
+    # STATISTICS
+
+    def getStats(self) -> Optional[RyuStats]:
+        if self._stats is None:
+            self._stats = self.graph.stats()
+        return self._stats
+
+    # PAGES
+
+    def getCharactersByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        names = (c for c, crn in self.graph.characterRN.items() if crn == int(rn))
+        return [self._character(c) for c in pageOf(names, str, after, limit)]
+
+    def getCharactersByGamePage(self, title: str, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        gtitle = self._gameKeys.get(title.casefold())
+        if gtitle is None: return []
+        return [self._character(c) for c in pageOf(self.graph.gameCharacters[gtitle], str, after, limit)]
+
+    def getGamesByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[Game]]:
+        titles = (g for g, grn in self.graph.gameRN.items() if grn == rn)
+        return [self._game(g) for g in pageOf(titles, str, after, limit)]
+
+    # ALIASES
+
+    def getAliasesFromName(self, cname: str) -> Optional[List[str]]:
+        name = self._characterKeys.get(cname.casefold())
+        return list(self._aliases.get(name, [])) if name else []
+
+    def getNameFromAlias(self, aname: str) -> Optional[str]:
+        return self._aliasKeys.get(aname.casefold())
+
+    # RYU NUMBERS
+
+    def stepTowardsRyu(self, item: Node) -> Optional[List[str]]:
+        if type(item) is Game:
+            gtitle = self._gameKeys.get(item.primary_key.casefold())
+            return list(self.graph.gameParents.get(gtitle, ()))
+        elif type(item) is GameCharacter:
+            if item.primary_key == RYU: return None
+            cname = self._characterKeys.get(item.primary_key.casefold())
+            return sorted(self.graph.characterParents.get(cname, ()), key=self._releaseOrder)
+        else:
+            return None
+
+    def getPathFromCharacter(self, name: str) -> Optional[List[Node]]:
+        cname = self._resolveName(name)
+        path = self.graph.pathToRyu(cname) if cname else None
+        if path is None: return None
+        return [self._character(x) if i % 2 == 0 else self._game(x) for i, x in enumerate(path)]
+
+    def getShortestPathGraph(self, name: str) -> Optional[Tuple[str, RyuGraph]]:
+        cname = self._resolveName(name)
+        return (cname, self.graph) if cname else None
@@ -0,0 +1,325 @@
+"""Classes for caching the results of reads from the Ryu database.
+
+Every cached result is tagged with what it depends on: the characters,
+games, and aliases it holds or looked up, and any aggregate (such as the
+set of names, or the Ryu Numbers as a whole) it was computed from. Writes
+then invalidate exactly the results whose tags they touch, so that a
+cached result is never returned once the data behind it has changed.
+
+Tags are either one of the aggregate constants below, or a `(kind, key)`
+tuple made by `characterTag()`, `gameTag()`, or `aliasTag()`. Keys are
+passed through `name_index.fold()`, matching the database's collation, so
+that lookups in any case are invalidated alongside each other.
+
+Classes
+-------
+ResultCache
+    A least-recently-used cache of results, with a time to live, size limit,
+    tag-based invalidation, and hit/miss counters.
+CachedBackend(RyuBackend)
+    A backend that answers reads from a `ResultCache`, and only asks another
+    backend on a miss.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+from classes.name_index import fold
+from classes.nodes import Node, Game, GameCharacter
+from classes.ryu_backend import RyuBackend
+from classes.ryu_graph import RyuGraph, RyuStats
+
+
+CACHE_SIZE = 4096   # The most results a cache holds
+CACHE_TTL = 300.0   # How many seconds a result stays cached
+
+# Aggregate tags
+CHARACTERS = "characters"   # Which characters exist
+GAMES = "games"             # Which games exist
+NAMES = "names"             # Every character name and alias, as searched by similar name
+TITLES = "titles"           # Every game title, as searched by similar title
+RELATIONS = "relations"     # Every `appears_in` relation
+RYU_NUMBERS = "ryu_numbers" # Every Ryu Number
+
+Tag = Union[str, Tuple[str, str]]
+
+
+def characterTag(name: str) -> Tag:
+    """Return the tag of a character, by name."""
+    return ("character", fold(name))
+
+def gameTag(title: str) -> Tag:
+    """Return the tag of a game, by title."""
+    return ("game", fold(title))
+
+def aliasTag(aname: str) -> Tag:
+    """Return the tag of an alias."""
+    return ("alias", fold(aname))
+
+def tagsOf(result: Any) -> Set[Tag]:
+    """Return the tags of every character, game, and alias held by a result.
+
+    A character depends on their own name, aliases, and the games they
+    appear in (whose titles and release dates are shown alongside them).
+    A character whose games and aliases have yet to be fetched is tagged
+    with every aggregate they could come to depend on instead, so that
+    tagging them doesn't fetch them.
+    """
+    tags: Set[Tag] = set()
+    if isinstance(result, GameCharacter):
+        tags.add(characterTag(result.name))
+        if result.isLoaded():
+            tags.update(aliasTag(a) for a in result.aliases)
+            tags.update(gameTag(g) for g in result.appears_in)
+        else:
+            tags.update((NAMES, RELATIONS, TITLES))
+    elif isinstance(result, Game):
+        tags.add(gameTag(result.title))
+    elif isinstance(result, RyuGraph):
+        tags.update(characterTag(c) for c in result.characterGames)
+        tags.update(gameTag(g) for g in result.gameCharacters)
+    elif isinstance(result, (list, tuple)):
+        for item in result:
+            tags |= tagsOf(item)
+    return tags
+
+
+class ResultCache:
+    """A least-recently-used cache of results, with a time to live, size limit, tag-based invalidation, and hit/miss counters.
+
+    This is safe to share between threads.
+
+    Attributes
+    ----------
+    hits: int
+        How many lookups found a result.
+    misses: int
+        How many lookups found nothing (including expired results).
+    evictions: int
+        How many results were dropped to stay within the size limit.
+    invalidations: int
+        How many results were dropped because of a write.
+    """
+    def __init__(self, maxSize: int=CACHE_SIZE, ttl: float=CACHE_TTL, clock: Callable[[], float]=time.monotonic) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        maxSize: int
+            The most results to hold. (Default is `CACHE_SIZE`)
+        ttl: float
+            How many seconds a result stays cached. (Default is `CACHE_TTL`)
+        clock: Callable[[], float]
+            The source of the current time. (Default is `time.monotonic`)
+        """
+        self.maxSize, self.ttl, self._clock = maxSize, ttl, clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Set[Tag]]]" = OrderedDict()
+        self._byTag: Dict[Tag, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop a result, and forget its tags. Expects the lock to be held."""
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._byTag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys: del self._byTag[tag]
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return `(True, result)` if a result is cached under the key, or `(False, None)`.
+
+        The result is a copy, so it can be changed without affecting the cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None: self._remove(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, copy.deepcopy(entry[1])
+
+    def put(self, key: Hashable, result: Any, tags: Iterable[Tag]) -> None:
+        """Cache a copy of a result under a key, to be invalidated by any of the tags."""
+        tags = set(tags)
+        result = copy.deepcopy(result)
+        with self._lock:
+            if key in self._entries: self._remove(key)
+            self._entries[key] = (self._clock() + self.ttl, result, tags)
+            for tag in tags:
+                self._byTag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxSize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tags: Optional[Iterable[Tag]]=None) -> None:
+        """Drop every result with any of the tags, or every result if no tags are passed."""
+        with self._lock:
+            if tags is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._byTag.clear()
+                return
+            keys: Set[Hashable] = set()
+            for tag in tags:
+                keys |= self._byTag.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters, along with how many results are cached."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "invalidations": self.invalidations}
+
+
+class CachedBackend(RyuBackend):
+    """A backend that answers reads from a `ResultCache`, and only asks another backend on a miss.
+
+    Results of None (which mean either an error or that nothing was found)
+    are never cached. Random paths from `getPathFromCharacter()` are never
+    cached either, so that each call can return a different path.
+
+    Attributes
+    ----------
+    backend: RyuBackend
+        The backend that answers misses.
+    cache: ResultCache
+        Where results are cached.
+    """
+    def __init__(self, backend: RyuBackend, cache: Optional[ResultCache]=None) -> None:
+        self.backend = backend
+        self.cache = cache if cache is not None else ResultCache()
+
+    def invalidate(self, tags: Optional[Iterable[Tag]]=None) -> None:
+        tags = None if tags is None else set(tags)
+        self.cache.invalidate(tags)
+        self.backend.invalidate(tags)
+
+    def _read(self, method: str, args: Tuple, tags: Iterable[Tag], key: Optional[Hashable]=None,
+              tagResult: Callable[[Any], Set[Tag]]=tagsOf) -> Any:
+        """Return a cached result, or call the backend and cache what it returns.
+
+        The result is cached under `key` (by default, the method's name and
+        args), and tagged with the passed tags, plus `tagResult()` of the
+        result (by default, `tagsOf()`).
+        """
+        key = key if key is not None else (method,) + args
+        found, result = self.cache.get(key)
+        if found:
+            return result
+        result = getattr(self.backend, method)(*args)
+        if result is not None:
+            self.cache.put(key, result, set(tags) | tagResult(result))
+        return result
+
+    # CHARACTERS
+
+    def getCharacterByName(self, name: str) -> Optional[GameCharacter]:
+        return self._read("getCharacterByName", (name,), [characterTag(name), aliasTag(name)])
+
+    def getCharactersLikeName(self, name: str) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersLikeName", (name,), [NAMES])
+
+    def getCharactersCloseToName(self, name: str) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersCloseToName", (name,), [NAMES])
+
+    def getCharactersByNames(self, names: Tuple[str]) -> Optional[List[GameCharacter]]:
+        names = tuple(names)
+        return self._read("getCharactersByNames", (names,), [characterTag(n) for n in names] + [aliasTag(n) for n in names])
+
+    def getCharactersByGame(self, title: str) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersByGame", (title,), [gameTag(title)])
+
+    def getCharactersByRyuNumber(self, rn: int) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersByRyuNumber", (rn,), [RYU_NUMBERS])
+
+    def getCharacterByAlias(self, aname: str) -> Optional[GameCharacter]:
+        return self._read("getCharacterByAlias", (aname,), [aliasTag(aname)])
+
+    def getCharactersLikeAlias(self, aname: str) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersLikeAlias", (aname,), [NAMES])
+
+    def getNumCharacters(self) -> Optional[int]:
+        return self._read("getNumCharacters", (), [CHARACTERS])
+
+    def getNumCharactersWithRN(self, rn: int) -> Optional[int]:
+        return self._read("getNumCharactersWithRN", (rn,), [RYU_NUMBERS])
+
+    # GAMES
+
+    def getGameByTitle(self, title: str) -> Optional[Game]:
+        return self._read("getGameByTitle", (title,), [gameTag(title)])
+
+    def getGamesLikeTitle(self, title: str) -> Optional[List[Game]]:
+        return self._read("getGamesLikeTitle", (title,), [TITLES])
+
+    def getGamesCloseToTitle(self, title: str) -> Optional[List[Game]]:
+        return self._read("getGamesCloseToTitle", (title,), [TITLES])
+
+    def getGamesByTitles(self, titles: Tuple[str]) -> Optional[List[Game]]:
+        titles = tuple(titles)
+        return self._read("getGamesByTitles", (titles,), [gameTag(t) for t in titles])
+
+    def getGamesByCharacter(self, name: str) -> Optional[List[Game]]:
+        return self._read("getGamesByCharacter", (name,), [characterTag(name), aliasTag(name)])
+
+    def getGamesByRyuNumber(self, rn: int) -> Optional[List[Game]]:
+        return self._read("getGamesByRyuNumber", (rn,), [RYU_NUMBERS])
+
+    def getNumGames(self) -> Optional[int]:
+        return self._read("getNumGames", (), [GAMES])
+
+    def getNumGamesWithRN(self, rn: int) -> Optional[int]:
+        return self._read("getNumGamesWithRN", (rn,), [RYU_NUMBERS])
+
+    # STATISTICS
+
+    def getStats(self) -> Optional[RyuStats]:
+        return self._read("getStats", (), [CHARACTERS, GAMES, RELATIONS, RYU_NUMBERS])
+
+    # PAGES
+    # A renamed character (or game) may move onto or off of any page
+
+    def getCharactersByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersByRyuNumberPage", (rn, after, limit), [NAMES, RYU_NUMBERS])
+
+    def getCharactersByGamePage(self, title: str, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        return self._read("getCharactersByGamePage", (title, after, limit), [gameTag(title), NAMES])
+
+    def getGamesByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[Game]]:
+        return self._read("getGamesByRyuNumberPage", (rn, after, limit), [TITLES, RYU_NUMBERS])
+
+    # ALIASES
+
+    def getAliasesFromName(self, cname: str) -> Optional[List[str]]:
+        return self._read("getAliasesFromName", (cname,), [characterTag(cname), aliasTag(cname), NAMES])
+
+    def getNameFromAlias(self, aname: str) -> Optional[str]:
+        return self._read("getNameFromAlias", (aname,), [aliasTag(aname)], tagResult=lambda cname: {characterTag(cname)})
+
+    # RYU NUMBERS
+
+    def stepTowardsRyu(self, item: Node) -> Optional[List[str]]:
+        # A game steps to characters, and a character steps to games
+        if isinstance(item, Game):
+            tag, tagStep = gameTag(item.primary_key), characterTag
+        else:
+            tag, tagStep = characterTag(item.primary_key), gameTag
+        key = ("stepTowardsRyu", type(item).__name__, item.primary_key)
+        return self._read("stepTowardsRyu", (item,), [tag, RYU_NUMBERS], key, lambda step: {tagStep(x) for x in step})
+
+    def getPathFromCharacter(self, name: str) -> Optional[List[Node]]:
+        return self.backend.getPathFromCharacter(name)
+
+    def getShortestPathGraph(self, name: str) -> Optional[Tuple[str, RyuGraph]]:
+        return self._read("getShortestPathGraph", (name,), [characterTag(name), aliasTag(name), RYU_NUMBERS])
@@ -1,40 +1,387 @@
-"""Class containing the connection details to the database.
-
-The single class found in this module encapsulates the connection to the
-database in the form of a context manager.
-"""
-
-import mysql.connector
-
-class RyuConnector:
-    """A context manager that connects to the database (assuming it exists).
-    
-    This class can be used alongside the `with` keyword, and will return a
-    cursor object that can execute queries, commands, and other database
-    operations.
-    """
-    def __init__(self, credentials: str="db.txt") -> None:
-        """Initialize the connection to the database.
-        
-        Parameters
-        ----------
-        credentials: str
-            The name of the file which contains the database credential information.
-            The assumed format is that there are four lines in the text file, which
-            represent the host, user, password, and database names respectively.
-        """
-        self.dbCreds = open(credentials, "r").read().splitlines()
-        self.mydb = mysql.connector.connect(
-            host        =self.dbCreds[0],
-            user        =self.dbCreds[1],
-            password    =self.dbCreds[2],
-            database    =self.dbCreds[3]
-        )
-        self.cursor = self.mydb.cursor()
-
-    def __enter__(self):
-        return self.cursor
-
-    def __exit__(self, type, value, traceback) -> None:
-        self.mydb.commit()
-        self.mydb.close()
\ No newline at end of file
+"""Class containing the connection details to the database.
+
+The main class found in this module encapsulates the connection to the
+database in the form of a context manager. Connections are not opened
+per use, but are instead borrowed from a bounded pool shared by every
+`RyuConnector` using the same credentials, which saves the cost of a
+TCP handshake and authentication on every call.
+
+Each pooled connection also keeps its own cache of server-side prepared
+statements, so that a query executed with parameters is only parsed and
+planned by the server the first time it is run on that connection.
+
+Classes
+-------
+ConnectionPool
+    A bounded, thread-safe pool of reusable database connections.
+StatementCache
+    A least-recently-used cache of prepared statements on one connection.
+RyuCursor
+    A cursor that executes queries with parameters as prepared statements.
+RyuConnector
+    A context manager that borrows a connection from the pool.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ryu.config import CREDENTIALS_FILE
+
+
+POOL_SIZE = 5           # The maximum number of connections open at once per pool
+POOL_TIMEOUT = 30.0     # How long (in seconds) to wait for a free connection
+MAX_IDLE_TIME = 300.0   # How long (in seconds) a connection may sit unused before being closed
+STATEMENT_CACHE_SIZE = 64   # The most prepared statements kept open per connection
+STREAM_BATCH_SIZE = 500     # How many rows `RyuCursor.stream()` reads from the server at a time
+
+
+class ConnectionPool:
+    """A bounded, thread-safe pool of reusable database connections.
+
+    Connections are created lazily, up to `size` at a time. When a connection
+    is returned to the pool it is kept for later use, unless it has been left
+    idle for longer than `max_idle` seconds, in which case it is closed the
+    next time the pool is accessed. Every connection is checked for health
+    before it is handed out, and broken connections are replaced.
+
+    Attributes
+    ----------
+    size: int
+        The maximum number of connections the pool will have open at once.
+    timeout: float
+        How many seconds to wait for a connection to become available before
+        giving up.
+    max_idle: float
+        How many seconds a connection may go unused before it is evicted.
+    """
+    def __init__(self, credentials: List[str], size: int=POOL_SIZE, timeout: float=POOL_TIMEOUT, max_idle: float=MAX_IDLE_TIME) -> None:
+        if size < 1:
+            raise ValueError("A connection pool must hold at least one connection")
+        self.credentials = credentials
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: List[Tuple[object, float]] = []    # (connection, time it was returned)
+        self._statements: Dict[int, StatementCache] = {}  # By id() of each open connection
+        self._in_use = 0
+        self._lock = threading.Condition()
+
+    def _connect(self):
+        """Open a brand-new connection to the database."""
+        # The connector is only imported once a connection is actually needed
+        import mysql.connector
+        return mysql.connector.connect(
+            host        =self.credentials[0],
+            user        =self.credentials[1],
+            password    =self.credentials[2],
+            database    =self.credentials[3]
+        )
+
+    def _evictIdle(self) -> None:
+        """Close any connections that have been idle for too long.
+
+        Must be called while holding the pool's lock.
+        """
+        now = time.monotonic()
+        keep: List[Tuple[object, float]] = []
+        for cnx, returned in self._idle:
+            if now - returned > self.max_idle:
+                self._close(cnx)
+            else:
+                keep.append((cnx, returned))
+        self._idle = keep
+
+    def _close(self, cnx) -> None:
+        """Close a connection, ignoring any errors from an already-dead one."""
+        self._statements.pop(id(cnx), None)
+        try:
+            cnx.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _isHealthy(cnx) -> bool:
+        """Return whether or not a pooled connection is still usable."""
+        try:
+            cnx.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """Borrow a connection from the pool.
+
+        If every connection is in use, this waits up to `self.timeout` seconds
+        for one to be released before raising a `TimeoutError`.
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._lock:
+            while True:
+                self._evictIdle()
+                # Reuse the most recently returned connection, if it still works
+                while self._idle:
+                    cnx, _ = self._idle.pop()
+                    if self._isHealthy(cnx):
+                        self._in_use += 1
+                        return cnx
+                    self._close(cnx)
+                # Otherwise, open a new one if we have room
+                if self._in_use < self.size:
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("No database connection became available within %.1f seconds" % self.timeout)
+                self._lock.wait(remaining)
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+
+    def statements(self, cnx) -> "StatementCache":
+        """Return the prepared statement cache of a borrowed connection."""
+        with self._lock:
+            cache = self._statements.get(id(cnx))
+            if cache is None or cache.cnx is not cnx:
+                cache = self._statements[id(cnx)] = StatementCache(cnx)
+            return cache
+
+    def release(self, cnx, discard: bool=False) -> None:
+        """Return a borrowed connection to the pool.
+
+        Parameters
+        ----------
+        cnx: MySQLConnection
+            The connection previously returned by `acquire()`.
+        discard: bool
+            Whether or not the connection should be closed rather than reused,
+            such as after an error left it in an unknown state.
+        """
+        with self._lock:
+            self._in_use -= 1
+            if discard:
+                self._close(cnx)
+            else:
+                self._idle.append((cnx, time.monotonic()))
+            self._evictIdle()
+            self._lock.notify()
+
+    def closeAll(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            for cnx, _ in self._idle:
+                self._close(cnx)
+            self._idle = []
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def getPool(credentials: str=CREDENTIALS_FILE, size: int=POOL_SIZE) -> ConnectionPool:
+    """Return the connection pool for a given credentials file.
+
+    The pool is created the first time it is requested; the `size` argument
+    is only used at that time.
+    """
+    with _pools_lock:
+        if credentials not in _pools:
+            dbCreds = open(credentials, "r").read().splitlines()
+            _pools[credentials] = ConnectionPool(dbCreds, size=size)
+        return _pools[credentials]
+
+def closePools() -> None:
+    """Close every idle connection in every pool (e.g. before a schema drop)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeAll()
+
+
+class StatementCache:
+    """A least-recently-used cache of server-side prepared statements on one connection.
+
+    Each statement is held by its own prepared cursor, which is prepared the
+    first time the statement is executed, and then only sends parameters on
+    every later execution. When more than `size` statements are cached, the
+    least recently used one is closed, which frees it on the server.
+
+    Attributes
+    ----------
+    cnx: MySQLConnection
+        The connection the statements are prepared on.
+    size: int
+        The most statements to keep prepared.
+    hits: int
+        How many executions reused an already-prepared statement.
+    misses: int
+        How many executions had to prepare a new statement.
+    """
+    def __init__(self, cnx, size: int=STATEMENT_CACHE_SIZE) -> None:
+        self.cnx = cnx
+        self.size = size
+        self._cursors: "OrderedDict[str, Tuple[str, object]]" = OrderedDict()   # (statement, cursor)
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def execute(self, sql: str, params: Sequence):
+        """Execute a statement with parameters, preparing it first if needed, and return its cursor."""
+        entry = self._cursors.get(sql)
+        if entry is None:
+            self.misses += 1
+            entry = self._cursors[sql] = (sql, self.cnx.cursor(prepared=True))
+            while len(self._cursors) > self.size:
+                _, (_, old) = self._cursors.popitem(last=False)
+                self._closeCursor(old)
+        else:
+            self.hits += 1
+            self._cursors.move_to_end(sql)
+        # A prepared cursor only skips preparing when passed the very statement it last ran
+        sql, cursor = entry
+        try:
+            cursor.execute(sql, params)
+        except Exception:
+            # The statement may not have been prepared, so don't keep it
+            del self._cursors[sql]
+            self._closeCursor(cursor)
+            raise
+        return cursor
+
+    @staticmethod
+    def _closeCursor(cursor) -> None:
+        """Close a prepared cursor, ignoring any errors from a dead connection."""
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+
+class RyuCursor:
+    """A cursor that executes queries with parameters as server-side prepared statements.
+
+    Queries from `methods.queries` are executed with `execute(*query)`, and
+    are prepared through the connection's `StatementCache`. Statements run
+    without parameters (such as creating tables or triggers, which cannot be
+    prepared) and `executemany()` go through a plain cursor instead. Results
+    are read from whichever cursor executed last.
+
+    Cursors are unbuffered, so rows stay on the server until they are
+    fetched. Every row of a result must be fetched before anything else is
+    executed.
+    """
+    def __init__(self, cnx, statements: StatementCache) -> None:
+        self._cnx = cnx
+        self._statements = statements
+        self._text = cnx.cursor()
+        self._last = self._text
+
+    def execute(self, sql: str, params: Optional[Sequence]=None) -> None:
+        """Execute a statement, as a prepared statement if parameters (even empty ones) are passed."""
+        if params is None:
+            self._text.execute(sql)
+            self._last = self._text
+        else:
+            self._last = self._statements.execute(sql, params)
+
+    def executemany(self, sql: str, rows: Sequence[Sequence]) -> None:
+        """Execute a parameterized statement once per row, batched into one statement where possible."""
+        self._text.executemany(sql, rows)
+        self._last = self._text
+
+    def fetchall(self) -> List[tuple]:
+        return self._last.fetchall()
+
+    def fetchone(self) -> Optional[tuple]:
+        return self._last.fetchone()
+
+    def fetchmany(self, size: int) -> List[tuple]:
+        return self._last.fetchmany(size)
+
+    def stream(self, size: int=STREAM_BATCH_SIZE) -> Iterator[tuple]:
+        """Yield every row of the last query, fetching `size` rows at a time.
+
+        Only one batch of rows is held in memory at once, however many rows
+        the query returns. A stream must be read to the end, or closed (as
+        happens when a `for` loop over it breaks and it is dropped), before
+        anything else is executed; closing it discards any rows left unread.
+        """
+        try:
+            while True:
+                rows = self._last.fetchmany(size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            self.consume()
+
+    @property
+    def rowcount(self) -> int:
+        return self._last.rowcount
+
+    def consume(self) -> None:
+        """Discard any rows of the last query that were never fetched."""
+        if getattr(self._cnx, "unread_result", False):
+            self._cnx.consume_results()
+
+    def close(self) -> None:
+        """Close the plain cursor. Prepared statements stay open with the connection.
+
+        Any rows left unread are discarded first, as an unbuffered cursor
+        cannot be closed (nor its transaction committed) while they remain.
+        """
+        self.consume()
+        self._text.close()
+
+
+class RyuConnector:
+    """A context manager that connects to the database (assuming it exists).
+
+    This class can be used alongside the `with` keyword, and will return a
+    `RyuCursor` that can execute queries, commands, and other database
+    operations. The underlying connection is borrowed from a shared
+    `ConnectionPool`, and is returned to it on exit. Everything executed
+    within the block is committed together on exit, or rolled back if the
+    block raises an exception. If the commit itself fails, its error is
+    raised on exit, as though the block had raised it.
+    """
+    def __init__(self, credentials: str=CREDENTIALS_FILE) -> None:
+        """Initialize the connection to the database.
+
+        Parameters
+        ----------
+        credentials: str
+            The name of the file which contains the database credential information.
+            The assumed format is that there are four lines in the text file, which
+            represent the host, user, password, and database names respectively.
+        """
+        self.pool = getPool(credentials)
+        self.mydb = self.pool.acquire()
+        try:
+            self.cursor = RyuCursor(self.mydb, self.pool.statements(self.mydb))
+        except Exception:
+            self.pool.release(self.mydb, discard=True)
+            raise
+
+    def __enter__(self):
+        return self.cursor
+
+    def __exit__(self, type, value, traceback) -> None:
+        try:
+            self.cursor.close()
+            if type is None:
+                self.mydb.commit()
+            else:
+                self.mydb.rollback()
+        except Exception:
+            # The connection is left in an unknown state, so it isn't reused. A
+            # failed commit is raised, while a failed rollback leaves the block's
+            # own exception to be raised instead.
+            self.pool.release(self.mydb, discard=True)
+            if type is None: raise
+            return
+        self.pool.release(self.mydb)
@@ -0,0 +1,393 @@
+"""Class for holding the Ryu database as an in-memory bipartite graph.
+
+The database is a bipartite graph, where characters and games are nodes
+and each `appears_in` relation is an edge between a character and a
+game. Holding that graph in memory allows every Ryu Number to be
+computed with a single breadth-first search from Ryu, rather than by
+repeatedly firing the database's triggers.
+
+Classes
+-------
+RyuStats(NamedTuple)
+    Every statistic shown about the database.
+RyuGraph
+    An in-memory bipartite graph of characters and games.
+"""
+
+from random import choice
+from sys import intern
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from classes import file_manager as fm
+from methods import queries
+
+
+RYU = "Ryu"         # The name of the character that every Ryu Number is relative to
+UNLINKED_RN = 99    # The Ryu Number given to anything that cannot be linked to Ryu
+
+
+class RyuStats(NamedTuple):
+    """Every statistic shown about the database.
+
+    Each distribution maps a value to how many characters or games have it.
+
+    Attributes
+    ----------
+    characterRN: Dict[int, int]
+        How many characters have each Ryu Number.
+    gameRN: Dict[int, int]
+        How many games have each Ryu Number.
+    characterDegrees: Dict[int, int]
+        How many characters appear in each number of games.
+    gameDegrees: Dict[int, int]
+        How many games have each number of characters.
+    largestComponent: Tuple[int, int]
+        How many characters and games are in the largest connected component
+        of the graph.
+    """
+    characterRN: Dict[int, int]
+    gameRN: Dict[int, int]
+    characterDegrees: Dict[int, int]
+    gameDegrees: Dict[int, int]
+    largestComponent: Tuple[int, int]
+
+    @property
+    def numCharacters(self) -> int:
+        """The total number of characters."""
+        return sum(self.characterRN.values())
+
+    @property
+    def numGames(self) -> int:
+        """The total number of games."""
+        return sum(self.gameRN.values())
+
+    @property
+    def numRelations(self) -> int:
+        """The total number of `appears_in` relations."""
+        return sum(degree * count for degree, count in self.characterDegrees.items())
+
+    @property
+    def meanRN(self) -> Optional[float]:
+        """The mean Ryu Number of every character linked to Ryu (or None if there are none)."""
+        linked = {rn: count for rn, count in self.characterRN.items() if rn < UNLINKED_RN}
+        if not linked: return None
+        return sum(rn * count for rn, count in linked.items()) / sum(linked.values())
+
+    @property
+    def maxRN(self) -> Optional[int]:
+        """The highest Ryu Number of any character linked to Ryu (or None if there are none)."""
+        return max((rn for rn in self.characterRN if rn < UNLINKED_RN), default=None)
+
+
+class RyuGraph:
+    """An in-memory bipartite graph of characters and games.
+
+    The graph can be built from the database or from the local text files,
+    after which `computeRyuNumbers()` will find the Ryu Number of every node
+    in O(V+E) time.
+
+    Attributes
+    ----------
+    characterGames: Dict[str, Set[str]]
+        A mapping of each character's name to the titles of every game they
+        appear in.
+    gameCharacters: Dict[str, Set[str]]
+        A mapping of each game's title to the names of every character that
+        appears in it.
+    releaseDates: Dict[str, str]
+        A mapping of each game's title to its release date.
+    characterRN: Dict[str, int]
+        A mapping of each character's name to their Ryu Number. This is only
+        filled once `computeRyuNumbers()` has been called.
+    gameRN: Dict[str, int]
+        A mapping of each game's title to its Ryu Number. This is only filled
+        once `computeRyuNumbers()` has been called.
+    characterParents: Dict[str, Tuple[str, ...]]
+        A mapping of each character's name to the (sorted) titles of the games
+        that are one step closer to Ryu. This is only filled once
+        `computeParents()` has been called.
+    gameParents: Dict[str, Tuple[str, ...]]
+        A mapping of each game's title to the (sorted) names of the characters
+        that are one step closer to Ryu. This is only filled once
+        `computeParents()` has been called.
+    """
+    def __init__(self) -> None:
+        self.characterGames: Dict[str, Set[str]] = {}
+        self.gameCharacters: Dict[str, Set[str]] = {}
+        self.releaseDates: Dict[str, str] = {}
+        self.characterRN: Dict[str, int] = {}
+        self.gameRN: Dict[str, int] = {}
+        self.characterParents: Dict[str, Tuple[str, ...]] = {}
+        self.gameParents: Dict[str, Tuple[str, ...]] = {}
+        self._pathCounts: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def fromDatabase(cls, rdb) -> "RyuGraph":
+        """Build a graph from every character, game, and relation in the database.
+
+        Rows are streamed from the database, so only the graph itself (and
+        not every row it was built from) is held in memory.
+
+        Parameters
+        ----------
+        rdb: RyuConnector.cursor
+            A cursor object opened by a RyuConnector.
+        """
+        graph = cls()
+        rdb.execute(*queries.getAllCharacters())
+        for row in rdb.stream():
+            graph.addCharacter(row[0])
+        rdb.execute(*queries.getAllGames())
+        for row in rdb.stream():
+            graph.addGame(row[0], None if row[2] is None else str(row[2]))
+        rdb.execute(*queries.getAllRelations())
+        for row in rdb.stream():
+            graph.addRelation(row[0], row[1])
+        return graph
+
+    @classmethod
+    def fromFiles(cls, workers: Optional[int]=None) -> "RyuGraph":
+        """Build a graph from the local text files found in `config.GAMES_PATH`.
+
+        The files are streamed through `file_manager.streamGameFiles()`, which
+        parses them with `workers` processes (by default,
+        `file_manager.PARSE_WORKERS`) and reports (then skips) any file that
+        cannot be parsed.
+        """
+        graph = cls()
+        graph.addCharacter(RYU)
+        for record in fm.streamGameFiles(workers=workers):
+            graph.addGame(record.title, record.release_date)
+            for cname in record.characters:
+                graph.addRelation(cname, record.title)
+        return graph
+
+    def addCharacter(self, cname: str) -> None:
+        """Add a character to the graph, if they aren't already in it."""
+        self.characterGames.setdefault(intern(cname), set())
+
+    def addGame(self, gtitle: str, release_date: Optional[str]=None) -> None:
+        """Add a game to the graph, if it isn't already in it."""
+        gtitle = intern(gtitle)
+        self.gameCharacters.setdefault(gtitle, set())
+        if release_date is not None:
+            self.releaseDates[gtitle] = release_date
+
+    def addRelation(self, cname: str, gtitle: str) -> None:
+        """Add an `appears_in` edge, adding either node if it is missing.
+
+        Names and titles are interned, so that each is only held once however
+        many edges it has.
+        """
+        cname, gtitle = intern(cname), intern(gtitle)
+        self.addCharacter(cname)
+        self.addGame(gtitle)
+        self.characterGames[cname].add(gtitle)
+        self.gameCharacters[gtitle].add(cname)
+
+    def computeRyuNumbers(self, roots: Iterable[str]=(RYU,)) -> None:
+        """Compute the Ryu Number of every character and game in the graph.
+
+        A single breadth-first search is run, starting from every character
+        in `roots` at once. Each game is given a Ryu Number one greater than
+        the lowest of its characters, and each character is given the lowest
+        Ryu Number of the games they appear in. Anything that is not
+        connected to a root is given a Ryu Number of `UNLINKED_RN`.
+        """
+        characterRN: Dict[str, int] = {}
+        gameRN: Dict[str, int] = {}
+        frontier: List[str] = []
+        for root in roots:
+            if root in self.characterGames and root not in characterRN:
+                characterRN[root] = 0
+                frontier.append(root)
+        rn = 0
+        while frontier:
+            # Every unvisited game of this level's characters is one step further
+            rn += 1
+            games: List[str] = []
+            for cname in frontier:
+                for gtitle in self.characterGames[cname]:
+                    if gtitle not in gameRN:
+                        gameRN[gtitle] = rn
+                        games.append(gtitle)
+            # Every unvisited character in those games shares the game's number
+            frontier = []
+            for gtitle in games:
+                for cname in self.gameCharacters[gtitle]:
+                    if cname not in characterRN:
+                        characterRN[cname] = rn
+                        frontier.append(cname)
+        self.characterRN = {c: characterRN.get(c, UNLINKED_RN) for c in self.characterGames}
+        self.gameRN = {g: gameRN.get(g, UNLINKED_RN) for g in self.gameCharacters}
+
+    def computeParents(self) -> None:
+        """Find the nodes one step closer to Ryu for every character and game.
+
+        Together, these form every shortest path to Ryu as a DAG. A game's
+        parents are its characters whose Ryu Number is one lower, and a
+        character's parents are their games with the same Ryu Number. Ryu and
+        anything unlinked have no parents. The Ryu Numbers must already have
+        been computed (or loaded).
+        """
+        self.characterParents = {}
+        self.gameParents = {}
+        self._pathCounts = None
+        for cname, rn in self.characterRN.items():
+            if 0 < rn < UNLINKED_RN:
+                self.characterParents[cname] = tuple(sorted(g for g in self.characterGames[cname] if self.gameRN.get(g) == rn))
+        for gtitle, rn in self.gameRN.items():
+            if rn < UNLINKED_RN:
+                self.gameParents[gtitle] = tuple(sorted(c for c in self.gameCharacters[gtitle] if self.characterRN.get(c) == rn - 1))
+
+    def pathToRyu(self, cname: str, pick: Callable[[Sequence[str]], str]=choice) -> Optional[List[str]]:
+        """Return a shortest path from a character to Ryu.
+
+        The path alternates between character names and game titles, starting
+        with `cname` and ending with Ryu, and takes one parent lookup per step.
+        At each step, `pick` chooses among the parents (by default, randomly).
+        None is returned if the character is not in the graph, cannot be
+        linked to Ryu, or if some node on the way has no parents (as happens
+        when relations are added after the parents were computed, without
+        computing the Ryu Numbers and parents again).
+        """
+        if not self.characterParents and not self.gameParents:
+            self.computeParents()
+        rn = self.characterRN.get(cname)
+        if rn is None or rn >= UNLINKED_RN:
+            return None
+        path = [cname]
+        while self.characterRN.get(path[-1]) != 0:
+            games = self.characterParents.get(path[-1])
+            if not games:
+                return None
+            gtitle = pick(games)
+            characters = self.gameParents.get(gtitle)
+            if not characters:
+                return None
+            path.append(gtitle)
+            path.append(pick(characters))
+        return path
+
+    def countPaths(self) -> Dict[str, int]:
+        """Return how many distinct shortest paths lead from each character to Ryu.
+
+        Every count is found at once with dynamic programming over the parents
+        of each node, visiting nodes in order of Ryu Number: Ryu has exactly
+        one path, a game has as many paths as all of its parents combined, and
+        so does a character. Characters who cannot be linked to Ryu have no
+        paths. The result is kept until the parents are next computed.
+        """
+        if not self.characterParents and not self.gameParents:
+            self.computeParents()
+        if self._pathCounts is None:
+            characterPaths: Dict[str, int] = {c: 1 for c, rn in self.characterRN.items() if rn == 0}
+            gamePaths: Dict[str, int] = {}
+            # Games rely on characters one number lower, and characters on games of the same number
+            nodes = [(rn, 0, g) for g, rn in self.gameRN.items() if rn < UNLINKED_RN]
+            nodes.extend((rn, 1, c) for c, rn in self.characterRN.items() if 0 < rn < UNLINKED_RN)
+            for _, isCharacter, name in sorted(nodes):
+                if isCharacter:
+                    characterPaths[name] = sum(gamePaths[g] for g in self.characterParents[name])
+                else:
+                    gamePaths[name] = sum(characterPaths[c] for c in self.gameParents[name])
+            self._pathCounts = {c: characterPaths.get(c, 0) for c in self.characterGames}
+        return self._pathCounts
+
+    def iterPathsToRyu(self, cname: str, limit: Optional[int]=None) -> Iterator[List[str]]:
+        """Yield every distinct shortest path from a character to Ryu, one at a time.
+
+        Each path is laid out as in `pathToRyu()`. Paths are produced lazily
+        with a depth-first search over the parents of each node, and always
+        come in the same order, since parents are sorted. A node with no
+        parents is a dead end, and no path is yielded through it.
+
+        Parameters
+        ----------
+        cname: str
+            The name of the character to start from. Nothing is yielded if they
+            are not in the graph, or cannot be linked to Ryu.
+        limit: int | None
+            The most paths to yield. (Default is None, which yields them all)
+        """
+        if not self.characterParents and not self.gameParents:
+            self.computeParents()
+        rn = self.characterRN.get(cname)
+        if rn is None or rn >= UNLINKED_RN or limit == 0:
+            return
+        if rn == 0:
+            yield [cname]
+            return
+        found = 0
+        path: List[str] = [cname]
+        stack: List[Iterator[str]] = [iter(self.characterParents.get(cname, ()))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:    # Every path through the last node has been yielded
+                stack.pop()
+                path.pop()
+                continue
+            path.append(node)
+            if len(path) % 2 == 0:  # Games sit at odd positions of the path
+                stack.append(iter(self.gameParents.get(node, ())))
+            elif self.characterRN.get(node) == 0:
+                yield list(path)
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+                path.pop()
+            else:
+                stack.append(iter(self.characterParents.get(node, ())))
+
+    def largestComponent(self) -> Tuple[int, int]:
+        """Return how many characters and games are in the largest connected component."""
+        best = (0, 0)
+        seen: Set[str] = set()
+        for start in self.characterGames:
+            if start in seen: continue
+            seen.add(start)
+            characters, games = [start], set()
+            i = 0
+            while i < len(characters):
+                for gtitle in self.characterGames[characters[i]]:
+                    if gtitle in games: continue
+                    games.add(gtitle)
+                    for cname in self.gameCharacters[gtitle]:
+                        if cname not in seen:
+                            seen.add(cname)
+                            characters.append(cname)
+                i += 1
+            if len(characters) + len(games) > sum(best):
+                best = (len(characters), len(games))
+        # Games without any characters are components of their own
+        if not best[0] and self.gameCharacters: best = (0, 1)
+        return best
+
+    def stats(self) -> RyuStats:
+        """Return every statistic about the graph, using the Ryu Numbers already computed."""
+        characterRN: Dict[int, int] = {}
+        gameRN: Dict[int, int] = {}
+        characterDegrees: Dict[int, int] = {}
+        gameDegrees: Dict[int, int] = {}
+        for cname, games in self.characterGames.items():
+            rn = self.characterRN.get(cname, UNLINKED_RN)
+            characterRN[rn] = characterRN.get(rn, 0) + 1
+            characterDegrees[len(games)] = characterDegrees.get(len(games), 0) + 1
+        for gtitle, characters in self.gameCharacters.items():
+            rn = self.gameRN.get(gtitle, UNLINKED_RN)
+            gameRN[rn] = gameRN.get(rn, 0) + 1
+            gameDegrees[len(characters)] = gameDegrees.get(len(characters), 0) + 1
+        return RyuStats(characterRN, gameRN, characterDegrees, gameDegrees, self.largestComponent())
+
+    def countByRyuNumber(self) -> Dict[int, List[int]]:
+        """Return how many characters and games there are per Ryu Number.
+
+        The resulting dictionary maps each Ryu Number to a list of the form
+        `[number of characters, number of games]`.
+        """
+        counts: Dict[int, List[int]] = {}
+        for rn in self.characterRN.values():
+            counts.setdefault(rn, [0, 0])[0] += 1
+        for rn in self.gameRN.values():
+            counts.setdefault(rn, [0, 0])[1] += 1
+        return counts
@@ -0,0 +1,286 @@
+"""Class for reading and writing the whole Ryu database as one binary file.
+
+A snapshot holds every character, game, release date, relation, alias,
+and Ryu Number in a single compact file, so that the database can be
+rebuilt (or queried directly) without re-reading every local text file.
+
+Every string is stored once in a shared string table, and everything
+else refers to strings, characters, and games by integer ID. Relations
+are stored as CSR (compressed sparse row) adjacency arrays in both
+directions. The file is opened with `mmap`, and every array is read in
+place through a `memoryview`, so opening a snapshot costs the same no
+matter how large it is.
+
+The file is laid out as follows, where C, G, A, and E are the number of
+characters, games, aliases, and relations, and S = C + G + A + G is the
+number of strings. Every integer is a little-endian 32-bit integer.
+
+    header              `SNAPSHOT_HEADER`
+    string offsets      uint32[S + 1]
+    character RN        int32[C]
+    game RN             int32[G]
+    character offsets   uint32[C + 1]   (into character -> game edges)
+    character -> game   uint32[E]
+    game offsets        uint32[G + 1]   (into game -> character edges)
+    game -> character   uint32[E]
+    alias -> character  uint32[A]
+    string data         UTF-8 bytes
+
+Strings are stored in the order: character names (sorted), game titles
+(sorted), alias names (sorted), then each game's release date. Since the
+names, titles, and aliases are sorted, they are looked up with a binary
+search directly over the file.
+
+Classes
+-------
+RyuSnapshot
+    A read-only view of a snapshot file.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from classes.ryu_graph import RyuGraph
+
+
+SNAPSHOT_MAGIC = b"RYUSNAP\0"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<8sIIIII")    # magic, version, C, G, A, E
+
+
+class RyuSnapshot:
+    """A read-only view of a snapshot file.
+
+    This class can be used alongside the `with` keyword, which closes the
+    file on exit. IDs run from 0 to `numCharacters - 1` for characters, and
+    from 0 to `numGames - 1` for games, in order of name and title
+    respectively.
+
+    Attributes
+    ----------
+    numCharacters: int
+        How many characters are held by the snapshot.
+    numGames: int
+        How many games are held by the snapshot.
+    numAliases: int
+        How many aliases are held by the snapshot.
+    numRelations: int
+        How many `appears_in` relations are held by the snapshot.
+    """
+    def __init__(self, path: str) -> None:
+        """Open a snapshot file.
+
+        Raises a `ValueError` if the file is not a snapshot, or was written by
+        an incompatible version.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Snapshots can only be read on little-endian machines")
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        try:
+            magic, version, C, G, A, E = SNAPSHOT_HEADER.unpack_from(self._view)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} snapshot")
+            self.numCharacters, self.numGames, self.numAliases, self.numRelations = C, G, A, E
+            pos = SNAPSHOT_HEADER.size
+            self._strOffsets, pos = self._section(pos, "I", C + G + A + G + 1)
+            self._characterRN, pos = self._section(pos, "i", C)
+            self._gameRN, pos = self._section(pos, "i", G)
+            self._characterOffsets, pos = self._section(pos, "I", C + 1)
+            self._characterGames, pos = self._section(pos, "I", E)
+            self._gameOffsets, pos = self._section(pos, "I", G + 1)
+            self._gameCharacters, pos = self._section(pos, "I", E)
+            self._aliasCharacters, pos = self._section(pos, "I", A)
+            self._strings = self._view[pos:]
+        except Exception:
+            self.close()
+            raise
+        self._aliasesByCharacter: Optional[Dict[int, List[str]]] = None
+
+    def _section(self, pos: int, typecode: str, length: int) -> Tuple[memoryview, int]:
+        """Return a view of `length` integers starting at `pos`, and where the view ends."""
+        end = pos + 4 * length
+        return self._view[pos:end].cast(typecode), end
+
+    def __enter__(self) -> "RyuSnapshot":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release every view of the file, then close it."""
+        for name in ("_strOffsets", "_characterRN", "_gameRN", "_characterOffsets", "_characterGames",
+                     "_gameOffsets", "_gameCharacters", "_aliasCharacters", "_strings", "_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None: view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    # STRINGS
+
+    def _string(self, i: int) -> str:
+        """Return the `i`th string of the string table."""
+        return str(self._strings[self._strOffsets[i]:self._strOffsets[i + 1]], "utf-8")
+
+    def _search(self, key: str, first: int, count: int) -> Optional[int]:
+        """Binary search for a string among `count` sorted strings, starting at `first`.
+
+        Returns the position of the first match relative to `first`, or None if
+        there is no match. Byte-wise order of UTF-8 matches the order of
+        Python's strings, so the search compares the raw bytes of each string.
+        """
+        target = key.encode("utf-8")
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = first + mid
+            if bytes(self._strings[self._strOffsets[i]:self._strOffsets[i + 1]]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < count and self._string(first + lo) == key:
+            return lo
+        return None
+
+    # CHARACTERS
+
+    def characterName(self, cid: int) -> str:
+        """Return the name of a character, given their ID."""
+        return self._string(cid)
+
+    def characterId(self, cname: str) -> Optional[int]:
+        """Return the ID of a character, given their exact name (or None)."""
+        return self._search(cname, 0, self.numCharacters)
+
+    def characterRN(self, cid: int) -> int:
+        """Return the Ryu Number of a character, given their ID."""
+        return self._characterRN[cid]
+
+    def gamesOf(self, cid: int) -> memoryview:
+        """Return the IDs of every game a character appears in."""
+        return self._characterGames[self._characterOffsets[cid]:self._characterOffsets[cid + 1]]
+
+    # GAMES
+
+    def gameTitle(self, gid: int) -> str:
+        """Return the title of a game, given its ID."""
+        return self._string(self.numCharacters + gid)
+
+    def gameId(self, gtitle: str) -> Optional[int]:
+        """Return the ID of a game, given its exact title (or None)."""
+        return self._search(gtitle, self.numCharacters, self.numGames)
+
+    def gameRN(self, gid: int) -> int:
+        """Return the Ryu Number of a game, given its ID."""
+        return self._gameRN[gid]
+
+    def releaseDate(self, gid: int) -> Optional[str]:
+        """Return the release date of a game, given its ID (or None if it has none)."""
+        return self._string(self.numCharacters + self.numGames + self.numAliases + gid) or None
+
+    def charactersOf(self, gid: int) -> memoryview:
+        """Return the IDs of every character that appears in a game."""
+        return self._gameCharacters[self._gameOffsets[gid]:self._gameOffsets[gid + 1]]
+
+    # ALIASES
+
+    def characterIdByAlias(self, aname: str) -> Optional[int]:
+        """Return the ID of the character with an exact alias (or None)."""
+        i = self._search(aname, self.numCharacters + self.numGames, self.numAliases)
+        return None if i is None else self._aliasCharacters[i]
+
+    def aliasesOf(self, cid: int) -> List[str]:
+        """Return every alias of a character.
+
+        The reverse mapping is built on first use, since there are far fewer
+        aliases than characters.
+        """
+        if self._aliasesByCharacter is None:
+            self._aliasesByCharacter = {}
+            first = self.numCharacters + self.numGames
+            for i in range(self.numAliases):
+                self._aliasesByCharacter.setdefault(self._aliasCharacters[i], []).append(self._string(first + i))
+        return list(self._aliasesByCharacter.get(cid, []))
+
+    def aliases(self) -> List[Tuple[str, str]]:
+        """Return every alias as a list of `(cname, aname)` tuples."""
+        first = self.numCharacters + self.numGames
+        return [(self.characterName(self._aliasCharacters[i]), self._string(first + i)) for i in range(self.numAliases)]
+
+    # CONVERSION
+
+    def toGraph(self) -> RyuGraph:
+        """Return a `RyuGraph` of the snapshot, with its Ryu Numbers already filled in."""
+        graph = RyuGraph()
+        names = [self.characterName(cid) for cid in range(self.numCharacters)]
+        for cid, cname in enumerate(names):
+            graph.addCharacter(cname)
+            graph.characterRN[cname] = self.characterRN(cid)
+        for gid in range(self.numGames):
+            gtitle = self.gameTitle(gid)
+            graph.addGame(gtitle, self.releaseDate(gid))
+            graph.gameRN[gtitle] = self.gameRN(gid)
+            for cid in self.charactersOf(gid):
+                graph.addRelation(names[cid], gtitle)
+        return graph
+
+    @staticmethod
+    def write(path: str, graph: RyuGraph, aliases: Iterable[Tuple[str, str]]=()) -> None:
+        """Write a graph and its aliases to a snapshot file.
+
+        The graph's Ryu Numbers are computed first if they have not been
+        already. Aliases of characters that are not in the graph are left out.
+
+        Parameters
+        ----------
+        path: str
+            Where to write the snapshot.
+        graph: RyuGraph
+            The graph of every character, game, and relation.
+        aliases: Iterable[Tuple[str, str]]
+            Every alias, as `(cname, aname)` tuples.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Snapshots can only be written on little-endian machines")
+        if not graph.characterRN and not graph.gameRN:
+            graph.computeRyuNumbers()
+        names = sorted(graph.characterGames)
+        titles = sorted(graph.gameCharacters)
+        cids = {cname: i for i, cname in enumerate(names)}
+        gids = {gtitle: i for i, gtitle in enumerate(titles)}
+        aliasRows = sorted({(aname, cids[cname]) for cname, aname in aliases if cname in cids})
+        # String table
+        strings = names + titles + [aname for aname, _ in aliasRows] + [graph.releaseDates.get(g) or "" for g in titles]
+        blob = bytearray()
+        strOffsets = array("I", [0])
+        for s in strings:
+            blob += s.encode("utf-8")
+            strOffsets.append(len(blob))
+        # Adjacency, in both directions
+        characterOffsets, characterGames = array("I", [0]), array("I")
+        for cname in names:
+            characterGames.extend(sorted(gids[g] for g in graph.characterGames[cname]))
+            characterOffsets.append(len(characterGames))
+        gameOffsets, gameCharacters = array("I", [0]), array("I")
+        for gtitle in titles:
+            gameCharacters.extend(sorted(cids[c] for c in graph.gameCharacters[gtitle]))
+            gameOffsets.append(len(gameCharacters))
+        sections = [
+            strOffsets,
+            array("i", [graph.characterRN[c] for c in names]),
+            array("i", [graph.gameRN[g] for g in titles]),
+            characterOffsets, characterGames,
+            gameOffsets, gameCharacters,
+            array("I", [cid for _, cid in aliasRows]),
+        ]
+        with open(path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(names), len(titles), len(aliasRows), len(characterGames)))
+            for section in sections:
+                section.tofile(f)
+            f.write(blob)
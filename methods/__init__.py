@@ -1,11 +1,17 @@
-"""Contains modules that primarily consist of methods and algorithms.
-
-Modules
--------
-maintenance
-    Module for maintaining and updating the database.
-queries
-    Module for storing query strings for interacting with the database.
-ryu_database
-    Module for employing queries in conjunction with actual objects.
+"""Contains modules that primarily consist of methods and algorithms.
+
+Modules
+-------
+maintenance
+    Module for maintaining and updating the database.
+migrations
+    Module for upgrading the schema of an existing database in place.
+propagation
+    Module for incrementally maintaining Ryu Numbers as relations change.
+queries
+    Module for storing query strings for interacting with the database.
+ryu_async
+    Module for reading the Ryu database concurrently with asyncio.
+ryu_database
+    Module for employing queries in conjunction with actual objects.
 """
\ No newline at end of file
@@ -1,147 +1,262 @@
-"""Module for maintaining and updating the database.
-
-The methods held within this module are used to update the relations of
-the database, fill the database with data, and reset the entire 
-database. Each method's documentation describes it in greater detail.
-
-All methods take two parameters (namely, debug and debug_detailed)
-which determine whether or not to print debug statements, and if so,
-how detailed to be with them.
-
-Methods
--------
-updateRelations(bool, bool) -> None
-    Update the Ryu Numbers of each character in the database recursively.
-fill_db(bool, bool) -> None
-    Fill the database with data based on local text files found in `main.PATH`.
-reset_db(bool, bool) -> None
-    Re-initialize the entire database in memory.
-"""
-
-from classes import file_manager as fm
-from init import initialize_db
-from classes.ryu_connector import RyuConnector
-from methods import queries
-
-def updateRelations(debug: bool=False, debug_detailed: bool=False) -> None:
-    """Update the Ryu Numbers of each character in the database recursively.
-    
-    The method increases a local counter (starting from 0), removing and 
-    reinserting each character and game with a Ryu Number equal to that 
-    value. This causes the database's triggers to fire, which automatically 
-    update each character's and game's Ryu Numbers to be their minimum
-    possible value.
-
-    Parameters
-    ----------
-    debug: bool
-        Whether or not to print debug statements. These include printing out how
-        many characters and games to adjust per Ryu Number.
-    debug_detailed: bool
-        Whether or not to print detailed debug statements. This includes every
-        normal debug statements, as well as indicating every character name and
-        game title that is updated
-    """
-    with RyuConnector() as rdb:
-        # Start by getting Ryu, the boy, the absolute unit of a lad
-        rn = 0
-        rdb.execute(queries.getCharacterByRyu(rn))
-        results = [str(c[0]) for c in rdb.fetchall()]
-        # Continue iterating as long as there are results to iterate over
-        while results:
-            if debug or debug_detailed: print(f"Adjusting {len(results)} characters with Ryu number {rn}...")
-            # Character operations
-            for cname in results:
-                if debug_detailed: print(f"\tAdjusting {cname}...")
-                rdb.execute(queries.getRelationsAndRNByCharacter(cname, rn))
-                relations = [str(g[1]) for g in rdb.fetchall()]   # Get games character `cname` appears in
-                rdb.execute(queries.removeCharacterRelations(cname))
-                for gtitle in relations:
-                    rdb.execute(queries.insertRelation(cname, gtitle))
-            if debug or debug_detailed: print("\tDone")
-            # Get next games
-            rn += 1
-            rdb.execute(queries.getGamesByRyu(rn))
-            results = [g[0] for g in rdb.fetchall()]
-            # Game operations
-            if debug or debug_detailed: print(f"Adjusting {len(results)} games with Ryu number {rn}...")
-            for gtitle in results:
-                if debug_detailed: print(f"\tAdjusting {gtitle}...")
-                rdb.execute(queries.getRelationsAndRNByGame(gtitle, rn))
-                relations = [str(c[0]) for c in rdb.fetchall()]   # Get characters that appear in `gtitle`
-                rdb.execute(queries.removeGameRelations(gtitle))
-                for cname in relations:
-                    rdb.execute(queries.insertRelation(cname, gtitle))
-            if debug or debug_detailed: print("\tDone")
-            # Get next characters
-            rdb.execute(queries.getCharacterByRyu(rn))
-            results = [c[0] for c in rdb.fetchall()]
-        if debug or debug_detailed: print("Done")
-
-def fill_db(debug: bool=False, debug_detailed: bool=False) -> None:
-    """Fill the database with data based on local text files found in `main.PATH`.
-    
-    After connecting to the database, each text file in `main.PATH` is 
-    parsed for information. This information is parsed under the assumption
-    that each file follows the convention that the file's `title`.txt is the
-    game's `title`, the first line of the text file is the game's 
-    `release_date`, and each subsequent line is the `name` of a character
-    that appears in that game.
-
-    After all the "raw data" is inserted, the relations are updated using 
-    the `updateRelations()` method.
-
-    NOTE: This code is set to run under the implication that the database
-          has already been initialized.
-
-    Parameters
-    ----------
-    debug: bool
-        Whether or not to print debug statements for if files are being read.
-    debug_detailed: bool
-        Whether or not to print detailed debug statements for every game being
-        parsed.
-    """
-    with RyuConnector() as rdb:
-        # Start reading files and adding data
-        if debug or debug_detailed: print("Reading files...")
-
-        for filename in fm.getGameFiles():
-
-            if debug_detailed: print(f"\tReading {filename}...")
-
-            data = fm.parseGameFile(filename)
-            rdb.execute(queries.insertGame(data["game"][0], data["game"][1]))
-            # Get priority inserts
-            rdb.execute(queries.getCharactersByNames(tuple(data["game_characters"])))
-            priorityInserts = [c[0] for c in rdb.fetchall()]     # Names of characters who already exist in db (to insert FIRST)
-            for x in priorityInserts:
-                if x in data["game_characters"]:
-                    data["game_characters"].remove(x)
-            for c in priorityInserts:
-                rdb.execute(queries.insertRelation(c, data["game"][0]))
-            # Insert the remainder of characters
-            for c in data["game_characters"]:
-                rdb.execute(queries.insertCharacter(c))
-                rdb.execute(queries.insertRelation(c, data["game"][0]))
-        # Insert the aliases as well
-        if debug or debug_detailed: print("Adding aliases...")
-
-        for alias in fm.parseAliases():
-            rdb.execute(queries.insertAlias(alias['cname'], alias['aname']))
-
-        if debug or debug_detailed: print("Raw data inserted successfully.")
-    
-    updateRelations(debug, debug_detailed)
-
-def reset_db(debug: bool=False, debug_detailed: bool=False) -> None:
-    """Re-initialize the entire database in memory.
-    
-    The command will drop the entire schema, then reinitialize the database
-    and reinsert all files.
-    """
-    with RyuConnector() as rdb:
-        rdb.execute("DROP SCHEMA IF EXISTS ryu_number")
-    # Now refill the whole db
-    initialize_db(debug, debug_detailed)
-    fill_db(debug, debug_detailed)
\ No newline at end of file
+"""Module for maintaining and updating the database.
+
+The methods held within this module are used to update the relations of
+the database, fill the database with data, and reset the entire 
+database. Each method's documentation describes it in greater detail.
+
+Most methods take two parameters (namely, debug and debug_detailed)
+which determine whether or not to print debug statements, and if so,
+how detailed to be with them. Every method that writes to the database
+invalidates whatever the read cache holds of what it changed.
+
+Methods
+-------
+bulkInsert(RyuConnector.cursor, str, List[tuple]) -> None
+    Run a parameterized query over many rows, in batches.
+writeRyuNumbers(RyuConnector.cursor, RyuGraph) -> None
+    Write every Ryu Number held by a graph to the database in bulk.
+updateRelations(bool, bool) -> None
+    Update the Ryu Numbers of each character and game in the database.
+fill_db(bool, bool) -> None
+    Fill the database with data based on local text files found in `config.GAMES_PATH`.
+loadGraph(RyuGraph, List[Tuple[str, str]], bool, bool) -> None
+    Load a graph whose Ryu Numbers are already computed into the database in bulk.
+export_snapshot(str | None, bool, bool) -> None
+    Write the entire database to a single snapshot file.
+reset_db(bool, bool) -> None
+    Re-initialize the entire database in memory.
+restore_db(str | None, bool, bool) -> None
+    Re-initialize the entire database from a snapshot file.
+"""
+
+from typing import List, Optional, Tuple
+
+from classes import file_manager as fm
+from init import initialize_db
+from classes.ryu_connector import RyuConnector, closePools
+from classes.name_index import fold
+from classes.ryu_graph import RyuGraph
+from classes.ryu_cache import RYU_NUMBERS
+from classes.ryu_snapshot import RyuSnapshot
+from methods import queries, ryu_database
+
+
+BULK_BATCH_SIZE = 1000  # How many rows to send per statement when writing in bulk
+
+
+def bulkInsert(rdb, query: str, rows: List[tuple]) -> None:
+    """Run a parameterized query over many rows, `BULK_BATCH_SIZE` rows at a time.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    query: str
+        A parameterized query, such as those found under the bulk load
+        queries of `methods.queries`.
+    rows: List[tuple]
+        The parameters to run the query with, one tuple per row.
+    """
+    for i in range(0, len(rows), BULK_BATCH_SIZE):
+        rdb.executemany(query, rows[i:i + BULK_BATCH_SIZE])
+
+def writeRyuNumbers(rdb, graph: RyuGraph) -> None:
+    """Write every Ryu Number held by a graph to the database in bulk.
+
+    The numbers are loaded into a temporary table in batches of
+    `BULK_BATCH_SIZE` rows, and then copied into the `game_character` and
+    `game` tables with one update statement each. Since neither table has
+    triggers, this does not cause any triggers to fire.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    graph: RyuGraph
+        A graph whose Ryu Numbers have already been computed.
+    """
+    rows = [("c", cname, rn) for cname, rn in graph.characterRN.items()]
+    rows.extend([("g", gtitle, rn) for gtitle, rn in graph.gameRN.items()])
+    rdb.execute(*queries.dropNewRyuNumbers())
+    rdb.execute(*queries.createNewRyuNumbers())
+    bulkInsert(rdb, queries.insertNewRyuNumbers(), rows)
+    rdb.execute(*queries.applyNewCharacterRyuNumbers())
+    rdb.execute(*queries.applyNewGameRyuNumbers())
+    rdb.execute(*queries.dropNewRyuNumbers())
+
+def updateRelations(debug: bool=False, debug_detailed: bool=False) -> None:
+    """Update the Ryu Numbers of each character and game in the database.
+    
+    The method loads every character, game, and relation into an in-memory
+    `RyuGraph`, computes every Ryu Number with a single breadth-first search
+    from Ryu, and writes the results back in bulk. Anything that can no
+    longer be linked to Ryu is given a Ryu Number of `UNLINKED_RN`.
+
+    Parameters
+    ----------
+    debug: bool
+        Whether or not to print debug statements. These include printing out how
+        many characters and games have each Ryu Number.
+    debug_detailed: bool
+        Whether or not to print detailed debug statements. This includes every
+        normal debug statements, as well as indicating every character name and
+        game title that is updated
+    """
+    with RyuConnector() as rdb:
+        if debug or debug_detailed: print("Loading relations...")
+        graph = RyuGraph.fromDatabase(rdb)
+        rdb.execute(*queries.getAllCharacters())
+        oldCharacterRN = {row[0]: row[1] for row in rdb.fetchall()}
+        rdb.execute(*queries.getAllGames())
+        oldGameRN = {row[0]: row[1] for row in rdb.fetchall()}
+        if debug or debug_detailed: print(f"Computing Ryu Numbers for {len(graph.characterGames)} characters and {len(graph.gameCharacters)} games...")
+        graph.computeRyuNumbers()
+        if debug or debug_detailed:
+            for rn, (numCharacters, numGames) in sorted(graph.countByRyuNumber().items()):
+                print(f"\tRyu Number {rn}: {numCharacters} characters, {numGames} games")
+        if debug_detailed:
+            for cname, rn in graph.characterRN.items():
+                print(f"\tAdjusting {cname} ({rn})...")
+            for gtitle, rn in graph.gameRN.items():
+                print(f"\tAdjusting {gtitle} ({rn})...")
+        if debug or debug_detailed: print("Writing Ryu Numbers...")
+        writeRyuNumbers(rdb, graph)
+    # Only what actually changed needs to leave the read cache
+    changedCharacters = [c for c, rn in graph.characterRN.items() if oldCharacterRN.get(c) != rn]
+    changedGames = [g for g, rn in graph.gameRN.items() if oldGameRN.get(g) != rn]
+    if changedCharacters or changedGames:
+        ryu_database.invalidate(changedCharacters, changedGames, aggregates=[RYU_NUMBERS])
+    if debug or debug_detailed: print("Done")
+
+def fill_db(debug: bool=False, debug_detailed: bool=False) -> None:
+    """Fill the database with data based on local text files found in `config.GAMES_PATH`.
+    
+    Every text file in `config.GAMES_PATH` is parsed up front into an in-memory
+    `RyuGraph`. Each file is parsed under the assumption that it follows the
+    convention that the file's `title`.txt is the game's `title`, the first
+    line of the text file is the game's `release_date`, and each subsequent
+    line is the `name` of a character that appears in that game. Duplicate
+    characters and relations are merged by the graph.
+
+    Every Ryu Number is then computed with a single pass over the graph, so
+    that each table can be loaded in bulk with its final values, with the
+    database's triggers disabled for the duration of the load.
+
+    NOTE: This code is set to run under the implication that the database
+          has already been initialized.
+
+    Parameters
+    ----------
+    debug: bool
+        Whether or not to print debug statements for if files are being read.
+    debug_detailed: bool
+        Whether or not to print detailed debug statements for every game being
+        parsed.
+    """
+    # Parse everything before touching the database
+    if debug or debug_detailed: print("Reading files...")
+    graph = RyuGraph.fromFiles()
+    aliases = fm.getAliasIndex()
+    if debug_detailed:
+        for gtitle in graph.gameCharacters:
+            print(f"\tRead {gtitle} ({len(graph.gameCharacters[gtitle])} characters)")
+    if debug or debug_detailed: print(f"Computing Ryu Numbers for {len(graph.characterGames)} characters and {len(graph.gameCharacters)} games...")
+    graph.computeRyuNumbers()
+    loadGraph(graph, aliases.pairs() if aliases else [], debug, debug_detailed)
+
+def loadGraph(graph: RyuGraph, aliases: List[Tuple[str, str]], debug: bool=False, debug_detailed: bool=False) -> None:
+    """Load a graph whose Ryu Numbers are already computed into the database in bulk.
+
+    Each table is loaded with batched inserts, with the database's triggers
+    disabled for the duration of the load.
+
+    Parameters
+    ----------
+    graph: RyuGraph
+        A graph whose Ryu Numbers have already been computed.
+    aliases: List[Tuple[str, str]]
+        Every alias to insert, as `(cname, aname)` tuples.
+    debug: bool
+        Whether or not to print debug statements for each table being loaded.
+    debug_detailed: bool
+        Whether or not to print detailed debug statements. There are currently
+        no more detailed statements than the normal debug statements.
+    """
+    with RyuConnector() as rdb:
+        rdb.execute(*queries.disableTriggers())
+        try:
+            if debug or debug_detailed: print("Inserting characters...")
+            bulkInsert(rdb, queries.insertCharacters(), list(graph.characterRN.items()))
+            if debug or debug_detailed: print("Inserting games...")
+            bulkInsert(rdb, queries.insertGames(), [(gtitle, rn, graph.releaseDates.get(gtitle)) for gtitle, rn in graph.gameRN.items()])
+            # Relations refer to characters and games by the IDs they were just
+            # given, looked up the way the database compares names
+            rdb.execute(*queries.getCharacterIds())
+            characterIds = {fold(cname): cid for cname, cid in rdb.fetchall()}
+            rdb.execute(*queries.getGameIds())
+            gameIds = {fold(gtitle): gid for gtitle, gid in rdb.fetchall()}
+            if debug or debug_detailed: print("Inserting relations...")
+            bulkInsert(rdb, queries.insertRelations(), [(characterIds[fold(cname)], gameIds[fold(gtitle)]) for cname, games in graph.characterGames.items() for gtitle in games])
+            if debug or debug_detailed: print("Adding aliases...")
+            bulkInsert(rdb, queries.insertAliases(), sorted({(characterIds[fold(cname)], aname) for cname, aname in aliases if fold(cname) in characterIds}))
+        finally:
+            rdb.execute(*queries.enableTriggers())    # The connection goes back to the pool, so don't leave them off
+
+        if debug or debug_detailed: print("Raw data inserted successfully.")
+    ryu_database.getBackend().invalidate()
+
+def export_snapshot(path: Optional[str]=None, debug: bool=False, debug_detailed: bool=False) -> None:
+    """Write the entire database to a single snapshot file.
+
+    The snapshot holds every character, game, relation, alias, and Ryu Number
+    currently in the database, and can be loaded back with `restore_db()`.
+    The Ryu Numbers written are those stored in the database. By default,
+    the snapshot is written to `file_manager.SNAPSHOT_FILE`.
+    """
+    if path is None: path = fm.SNAPSHOT_FILE
+    with RyuConnector() as rdb:
+        if debug or debug_detailed: print("Loading database...")
+        graph = RyuGraph.fromDatabase(rdb)
+        rdb.execute(*queries.getAllCharacters())
+        graph.characterRN = {row[0]: row[1] for row in rdb.fetchall()}
+        rdb.execute(*queries.getAllGames())
+        graph.gameRN = {row[0]: row[1] for row in rdb.fetchall()}
+        rdb.execute(*queries.getAllAliases())
+        aliases = [(row[0], row[1]) for row in rdb.fetchall()]
+    if debug or debug_detailed: print(f"Writing snapshot to {path}...")
+    RyuSnapshot.write(path, graph, aliases)
+    if debug or debug_detailed: print("Done")
+
+def reset_db(debug: bool=False, debug_detailed: bool=False) -> None:
+    """Re-initialize the entire database in memory.
+    
+    The command will drop the entire schema, then reinitialize the database
+    and reinsert all files.
+    """
+    with RyuConnector() as rdb:
+        rdb.execute("DROP SCHEMA IF EXISTS ryu_number")
+    closePools()    # Pooled connections still point at the dropped schema
+    ryu_database.getBackend().invalidate()
+    # Now refill the whole db
+    initialize_db(debug, debug_detailed)
+    fill_db(debug, debug_detailed)
+
+def restore_db(path: Optional[str]=None, debug: bool=False, debug_detailed: bool=False) -> None:
+    """Re-initialize the entire database from a snapshot file.
+
+    This works like `reset_db()`, except that the data (and every Ryu Number)
+    is read from a snapshot written by `export_snapshot()`, rather than
+    parsed from the local text files and recomputed. By default, the
+    snapshot is read from `file_manager.SNAPSHOT_FILE`.
+    """
+    if path is None: path = fm.SNAPSHOT_FILE
+    if debug or debug_detailed: print(f"Reading snapshot from {path}...")
+    with RyuSnapshot(path) as snapshot:
+        graph = snapshot.toGraph()
+        aliases = snapshot.aliases()
+    with RyuConnector() as rdb:
+        rdb.execute("DROP SCHEMA IF EXISTS ryu_number")
+    closePools()    # Pooled connections still point at the dropped schema
+    ryu_database.getBackend().invalidate()
+    initialize_db(debug, debug_detailed)
+    loadGraph(graph, aliases, debug, debug_detailed)
\ No newline at end of file
@@ -0,0 +1,350 @@
+"""Module for upgrading the schema of an existing database in place.
+
+The schema created by `init.initialize_db()` is version 0. Every change
+made to it since is a migration, applied in order of version, and each
+applied migration is recorded in the `schema_version` table. Migrating
+a database therefore only applies what it is missing, so it is safe to
+run on a brand-new database, and on one created by any older version.
+Each migration also checks for what it creates before creating it, so
+that a migration interrupted midway can simply be run again.
+
+Methods
+-------
+getVersion(RyuConnector.cursor) -> int
+    Return the version of the database's schema.
+migrate(bool, bool) -> int
+    Apply every migration the database is missing.
+explainQueries(RyuConnector.cursor) -> Dict[str, List[tuple]]
+    Return the plan MySQL uses for each of the most frequent queries.
+fullScans(Dict[str, List[tuple]], bool) -> List[str]
+    Return the name of every plan that scans an entire table.
+checkQueryPlans(bool) -> List[str]
+    Return every frequent query whose plan scans an entire table.
+"""
+
+from typing import Callable, Dict, List, NamedTuple
+
+from classes.ryu_connector import RyuConnector
+from methods import queries
+
+
+NO_SUCH_TABLE = 1146    # The error number MySQL raises when a table doesn't exist
+
+
+class Migration(NamedTuple):
+    """A change to the schema of the database.
+
+    Attributes
+    ----------
+    version: int
+        The version of the schema once the migration has been applied.
+    description: str
+        What the migration changes.
+    apply: Callable[[RyuConnector.cursor], None]
+        Applies the migration, using the cursor it is passed.
+    """
+    version: int
+    description: str
+    apply: Callable[..., None]
+
+
+def exists(rdb, query: queries.Query) -> bool:
+    """Return whether a schema query, such as `queries.getIndex()`, finds what it checks for."""
+    rdb.execute(*query)
+    return bool(rdb.fetchall()[0][0])
+
+def addIndex(rdb, table: str, index: str, columns: str) -> None:
+    """Add an index to a table of the database, unless it already has it.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    table: str
+        The table to add the index to.
+    index: str
+        The name of the index.
+    columns: str
+        The columns of the index, in order, e.g. "gtitle, cname".
+    """
+    if exists(rdb, queries.getIndex(table, index)): return
+    rdb.execute(f"ALTER TABLE {table} ADD INDEX {index} ({columns});")
+
+def addSecondaryIndexes(rdb) -> None:
+    """Index every column that frequent queries filter on, other than a primary key.
+
+    InnoDB stores the primary key in every secondary index, so each of
+    these indexes covers every column its queries select.
+    """
+    # getCharacterByRyu(), getNumCharactersWithRN(), and getStats()
+    addIndex(rdb, "game_character", "character_rn", "ryu_number")
+    # getGamesByRyu(), getNumGamesWithRN(), and getStats()
+    addIndex(rdb, "game", "game_rn", "ryu_number, release_date")
+    # getCharactersByGame(), getRelationsByGame(), and removing a game
+    addIndex(rdb, "appears_in", "appears_in_gtitle", "gtitle, cname")
+    # getNameFromAlias(), getCharacterByAlias(), removeAlias(), and updateAlias()
+    addIndex(rdb, "alias", "alias_aname", "aname, cname")
+
+
+def addKeysetIndexes(rdb) -> None:
+    """Index Ryu Numbers together with names and titles, to page through them in order.
+
+    The new index on characters starts with the same column as
+    `character_rn`, so it takes that index's place.
+    """
+    # getCharacterByRyuPage(), getCharacterByRyu(), getNumCharactersWithRN(), and getStats()
+    addIndex(rdb, "game_character", "character_rn_name", "ryu_number, name")
+    if exists(rdb, queries.getIndex("game_character", "character_rn")):
+        rdb.execute("ALTER TABLE game_character DROP INDEX character_rn;")
+    # getGamesByRyuPage()
+    addIndex(rdb, "game", "game_rn_title", "ryu_number, title")
+
+
+def ryuNumberTrigger(name: str, event: str) -> str:
+    """Return a statement that creates a trigger to set Ryu Numbers as `appears_in` relations change.
+
+    Parameters
+    ----------
+    name: str
+        The name of the trigger.
+    event: str
+        The event the trigger fires after, e.g. "INSERT".
+    """
+    return (f"CREATE TRIGGER {name} AFTER {event} ON appears_in "
+            f"FOR EACH ROW "
+            f"BEGIN "
+                f"IF @disable_triggers IS NULL THEN "   # Bulk loads set this to skip the triggers
+                    f"IF (SELECT ryu_number FROM game WHERE id=NEW.gid) > (SELECT ryu_number FROM game_character WHERE id=NEW.cid) THEN "
+                        f"UPDATE game "
+                        f"SET ryu_number=("
+                            f"SELECT ryu_number "
+                            f"FROM game_character "
+                            f"WHERE id=NEW.cid)+1 "
+                        f"WHERE id=NEW.gid; "
+                    f"ELSEIF (SELECT ryu_number FROM game_character WHERE id=NEW.cid) > (SELECT ryu_number FROM game WHERE id=NEW.gid) THEN "
+                        f"UPDATE game_character "
+                        f"SET ryu_number=("
+                            f"SELECT ryu_number "
+                            f"FROM game "
+                            f"WHERE id=NEW.gid) "
+                        f"WHERE id=NEW.cid; "
+                    f"END IF; "
+                f"END IF; "
+            f"END;"
+    )
+
+def useIntegerIds(rdb) -> None:
+    """Give every character and game an integer ID, and have `appears_in` and `alias` refer to them by it.
+
+    The relation tables are rebuilt under a temporary name and swapped in,
+    since their primary keys change. Renaming a character or game then only
+    changes its own row, rather than cascading through every relation.
+    """
+    # Number every character and game
+    for table in ("game_character", "game"):
+        if not exists(rdb, queries.getColumn(table, "id")):
+            rdb.execute(f"ALTER TABLE {table} ADD COLUMN id INTEGER NOT NULL AUTO_INCREMENT UNIQUE FIRST;")
+    # Rebuild 'appears_in' with IDs
+    if exists(rdb, queries.getColumn("appears_in", "cname")):
+        rdb.execute("DROP TABLE IF EXISTS appears_in_by_id;")
+        rdb.execute(f"CREATE TABLE appears_in_by_id ("
+                        f"cid   INTEGER NOT NULL, "
+                        f"gid   INTEGER NOT NULL, "
+                        f"PRIMARY KEY (cid, gid), "
+                        f"INDEX appears_in_gid (gid, cid));"
+        )
+        rdb.execute(f"INSERT INTO appears_in_by_id (cid, gid) "
+                    f"SELECT C.id, G.id "
+                    f"FROM appears_in AS AI "
+                    f"JOIN game_character AS C ON C.name=AI.cname "
+                    f"JOIN game AS G ON G.title=AI.gtitle;"
+        )
+        rdb.execute("DROP TABLE appears_in;")
+    if exists(rdb, queries.getTable("appears_in_by_id")):
+        rdb.execute("RENAME TABLE appears_in_by_id TO appears_in;")
+    # Rebuild 'alias' with IDs
+    if exists(rdb, queries.getColumn("alias", "cname")):
+        rdb.execute("DROP TABLE IF EXISTS alias_by_id;")
+        rdb.execute(f"CREATE TABLE alias_by_id ("
+                        f"cid       INTEGER     NOT NULL, "
+                        f"aname     VARCHAR(64) NOT NULL, "
+                        f"PRIMARY KEY (cid, aname), "
+                        f"INDEX alias_aname (aname, cid), "
+                        f"FULLTEXT INDEX aname_ngram (aname) WITH PARSER ngram);"
+        )
+        rdb.execute(f"INSERT INTO alias_by_id (cid, aname) "
+                    f"SELECT C.id, A.aname "
+                    f"FROM alias AS A "
+                    f"JOIN game_character AS C ON C.name=A.cname;"
+        )
+        rdb.execute("DROP TABLE alias;")
+    if exists(rdb, queries.getTable("alias_by_id")):
+        rdb.execute("RENAME TABLE alias_by_id TO alias;")
+    # Key characters and games by ID, now that nothing refers to them by name
+    for table, column, index in (("game_character", "name", "character_name"), ("game", "title", "game_title")):
+        if not exists(rdb, queries.getIndex(table, index)):
+            rdb.execute(f"ALTER TABLE {table} "
+                        f"DROP PRIMARY KEY, "
+                        f"DROP INDEX id, "
+                        f"ADD PRIMARY KEY (id), "
+                        f"ADD UNIQUE INDEX {index} ({column});"
+            )
+    # Only deletions need to cascade, since IDs never change
+    for table, constraint, column, parent in (("appears_in", "appears_in_character", "cid", "game_character"),
+                                              ("appears_in", "appears_in_game", "gid", "game"),
+                                              ("alias", "alias_character", "cid", "game_character")):
+        if not exists(rdb, queries.getConstraint(table, constraint)):
+            rdb.execute(f"ALTER TABLE {table} "
+                        f"ADD CONSTRAINT {constraint} FOREIGN KEY ({column}) REFERENCES {parent}(id) "
+                            f"ON DELETE CASCADE;"
+            )
+    # Recreate the triggers, which were dropped along with the old 'appears_in'
+    rdb.execute("DROP TRIGGER IF EXISTS update_ai;")
+    rdb.execute("DROP TRIGGER IF EXISTS insert_ai;")
+    rdb.execute(ryuNumberTrigger("insert_ai", "INSERT"))
+    rdb.execute(ryuNumberTrigger("update_ai", "UPDATE"))
+
+
+# Every migration, in order of version
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Add secondary indexes", addSecondaryIndexes),
+    Migration(2, "Use integer IDs for characters and games", useIntegerIds),
+    Migration(3, "Index Ryu Numbers by name and title for paging", addKeysetIndexes),
+]
+SCHEMA_VERSION = MIGRATIONS[-1].version     # The version of the newest schema
+
+
+def getVersion(rdb) -> int:
+    """Return the version of the database's schema (0 if no migration has been applied).
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    """
+    try:
+        rdb.execute(*queries.getSchemaVersion())
+    except Exception as e:
+        if getattr(e, "errno", None) != NO_SUCH_TABLE: raise
+        return 0
+    version = rdb.fetchall()[0][0]
+    return int(version) if version is not None else 0
+
+def migrate(debug: bool=False, debug_detailed: bool=False) -> int:
+    """Apply every migration the database is missing, and return the version it ends up at.
+
+    Each migration is recorded as soon as it has been applied, since MySQL
+    commits every change to a table's structure immediately. Once anything
+    has changed, the tables are analyzed so that the optimizer knows about
+    any new index.
+    """
+    with RyuConnector() as rdb:
+        rdb.execute(f"CREATE TABLE IF NOT EXISTS schema_version ("
+                        f"version       INTEGER         NOT NULL, "
+                        f"description   VARCHAR(255), "
+                        f"applied_on    TIMESTAMP       DEFAULT CURRENT_TIMESTAMP, "
+                        f"PRIMARY KEY (version));"
+        )
+        version = getVersion(rdb)
+        if debug or debug_detailed: print(f"Database schema is at version {version} of {SCHEMA_VERSION}")
+        pending = [m for m in MIGRATIONS if m.version > version]
+        for migration in pending:
+            if debug or debug_detailed: print(f"Applying migration {migration.version} ({migration.description})...", end="")
+            migration.apply(rdb)
+            rdb.execute(*queries.insertSchemaVersion(migration.version, migration.description))
+            version = migration.version
+            if debug or debug_detailed: print("Done")
+        if pending:
+            rdb.execute("ANALYZE TABLE game_character, game, appears_in, alias;")
+            rdb.fetchall()
+    if debug_detailed:
+        for name in checkQueryPlans():
+            print(f"Warning: {name}() scans an entire table")
+    return version
+
+
+# Every query the migrations' indexes are meant to speed up, each with
+# example arguments to plan them with
+PLANNED_QUERIES: Dict[str, queries.Query] = {
+    # Characters
+    "getCharacterByName": queries.getCharacterByName("Ryu"),
+    "getCharactersByNames": queries.getCharactersByNames(("Ryu", "Ken")),
+    "getCharacterByRyu": queries.getCharacterByRyu(1),
+    "getNumCharactersWithRN": queries.getNumCharactersWithRN(1),
+    "getCharactersByGame": queries.getCharactersByGame("Street Fighter"),
+    "getCharacterByAlias": queries.getCharacterByAlias("Ryu"),
+    "removeCharacter": queries.removeCharacter("Ryu"),
+    # Games
+    "getGameByTitle": queries.getGameByTitle("Street Fighter"),
+    "getGamesByTitles": queries.getGamesByTitles(("Street Fighter", "Street Fighter II")),
+    "getGamesByCharacter": queries.getGamesByCharacter("Ryu"),
+    "getGamesByCharacters": queries.getGamesByCharacters(("Ryu", "Ken")),
+    "getFirstGamesByCharacters": queries.getFirstGamesByCharacters(("Ryu", "Ken"), 3),
+    "getGamesByRyu": queries.getGamesByRyu(1),
+    "getNumGamesWithRN": queries.getNumGamesWithRN(1),
+    "removeGame": queries.removeGame("Street Fighter"),
+    # Relations
+    "getRelationsByCharacter": queries.getRelationsByCharacter("Ryu"),
+    "getRelationsByGame": queries.getRelationsByGame("Street Fighter"),
+    "getRelationsAndRNByCharacters": queries.getRelationsAndRNByCharacters(("Ryu", "Ken")),
+    "getRelationsAndRNByGames": queries.getRelationsAndRNByGames(("Street Fighter", "Street Fighter II")),
+    "removeRelation": queries.removeRelation("Ryu", "Street Fighter"),
+    # Ryu Numbers
+    "getGameFromCharacter": queries.getGameFromCharacter("Ryu"),
+    "getCharacterFromGame": queries.getCharacterFromGame("Street Fighter"),
+    "getStatistics": queries.getStatistics(),
+    "getRNByCharacterNames": queries.getRNByCharacterNames(("Ryu", "Ken")),
+    "getRNByGameTitles": queries.getRNByGameTitles(("Street Fighter", "Street Fighter II")),
+    "updateCharactersRN": queries.updateCharactersRN(("Ryu", "Ken"), 1),
+    "updateGamesRN": queries.updateGamesRN(("Street Fighter", "Street Fighter II"), 1),
+    # Pages
+    "getCharacterByRyuPage": queries.getCharacterByRyuPage(1, "Ken", 100),
+    "getCharactersByGamePage": queries.getCharactersByGamePage("Street Fighter", "Ken", 100),
+    "getGamesByRyuPage": queries.getGamesByRyuPage(1, "Street Fighter", 100),
+    # Aliases
+    "getAliasesFromName": queries.getAliasesFromName("Ryu"),
+    "getAliasesFromNames": queries.getAliasesFromNames(("Ryu", "Ken")),
+    "getNameFromAlias": queries.getNameFromAlias("Ryu"),
+    "removeAlias": queries.removeAlias("Ryu"),
+    "updateAlias": queries.updateAlias("Ryu", "Ryu Hoshi"),
+}
+
+def explainQueries(rdb) -> Dict[str, List[tuple]]:
+    """Return the plan MySQL uses for each query of `PLANNED_QUERIES`, by name.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    """
+    plans: Dict[str, List[tuple]] = {}
+    for name, query in PLANNED_QUERIES.items():
+        rdb.execute(*queries.explain(query))
+        plans[name] = rdb.fetchall()
+    return plans
+
+def fullScans(plans: Dict[str, List[tuple]], debug: bool=False) -> List[str]:
+    """Return the name of every plan (as from `explainQueries()`) that scans an entire table.
+
+    A full scan shows up in a plan as an access type of "ALL". Only the
+    database's own tables are considered, since the temporary table a
+    derived table or union is read from (e.g. "<derived2>") is always read
+    in full.
+    """
+    scans: List[str] = []
+    for name, plan in plans.items():
+        for row in plan:
+            if debug: print(f"{name}: table={row[2]}, type={row[4]}, key={row[6]}")
+            if row[4] == "ALL" and row[2] and not row[2].startswith("<") and name not in scans:
+                scans.append(name)
+    return scans
+
+def checkQueryPlans(debug: bool=False) -> List[str]:
+    """Return the name of every query of `PLANNED_QUERIES` whose plan scans an entire table.
+
+    Since MySQL may prefer a full scan of a very small table over any index,
+    this is best checked against a filled database.
+    """
+    with RyuConnector() as rdb:
+        plans = explainQueries(rdb)
+    return fullScans(plans, debug)
@@ -0,0 +1,253 @@
+"""Module for incrementally maintaining Ryu Numbers as relations change.
+
+The database's triggers only correct the two ends of a relation when it
+is inserted, and nothing corrects the Ryu Numbers of anything that
+depended on a relation once it is removed. The methods in this module
+propagate those changes through the rest of the database, visiting only
+the characters and games whose Ryu Numbers are actually affected.
+
+Both methods expect to be given a cursor of the same connection that
+made the change, so that the propagation is committed alongside it. Both
+return the names and titles whose Ryu Numbers they changed.
+
+Methods
+-------
+propagateInsertion(RyuConnector.cursor, Iterable[str], Iterable[str]) -> Tuple[Set[str], Set[str]]
+    Lower the Ryu Numbers that new relations have shortened.
+propagateRemoval(RyuConnector.cursor, Iterable[str], Iterable[str]) -> Tuple[Set[str], Set[str]]
+    Recompute the Ryu Numbers that removed relations may have lengthened.
+neighboursOf(RyuConnector.cursor, Iterable[str], Iterable[str]) -> Tuple[Set[str], Set[str]]
+    Return everything related to the given characters and games.
+"""
+
+import heapq
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from classes.ryu_graph import UNLINKED_RN
+from methods import queries
+
+
+PROPAGATION_BATCH_SIZE = 500    # How many names to look up per query while propagating
+
+
+def _batches(names: Iterable[str]) -> Iterator[Tuple[str, ...]]:
+    """Split names into tuples of at most `PROPAGATION_BATCH_SIZE` elements."""
+    names = list(names)
+    for i in range(0, len(names), PROPAGATION_BATCH_SIZE):
+        yield tuple(names[i:i + PROPAGATION_BATCH_SIZE])
+
+def _gamesOf(rdb, cnames: Iterable[str]) -> List[Tuple[str, str, int]]:
+    """Return `(cname, gtitle, game's Ryu Number)` for every game of the characters."""
+    rows: List[Tuple[str, str, int]] = []
+    for batch in _batches(cnames):
+        rdb.execute(*queries.getRelationsAndRNByCharacters(batch))
+        rows.extend(rdb.fetchall())
+    return rows
+
+def _charactersOf(rdb, gtitles: Iterable[str]) -> List[Tuple[str, str, int]]:
+    """Return `(cname, gtitle, character's Ryu Number)` for every character of the games."""
+    rows: List[Tuple[str, str, int]] = []
+    for batch in _batches(gtitles):
+        rdb.execute(*queries.getRelationsAndRNByGames(batch))
+        rows.extend(rdb.fetchall())
+    return rows
+
+def _currentRN(rdb, cnames: Iterable[str], gtitles: Iterable[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Return the Ryu Numbers currently stored for the given characters and games."""
+    characters: Dict[str, int] = {}
+    games: Dict[str, int] = {}
+    for batch in _batches(set(cnames)):
+        rdb.execute(*queries.getRNByCharacterNames(batch))
+        characters.update({row[0]: row[1] for row in rdb.fetchall()})
+    for batch in _batches(set(gtitles)):
+        rdb.execute(*queries.getRNByGameTitles(batch))
+        games.update({row[0]: row[1] for row in rdb.fetchall()})
+    return characters, games
+
+def _writeRN(rdb, characters: Dict[str, int], games: Dict[str, int]) -> None:
+    """Store new Ryu Numbers, with one update per distinct number and batch."""
+    byRN: Dict[int, List[str]] = {}
+    for cname, rn in characters.items():
+        byRN.setdefault(rn, []).append(cname)
+    for rn, names in byRN.items():
+        for batch in _batches(names):
+            rdb.execute(*queries.updateCharactersRN(batch, rn))
+    byRN = {}
+    for gtitle, rn in games.items():
+        byRN.setdefault(rn, []).append(gtitle)
+    for rn, titles in byRN.items():
+        for batch in _batches(titles):
+            rdb.execute(*queries.updateGamesRN(batch, rn))
+
+def _relax(rdb, characters: Dict[str, int], games: Dict[str, int]) -> Tuple[Set[str], Set[str]]:
+    """Lower any Ryu Numbers that can be reached more quickly through the given nodes.
+
+    Starting from the given characters and games (whose Ryu Numbers are taken
+    to be correct), each round lowers the numbers of their neighbours where
+    possible, and the neighbours that changed become the next round's nodes.
+    Numbers are only ever lowered, so this stops as soon as nothing changes.
+    Returns the names and titles that were lowered.
+    """
+    changedCharacters: Set[str] = set()
+    changedGames: Set[str] = set()
+    while characters or games:
+        nextCharacters: Dict[str, int] = {}
+        nextGames: Dict[str, int] = {}
+        # A game is one step further than its characters
+        for cname, gtitle, grn in _gamesOf(rdb, characters):
+            target = characters[cname] + 1
+            if grn > target and target < nextGames.get(gtitle, grn):
+                nextGames[gtitle] = target
+        # A character is exactly as far as their games
+        for cname, gtitle, crn in _charactersOf(rdb, games):
+            target = games[gtitle]
+            if crn > target and target < nextCharacters.get(cname, crn):
+                nextCharacters[cname] = target
+        _writeRN(rdb, nextCharacters, nextGames)
+        changedCharacters.update(nextCharacters)
+        changedGames.update(nextGames)
+        characters, games = nextCharacters, nextGames
+    return changedCharacters, changedGames
+
+def propagateInsertion(rdb, cnames: Iterable[str], gtitles: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """Lower the Ryu Numbers that new relations have shortened.
+
+    This should be called after inserting `appears_in` relations between
+    the given characters and games. Only the characters and games whose Ryu
+    Numbers decrease are visited.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    cnames: Iterable[str]
+        The names of the characters whose relations were inserted.
+    gtitles: Iterable[str]
+        The titles of the games whose relations were inserted.
+
+    Returns
+    -------
+    Tuple[Set[str], Set[str]]
+        The names of the characters and titles of the games whose Ryu Numbers
+        were lowered.
+    """
+    characters, games = _currentRN(rdb, cnames, gtitles)
+    return _relax(rdb, characters, games)
+
+def propagateRemoval(rdb, cnames: Iterable[str], gtitles: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """Recompute the Ryu Numbers that removed relations may have lengthened.
+
+    This should be called after removing relations (or whole characters or
+    games), and be passed every remaining character and game that was on
+    the other end of a removed relation.
+
+    A character keeps their Ryu Number as long as they still appear in a
+    game with the same number, and a game keeps its Ryu Number as long as
+    one of its characters still has a number one lower. Starting from the
+    given nodes, anything that loses that support is invalidated, along with
+    anything that depended on it in turn. Only that region is then
+    recomputed, starting from the valid nodes that border it.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    cnames: Iterable[str]
+        The names of characters who lost a relation.
+    gtitles: Iterable[str]
+        The titles of games that lost a relation.
+
+    Returns
+    -------
+    Tuple[Set[str], Set[str]]
+        The names of the characters and titles of the games whose Ryu Numbers
+        were recomputed.
+    """
+    characters, games = _currentRN(rdb, cnames, gtitles)
+    # Candidates are visited in order of Ryu Number, with games before characters
+    # of the same number, so everything a candidate relies on has already been settled
+    GAME, CHARACTER = 0, 1
+    heap: List[Tuple[int, int, str]] = []
+    for cname, rn in characters.items():
+        heapq.heappush(heap, (rn, CHARACTER, cname))
+    for gtitle, rn in games.items():
+        heapq.heappush(heap, (rn, GAME, gtitle))
+    seen: Set[Tuple[int, str]] = set()
+    invalidCharacters: Dict[str, List[Tuple[str, int]]] = {}   # name -> [(gtitle, game's Ryu Number)]
+    invalidGames: Dict[str, List[Tuple[str, int]]] = {}        # title -> [(cname, character's Ryu Number)]
+    while heap:
+        rn, kind, _ = heap[0]
+        batch: List[str] = []
+        while heap and heap[0][:2] == (rn, kind):
+            name = heapq.heappop(heap)[2]
+            if (kind, name) not in seen:
+                seen.add((kind, name))
+                batch.append(name)
+        # Ryu himself, and anything unlinked, can never lose support
+        if rn == 0 or rn >= UNLINKED_RN:
+            continue
+        if kind == GAME:
+            neighbours: Dict[str, List[Tuple[str, int]]] = {}
+            for cname, gtitle, crn in _charactersOf(rdb, batch):
+                neighbours.setdefault(gtitle, []).append((cname, crn))
+            for gtitle in batch:
+                rows = neighbours.get(gtitle, [])
+                if any(crn == rn - 1 and cname not in invalidCharacters for cname, crn in rows):
+                    continue
+                invalidGames[gtitle] = rows
+                for cname, crn in rows:
+                    if crn == rn:
+                        heapq.heappush(heap, (rn, CHARACTER, cname))
+        else:
+            neighbours = {}
+            for cname, gtitle, grn in _gamesOf(rdb, batch):
+                neighbours.setdefault(cname, []).append((gtitle, grn))
+            for cname in batch:
+                rows = neighbours.get(cname, [])
+                if any(grn == rn and gtitle not in invalidGames for gtitle, grn in rows):
+                    continue
+                invalidCharacters[cname] = rows
+                for gtitle, grn in rows:
+                    if grn == rn + 1:
+                        heapq.heappush(heap, (rn + 1, GAME, gtitle))
+    if not invalidCharacters and not invalidGames:
+        return set(), set()
+    # Unlink the invalidated region, then refill it from the valid nodes bordering it
+    _writeRN(rdb, {c: UNLINKED_RN for c in invalidCharacters}, {g: UNLINKED_RN for g in invalidGames})
+    borderCharacters: Dict[str, int] = {}
+    borderGames: Dict[str, int] = {}
+    for rows in invalidGames.values():
+        for cname, crn in rows:
+            if cname not in invalidCharacters and crn < UNLINKED_RN:
+                borderCharacters[cname] = crn
+    for rows in invalidCharacters.values():
+        for gtitle, grn in rows:
+            if gtitle not in invalidGames and grn < UNLINKED_RN:
+                borderGames[gtitle] = grn
+    _relax(rdb, borderCharacters, borderGames)
+    return set(invalidCharacters), set(invalidGames)
+
+def neighboursOf(rdb, cnames: Iterable[str], gtitles: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """Return everything related to the given characters and games.
+
+    This is meant to be called before removing whole characters or games,
+    to find what to pass to `propagateRemoval()` once they are gone.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    cnames: Iterable[str]
+        The names of the characters whose games to return.
+    gtitles: Iterable[str]
+        The titles of the games whose characters to return.
+
+    Returns
+    -------
+    Tuple[Set[str], Set[str]]
+        The names of every character in the given games, and the titles of
+        every game of the given characters.
+    """
+    titles = {gtitle for _, gtitle, _ in _gamesOf(rdb, cnames)}
+    names = {cname for cname, _, _ in _charactersOf(rdb, gtitles)}
+    return names, titles
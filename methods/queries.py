@@ -1,575 +1,928 @@
-"""Module for storing query strings for interacting with the database.
-
-All methods within the class return a string that, when executed as an
-SQL query, perform the task specified by the method signature and
-docstring. In addition, a decorator function is used to properly
-sanitize inputs to prevent SQL injection or invalid data.
-
-All method parameters will relate either directly to a field in the
-database, or be self-explanatory. For those that are not self-
-explanatory, refer to them below:
-
-cname -- The `name` field of either the `game_character` table, or the
-         `cname` field of the `appears_in` table.
-gtitle -- The `title` field of either the `game` table, or the `gtitle`
-          field of the `appears_in` table.
-rn -- The `ryu_number` of either the `game` or `game_character` table.
-
-Each method takes the form of <action><object>[specifications], where
-<action> includes (insert, get, remove, update), <object> includes
-(Character, Game, Relation, etc.), and specifications are things like 
-(ByName, ByGame, ByRyu, etc.).
-"""
-
-from typing import Callable, Tuple
-
-
-ALL_GAME_CHARACTER = "name, ryu_number"
-ALL_GAME = "title, ryu_number, release_date"
-ALL_APPEARS_IN = "cname, gtitle"
-ALL_ALIAS = "cname, aname"
-
-def sanitize_inputs(func: Callable) -> Callable:
-    """Decorator to prepare data for SQL insertion.
-    
-    This allows for data to be entered with apostrophes, which would
-    ordinarily allow for incorrect syntax or code injection.
-    """
-    def wrapper(*args, **kwargs):
-        newargs = []
-        newkwargs = {}
-        # Sanitize args: list[any]
-        for arg in args:
-            if isinstance(arg, str):        # if string, ' -> ''
-                newargs.append(arg.replace("'", "''"))
-            elif isinstance(arg, tuple):    # if tuple,  ' -> '' for each item in the tuple
-                newargs.append(tuple([a.replace("'", "''") for a in arg]))
-            else:
-                newargs.append(arg)
-        # Sanitize kwargs: dict[str, any] (any is what we want to sanitize)
-        for karg, warg in kwargs.items():
-            if isinstance(warg, str):       # if string, ' -> ''
-                newkwargs[karg] = warg.replace("'", "''")
-            elif isinstance(warg, tuple):   # if tuple,  ' -> '' for each item in the tuple
-                newkwargs[karg] = tuple([w.replace("'", "''") for w in list(warg)])
-            else:
-                newkwargs[karg] = warg
-        return_val = func(*newargs, **newkwargs)
-        return return_val
-
-    return wrapper
-
-#===================#
-# CHARACTER QUERIES #
-#===================#
-@sanitize_inputs
-def insertCharacter(cname: str) -> str: 
-    """Return a query to insert a character into the database."""
-    return (f"INSERT IGNORE INTO game_character (name) "
-            f"VALUES ('{cname}');"
-    )
-
-@sanitize_inputs
-def getCharacterLikeName(cname: str) -> str: 
-    """Return a query to get a character whose name resembles the passed arg.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (# First result should be exact matches
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '{cname}' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '{cname}' "
-
-            f"UNION "
-
-            # Next result should be matching word, but with brackets
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '{cname} (%)' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '{cname} (%)' "
-
-            f"UNION "
-
-            # Next match first word of name
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '{cname} %' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '{cname} %' "
-
-            f"UNION "
-
-            # Next match the last word
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '% {cname}' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '% {cname}' "
-
-            f"UNION "
-
-            # Next match a middle word
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '% {cname} %' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '% {cname} %' "
-
-            f"UNION "
-
-            # Next match start of a word
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '{cname}%' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '{cname}%' "
-
-            f"UNION "
-
-            # Next match beginning of *a* word
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '% {cname}%' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '% {cname}%' "
-
-            f"UNION "
-
-            # Last result is substrings
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name LIKE '%{cname}%' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname LIKE '%{cname}%' "
-            f"LIMIT 1000"
-    )
-
-@sanitize_inputs
-def getCharacterByName(cname: str) -> str: 
-    """Return a query to retrieve a character in the database.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name='{cname}' "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname='{cname}';"
-    )
-
-@sanitize_inputs
-def getCharactersByNames(cnames: Tuple) -> str: 
-    """Return a query to retrieve multiple characters in the database.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE name IN {cnames} "
-            f"UNION "
-            f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"JOIN alias ON name=cname "
-            f"WHERE aname IN {cnames} "
-            f"ORDER BY ryu_number ASC;"
-    )
-
-@sanitize_inputs
-def getCharactersByGame(gtitle: str) -> str: 
-    """Return a query to retrieve all characters who appear in the given game.
-
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character, appears_in "
-            f"WHERE appears_in.cname=game_character.name AND appears_in.gtitle='{gtitle}';"
-    )
-
-@sanitize_inputs
-def getCharacterByRyu(rn: int) -> str: 
-    """Return a query to get all characters who have the given Ryu Number.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (f"SELECT {ALL_GAME_CHARACTER} "
-            f"FROM game_character "
-            f"WHERE ryu_number={rn};"
-    )
-
-@sanitize_inputs
-def getCharacterByAlias(aname: str) -> str:
-    """Return a query to get a character with a given alias.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (f"SELECT DISTINCT {ALL_GAME_CHARACTER} "
-            f"FROM game_character AS C, alias AS A "
-            f"WHERE aname='{aname}';"
-    )
-
-@sanitize_inputs
-def getCharactersLikeAlias(aname: str) -> str:
-    """Return a query to get a character with a similar alias.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_GAME_CHARACTER`.
-    """
-    return (f"SELECT DISTINCT {ALL_GAME_CHARACTER} "
-            f"FROM game_character AS C, alias AS A "
-            f"WHERE aname LIKE '%{aname}%';"
-    )
-
-@sanitize_inputs
-def removeCharacter(cname: str) -> str: 
-    """Return a query to remove a given character from the database."""
-    return (f"DELETE FROM game_character "
-            f"WHERE name='{cname}';"
-    )
-
-@sanitize_inputs
-def updateCharacterName(old_name: str, new_name: str) -> str: 
-    """Return a query to update a given character's name."""
-    return (f"UPDATE game_character "
-            f"SET name='{new_name}' "
-            f"WHERE name='{old_name}';"
-    )
-
-def getNumCharacters() -> str:
-    """Return a query to retrieve the count of all characters in the database.
-    
-    The resulting tuple is of the form: `(COUNT(*): int,)`
-    """
-    return f"SELECT COUNT(*) FROM game_character;"
-
-
-#==============#
-# GAME QUERIES #
-#==============#
-@sanitize_inputs
-def insertGame(gtitle: str, release_date: str="0000-00-00") -> str: 
-    """Return a query to insert a game into the database."""
-    return (f"INSERT IGNORE INTO game (title, release_date) "
-            f"VALUES ('{gtitle}', '{release_date}');"
-    )
-
-@sanitize_inputs
-def getGameLikeTitle(gtitle: str) -> str: 
-    """Return a query to get games whose titles are similar to the passed arg.
-    
-    The resulting tuple gets fields from, and in order of `ALL_GAME`.
-    """
-    return (f"SELECT {ALL_GAME} "
-            f"FROM game "
-            f"WHERE title LIKE '%{gtitle}%' "
-            f"ORDER BY release_date ASC, ryu_number ASC;"
-    )
-
-@sanitize_inputs
-def getGameByTitle(gtitle: str) -> str: 
-    """Return a query to get a specific game from the database.
-
-    The resulting tuple gets fields from, and in order of `ALL_GAME`.
-    """
-    return (f"SELECT {ALL_GAME} "
-            f"FROM game "
-            f"WHERE title='{gtitle}';"
-    )
-
-@sanitize_inputs
-def getGamesByTitles(gtitles: Tuple) -> str: 
-    """Return a query to get games from a given tuple of titles.
-    
-    The resulting tuple gets fields from, and in order of `ALL_GAME`.
-    """
-    return (f"SELECT {ALL_GAME} "
-            f"FROM game "
-            f"WHERE title IN {gtitles} "
-            f"ORDER BY ryu_number ASC;"
-    )
-
-@sanitize_inputs
-def getGamesByCharacter(cname: str) -> str: 
-    """Return a query to get all the games a given character appears in.
-    
-    The resulting tuple gets fields from, and in order of `ALL_GAME`.
-    """
-    return (f"SELECT {ALL_GAME} "
-            f"FROM appears_in, game "
-            f"WHERE appears_in.cname='{cname}' AND appears_in.gtitle=game.title "
-            f"ORDER BY release_date ASC;"
-    )
-
-@sanitize_inputs
-def getGamesByRyu(rn: int) -> str: 
-    """Return a query to get all games with a given Ryu Number.
-    
-    The resulting tuple gets fields from, and in order of `ALL_GAME`.
-    """
-    return (f"SELECT {ALL_GAME} "
-            f"FROM game "
-            f"WHERE ryu_number={rn};"
-    )
-
-@sanitize_inputs
-def removeGame(gtitle: str) -> str: 
-    """Return a query to remove a given game from the database."""
-    return (f"DELETE FROM game "
-            f"WHERE title='{gtitle}';"
-    )
-
-@sanitize_inputs
-def updateGameTitle(old_title: str, new_title: str) -> str: 
-    """Return a query to update the title of a given game."""
-    return (f"UPDATE game "
-            f"SET title='{new_title}' "
-            f"WHERE title='{old_title}';"
-    )
-
-@sanitize_inputs
-def updateGameReleaseDate(gtitle: str, new_rdate: str) -> str: 
-    """Return a query to update the release date of a given game."""
-    return (f"UPDATE game "
-            f"SET release_date='{new_rdate}' "
-            f"WHERE title='{gtitle}';"
-    )
-
-def getNumGames() -> str:
-    """Return a query to retrieve the count of all games in the database.
-    
-    The resulting tuple is of the form: `(COUNT(*): int,)`
-    """
-    return "SELECT COUNT(*) FROM game;"
-
-
-#==================#
-# RELATION QUERIES #
-#==================#
-@sanitize_inputs
-def insertRelation(cname: str, gtitle: str) -> str: 
-    """Return a query to insert an `appears_in` relation to the database."""
-    return (f"INSERT IGNORE INTO appears_in (cname, gtitle) "
-            f"VALUES ('{cname}', '{gtitle}');"
-    )
-
-@sanitize_inputs
-def getRelationsByCharacter(cname: str) -> str: 
-    """Return a query to get all relations for a given character.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_APPEARS_IN`.
-    """
-    return (f"SELECT {ALL_APPEARS_IN} "
-            f"FROM appears_in "
-            f"WHERE cname='{cname}';"
-    )
-
-@sanitize_inputs
-def getRelationsByGame(gtitle: str) -> str: 
-    """Return a query to get all relations for a given game.
-    
-    The resulting tuple gets fields from, and in order of 
-    `ALL_APPEARS_IN`.
-    """
-    return (f"SELECT {ALL_APPEARS_IN} "
-            f"FROM appears_in "
-            f"WHERE gtitle='{gtitle}';"
-    )
-
-@sanitize_inputs
-def getRelationsAndRNByCharacter(cname: str, rn: int) -> str: 
-    """Return a query to get the relation and Ryu Number of a character.
-    
-    The query retrieves the character's name, as well as the title and Ryu
-    Number of all games that the character appears in with a Ryu Number 
-    greater than or equal to the passed value.
-
-    The resulting tuple takes the following form for appears_in as AI and
-    game as G: `(AI.cname: str, AI.gtitle: str, G.ryu_number: int)`
-    """
-    return (f"SELECT AI.cname, AI.gtitle, G.ryu_number "
-            f"FROM appears_in AS AI "
-            f"JOIN game AS G ON G.title=AI.gtitle "
-            f"WHERE cname='{cname}' AND G.ryu_number>={rn};"
-    )
-
-@sanitize_inputs
-def getRelationsAndRNByGame(gtitle: str, rn: int) -> str: 
-    """Return a query to get the relation and Ryu Number of a game.
-    
-    The query retrieves the game's title, as well as the name and Ryu
-    Number of all characters who appear in that game and have a Ryu Number 
-    greater than or equal to the passed value minus one.
-
-    The resulting tuple takes the following form for appears_in as AI and
-    game_character as C: `(AI.cname: str, AI.gtitle: str, C.ryu_number: int)`
-    """
-    return (f"SELECT AI.cname, AI.gtitle, C.ryu_number "
-            f"FROM appears_in AS AI "
-            f"JOIN game_character AS C ON C.name=AI.cname "
-            f"WHERE gtitle='{gtitle}' AND C.ryu_number>={rn}-1;"
-    )
-
-@sanitize_inputs
-def removeCharacterRelations(cname: str) -> str: 
-    """Return a query to remove all of a character's relations."""
-    return (f"DELETE FROM appears_in "
-            f"WHERE cname='{cname}';"
-    )
-
-@sanitize_inputs
-def removeGameRelations(gtitle: str) -> str: 
-    """Return a query to remove all of a game's relations."""
-    return (f"DELETE FROM appears_in "
-            f"WHERE gtitle='{gtitle}';"
-    )
-
-@sanitize_inputs
-def removeRelation(cname: str, gtitle: str) -> str: 
-    """Return a query to remove a specific relation."""
-    return (f"DELETE FROM appears_in "
-            f"WHERE cname='{cname}' AND gtitle='{gtitle}';"
-    )
-
-
-#====================#
-# RYU NUMBER QUERIES #
-#====================#
-@sanitize_inputs
-def getGameFromCharacter(cname: str) -> str: 
-    """Return a query to get games with equal Ryu Number to a character.
-    
-    The query will retrieve the title and Ryu Number of a game whose Ryu 
-    Number is exactly equal to the Ryu Number of the character whose name is
-    passed. This is used primarily for path-finding towards Ryu.
-
-    The resulting query takes the following form for game as G:
-    `(G.title: str, G.ryu_number: int)`
-    """
-    return (f"SELECT DISTINCT G.title, G.ryu_number "
-            f"FROM appears_in "
-            f"INNER JOIN game_character AS C ON cname=C.name "
-            f"INNER JOIN game AS G ON gtitle=G.title "
-            f"WHERE cname LIKE '{cname}' AND G.ryu_number=C.ryu_number;"
-    )
-
-@sanitize_inputs
-def getCharacterFromGame(gtitle: str) -> str: 
-    """Return a query to get characters with lower Ryu Number to a game.
-    
-    The query will retrieve the name and Ryu Number of a character whose Ryu
-    Number is exactly one less than the Ryu Number of the game whose title
-    is passed. This is used primarily for path-finding towards Ryu.
-
-    The resulting query takes the following form for game_character as C:
-    `(C.name: str, C.ryu_number: int)`
-    """
-    return (f"SELECT DISTINCT C.name, C.ryu_number "
-            f"FROM appears_in "
-            f"INNER JOIN game_character AS C ON cname=C.name "
-            f"INNER JOIN game AS G ON gtitle=G.title "
-            f"WHERE gtitle LIKE '{gtitle}' AND C.ryu_number=G.ryu_number-1;"
-    )
-
-@sanitize_inputs
-def getNumCharactersWithRN(rn: int) -> str: 
-    """Return a query to get the count of characters with a given Ryu Number.
-    
-    The resulting query takes the form: `(COUNT(*): int)`
-    """
-    return (f"SELECT COUNT(*) FROM game_character "
-            f"WHERE ryu_number={rn};"
-    )
-
-@sanitize_inputs
-def getNumGamesWithRN(rn: int) -> str: 
-    """Return a query to get the count of games with a given Ryu Number.
-    
-    The resulting query takes the form: `(COUNT(*): int)`
-    """
-    return (f"SELECT COUNT(*) FROM game "
-            f"WHERE ryu_number={rn};"
-    )
-
-
-#===============#
-# ALIAS QUERIES #
-#===============#
-@sanitize_inputs
-def insertAlias(cname: str, aname: str) -> str:
-    """Return a query to insert an `alias` relation."""
-    return (f"INSERT IGNORE INTO alias (cname, aname) "
-            f"VALUES ('{cname}', '{aname}');"
-    )
-
-@sanitize_inputs
-def getAliasesFromName(cname: str) -> str:
-    """Return a query to get all the aliases of a character.
-    
-    The resulting tuple gets fields from, and in order of `ALL_ALIAS`.
-    """
-    return (f"SELECT {ALL_ALIAS} "
-            f"FROM alias "
-            f"WHERE cname='{cname}';"
-    )
-
-@sanitize_inputs
-def getNameFromAlias(aname: str) -> str:
-    """Return a query to get a character's name, given their alias.
-    
-    The resulting tuple gets fields from, and in order of `ALL_ALIAS`.
-    """
-    return (f"SELECT {ALL_ALIAS} "
-            f"FROM alias "
-            f"WHERE aname='{aname}';"
-    )
-
-@sanitize_inputs
-def removeAlias(aname: str) -> str:
-    """Return a query to remove a character's alias."""
-    return (f"DELETE FROM alias "
-            f"WHERE aname='{aname}';"
-    )
-
-@sanitize_inputs
-def updateAlias(old_alias: str, new_alias: str) -> str:
-    """Return a query to update a character's alias."""
-    return (f"UPDATE alias "
-            f"SET aname='{new_alias}' "
-            f"WHERE aname='{old_alias}';"
-    )
+"""Module for storing queries for interacting with the database.
+
+All methods within the class return a `Query`: a pair of an SQL
+statement and the parameters to execute it with, which perform the task
+specified by the method signature and docstring. Values are never
+written into the statement itself, but are passed as `%s` parameters, so
+that they cannot cause incorrect syntax or code injection, and so that
+the same statement can be prepared once and executed many times (see
+`classes.ryu_connector.RyuCursor`). A query is executed with
+`cursor.execute(*query)`.
+
+All method parameters will relate either directly to a field in the
+database, or be self-explanatory. For those that are not self-
+explanatory, refer to them below:
+
+cname -- The `name` field of the `game_character` table.
+gtitle -- The `title` field of the `game` table.
+rn -- The `ryu_number` of either the `game` or `game_character` table.
+
+The `appears_in` and `alias` tables refer to characters and games by
+their integer `id` (in the `cid` and `gid` fields), rather than by name.
+Names are only ever resolved to IDs (and back) by the queries in this
+module, through `APPEARS_IN`, `ALIAS`, and the ID resolution queries, so
+every query still takes and returns names and titles.
+
+Each method takes the form of <action><object>[specifications], where
+<action> includes (insert, get, remove, update), <object> includes
+(Character, Game, Relation, etc.), and specifications are things like 
+(ByName, ByGame, ByRyu, etc.).
+"""
+
+from typing import Tuple
+
+
+ALL_GAME_CHARACTER = "name, ryu_number"
+ALL_GAME = "title, ryu_number, release_date"
+ALL_APPEARS_IN = "C.name, G.title"
+ALL_ALIAS = "C.name, A.aname"
+
+# Every `appears_in` relation, joined to the character (C) and game (G) it relates
+APPEARS_IN = ("appears_in AS AI "
+              "JOIN game_character AS C ON C.id=AI.cid "
+              "JOIN game AS G ON G.id=AI.gid")
+# Every `alias` relation (A), joined to the character (C) it belongs to
+ALIAS = ("alias AS A "
+         "JOIN game_character AS C ON C.id=A.cid")
+
+Query = Tuple[str, Tuple]
+
+def inList(values: Tuple) -> Tuple[str, Tuple]:
+    """Return placeholders for an SQL `IN` clause, and the parameters to fill them.
+
+    The number of placeholders is rounded up to a power of two, and the
+    parameters are padded by repeating the last value (which does not change
+    what the clause matches). This way, lists of any length share only a few
+    distinct statements, which can each be prepared once. Unlike formatting
+    a Python tuple directly, this also works for single-element tuples.
+    """
+    values = tuple(values)
+    size = 1
+    while size < len(values):
+        size *= 2
+    params = values + values[-1:] * (size - len(values))
+    return "(%s)" % ", ".join(["%s"] * len(params)), params
+
+def phrase(words: str) -> str:
+    """Return a boolean-mode FULLTEXT search term that matches the words as a phrase."""
+    return '"%s"' % words.replace('"', '')
+
+def contains(value: str) -> str:
+    """Return a `LIKE` pattern that matches anything containing the value."""
+    return f"%{value}%"
+
+#===================#
+# CHARACTER QUERIES #
+#===================#
+def insertCharacter(cname: str) -> Query:
+    """Return a query to insert a character into the database."""
+    return (f"INSERT IGNORE INTO game_character (name) "
+            f"VALUES (%s);"
+    ), (cname,)
+
+def searchCharactersByName(cname: str) -> Query:
+    """Return a query to get every character whose name or alias contains the passed arg.
+
+    The search is answered by the `ngram` FULLTEXT indexes on
+    `game_character.name` and `alias.aname`, so every word of the passed arg
+    must be at least `ngram_token_size` characters long. It may also return
+    names that contain every n-gram of the passed arg, but not the arg
+    itself. The resulting tuple gets fields from, and in order of
+    `ALL_GAME_CHARACTER`, followed by the name or alias that matched.
+    """
+    return (f"SELECT {ALL_GAME_CHARACTER}, name "
+            f"FROM game_character "
+            f"WHERE MATCH(name) AGAINST(%s IN BOOLEAN MODE) "
+            f"UNION "
+            f"SELECT {ALL_GAME_CHARACTER}, aname "
+            f"FROM game_character "
+            f"JOIN alias ON id=cid "
+            f"WHERE MATCH(aname) AGAINST(%s IN BOOLEAN MODE);"
+    ), (phrase(cname), phrase(cname))
+
+def getCharacterLikeName(cname: str) -> Query:
+    """Return a query to get every character whose name or alias contains the passed arg.
+
+    Unlike `searchCharactersByName()`, this scans every name and alias. The
+    resulting tuple gets fields from, and in order of `ALL_GAME_CHARACTER`,
+    followed by the name or alias that matched.
+    """
+    return (f"SELECT {ALL_GAME_CHARACTER}, name "
+            f"FROM game_character "
+            f"WHERE name LIKE %s "
+            f"UNION "
+            f"SELECT {ALL_GAME_CHARACTER}, aname "
+            f"FROM game_character "
+            f"JOIN alias ON id=cid "
+            f"WHERE aname LIKE %s;"
+    ), (contains(cname), contains(cname))
+
+def getCharacterByName(cname: str) -> Query:
+    """Return a query to retrieve a character in the database.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"WHERE name=%s "
+            f"UNION "
+            f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"JOIN alias ON id=cid "
+            f"WHERE aname=%s;"
+    ), (cname, cname)
+
+def getCharactersByNames(cnames: Tuple) -> Query:
+    """Return a query to retrieve multiple characters in the database.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    names, params = inList(cnames)
+    return (f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"WHERE name IN {names} "
+            f"UNION "
+            f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"JOIN alias ON id=cid "
+            f"WHERE aname IN {names} "
+            f"ORDER BY ryu_number ASC;"
+    ), params + params
+
+def getCharactersByGame(gtitle: str) -> Query:
+    """Return a query to retrieve all characters who appear in the given game.
+
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT C.name, C.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE G.title=%s;"
+    ), (gtitle,)
+
+def getCharacterByRyu(rn: int) -> Query:
+    """Return a query to get all characters who have the given Ryu Number.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"WHERE ryu_number=%s;"
+    ), (rn,)
+
+def getCharacterByAlias(aname: str) -> Query:
+    """Return a query to get a character with a given alias.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT DISTINCT C.name, C.ryu_number "
+            f"FROM {ALIAS} "
+            f"WHERE A.aname=%s;"
+    ), (aname,)
+
+def getCharactersLikeAlias(aname: str) -> Query:
+    """Return a query to get a character with a similar alias.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT DISTINCT C.name, C.ryu_number "
+            f"FROM {ALIAS} "
+            f"WHERE A.aname LIKE %s;"
+    ), (contains(aname),)
+
+def removeCharacter(cname: str) -> Query:
+    """Return a query to remove a given character from the database."""
+    return (f"DELETE FROM game_character "
+            f"WHERE name=%s;"
+    ), (cname,)
+
+def updateCharacterName(old_name: str, new_name: str) -> Query:
+    """Return a query to update a given character's name."""
+    return (f"UPDATE game_character "
+            f"SET name=%s "
+            f"WHERE name=%s;"
+    ), (new_name, old_name)
+
+def getAllCharacters() -> Query:
+    """Return a query to retrieve every character in the database.
+
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return f"SELECT {ALL_GAME_CHARACTER} FROM game_character;", ()
+
+def getNumCharacters() -> Query:
+    """Return a query to retrieve the count of all characters in the database.
+    
+    The resulting tuple is of the form: `(COUNT(*): int,)`
+    """
+    return f"SELECT COUNT(*) FROM game_character;", ()
+
+
+#==============#
+# GAME QUERIES #
+#==============#
+def insertGame(gtitle: str, release_date: str="0000-00-00") -> Query:
+    """Return a query to insert a game into the database."""
+    return (f"INSERT IGNORE INTO game (title, release_date) "
+            f"VALUES (%s, %s);"
+    ), (gtitle, release_date)
+
+def searchGamesByTitle(gtitle: str) -> Query:
+    """Return a query to get every game whose title contains the passed arg.
+
+    The search is answered by the `ngram` FULLTEXT index on `game.title`,
+    with the same caveats as `searchCharactersByName()`. The resulting
+    tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return (f"SELECT {ALL_GAME} "
+            f"FROM game "
+            f"WHERE MATCH(title) AGAINST(%s IN BOOLEAN MODE) "
+            f"ORDER BY release_date ASC, ryu_number ASC;"
+    ), (phrase(gtitle),)
+
+def getGameLikeTitle(gtitle: str) -> Query:
+    """Return a query to get games whose titles are similar to the passed arg.
+    
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return (f"SELECT {ALL_GAME} "
+            f"FROM game "
+            f"WHERE title LIKE %s "
+            f"ORDER BY release_date ASC, ryu_number ASC;"
+    ), (contains(gtitle),)
+
+def getGameByTitle(gtitle: str) -> Query:
+    """Return a query to get a specific game from the database.
+
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return (f"SELECT {ALL_GAME} "
+            f"FROM game "
+            f"WHERE title=%s;"
+    ), (gtitle,)
+
+def getGamesByTitles(gtitles: Tuple) -> Query:
+    """Return a query to get games from a given tuple of titles.
+    
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    titles, params = inList(gtitles)
+    return (f"SELECT {ALL_GAME} "
+            f"FROM game "
+            f"WHERE title IN {titles} "
+            f"ORDER BY ryu_number ASC;"
+    ), params
+
+def getGamesByCharacter(cname: str) -> Query:
+    """Return a query to get all the games a given character appears in.
+    
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return (f"SELECT G.title, G.ryu_number, G.release_date "
+            f"FROM {APPEARS_IN} "
+            f"WHERE C.name=%s "
+            f"ORDER BY G.release_date ASC;"
+    ), (cname,)
+
+def getGamesByCharacters(cnames: Tuple) -> Query:
+    """Return a query to get all the games any of the given characters appear in.
+
+    Rows for each character are ordered by the game's release date.
+
+    The resulting tuple takes the following form for game_character as C
+    and game as G: `(C.name: str, G.title: str)`
+    """
+    names, params = inList(cnames)
+    return (f"SELECT C.name, G.title "
+            f"FROM {APPEARS_IN} "
+            f"WHERE C.name IN {names} "
+            f"ORDER BY G.release_date ASC;"
+    ), params
+
+def getFirstGamesByCharacters(cnames: Tuple, limit: int) -> Query:
+    """Return a query to get the first few games each of the given characters appear in.
+
+    Rows for each character are ordered by the game's release date, and
+    there are at most `limit` of them (but at least one, for any character
+    that appears in a game).
+
+    The resulting tuple takes the following form for game_character as C
+    and game as G: `(C.name: str, G.title: str, total: int)`, where `total`
+    is how many games the character appears in altogether.
+    """
+    names, params = inList(cnames)
+    return (f"SELECT name, title, total FROM ("
+                f"SELECT C.name, G.title, "
+                f"ROW_NUMBER() OVER (PARTITION BY AI.cid ORDER BY G.release_date ASC) AS n, "
+                f"COUNT(*) OVER (PARTITION BY AI.cid) AS total "
+                f"FROM {APPEARS_IN} "
+                f"WHERE C.name IN {names}"
+            f") AS R "
+            f"WHERE n <= %s "
+            f"ORDER BY name, n;"
+    ), params + (max(limit, 1),)
+
+def getGamesByRyu(rn: int) -> Query:
+    """Return a query to get all games with a given Ryu Number.
+    
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return (f"SELECT {ALL_GAME} "
+            f"FROM game "
+            f"WHERE ryu_number=%s;"
+    ), (rn,)
+
+def removeGame(gtitle: str) -> Query:
+    """Return a query to remove a given game from the database."""
+    return (f"DELETE FROM game "
+            f"WHERE title=%s;"
+    ), (gtitle,)
+
+def updateGameTitle(old_title: str, new_title: str) -> Query:
+    """Return a query to update the title of a given game."""
+    return (f"UPDATE game "
+            f"SET title=%s "
+            f"WHERE title=%s;"
+    ), (new_title, old_title)
+
+def updateGameReleaseDate(gtitle: str, new_rdate: str) -> Query:
+    """Return a query to update the release date of a given game."""
+    return (f"UPDATE game "
+            f"SET release_date=%s "
+            f"WHERE title=%s;"
+    ), (new_rdate, gtitle)
+
+def getAllGames() -> Query:
+    """Return a query to retrieve every game in the database.
+
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return f"SELECT {ALL_GAME} FROM game;", ()
+
+def getNumGames() -> Query:
+    """Return a query to retrieve the count of all games in the database.
+    
+    The resulting tuple is of the form: `(COUNT(*): int,)`
+    """
+    return "SELECT COUNT(*) FROM game;", ()
+
+
+#==================#
+# RELATION QUERIES #
+#==================#
+def insertRelation(cname: str, gtitle: str) -> Query:
+    """Return a query to insert an `appears_in` relation to the database.
+
+    Nothing is inserted if either the character or the game doesn't exist.
+    """
+    return (f"INSERT IGNORE INTO appears_in (cid, gid) "
+            f"SELECT C.id, G.id "
+            f"FROM game_character AS C, game AS G "
+            f"WHERE C.name=%s AND G.title=%s;"
+    ), (cname, gtitle)
+
+def getAllRelations() -> Query:
+    """Return a query to retrieve every `appears_in` relation in the database.
+
+    The resulting tuple gets fields from, and in order of 
+    `ALL_APPEARS_IN`.
+    """
+    return f"SELECT {ALL_APPEARS_IN} FROM {APPEARS_IN};", ()
+
+def getRelationsByCharacter(cname: str) -> Query:
+    """Return a query to get all relations for a given character.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_APPEARS_IN`.
+    """
+    return (f"SELECT {ALL_APPEARS_IN} "
+            f"FROM {APPEARS_IN} "
+            f"WHERE C.name=%s;"
+    ), (cname,)
+
+def getRelationsByGame(gtitle: str) -> Query:
+    """Return a query to get all relations for a given game.
+    
+    The resulting tuple gets fields from, and in order of 
+    `ALL_APPEARS_IN`.
+    """
+    return (f"SELECT {ALL_APPEARS_IN} "
+            f"FROM {APPEARS_IN} "
+            f"WHERE G.title=%s;"
+    ), (gtitle,)
+
+def getRelationsAndRNByCharacter(cname: str, rn: int) -> Query:
+    """Return a query to get the relation and Ryu Number of a character.
+    
+    The query retrieves the character's name, as well as the title and Ryu
+    Number of all games that the character appears in with a Ryu Number 
+    greater than or equal to the passed value.
+
+    The resulting tuple takes the following form for game_character as C
+    and game as G: `(C.name: str, G.title: str, G.ryu_number: int)`
+    """
+    return (f"SELECT C.name, G.title, G.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE C.name=%s AND G.ryu_number>=%s;"
+    ), (cname, rn)
+
+def getRelationsAndRNByGame(gtitle: str, rn: int) -> Query:
+    """Return a query to get the relation and Ryu Number of a game.
+    
+    The query retrieves the game's title, as well as the name and Ryu
+    Number of all characters who appear in that game and have a Ryu Number 
+    greater than or equal to the passed value minus one.
+
+    The resulting tuple takes the following form for game_character as C
+    and game as G: `(C.name: str, G.title: str, C.ryu_number: int)`
+    """
+    return (f"SELECT C.name, G.title, C.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE G.title=%s AND C.ryu_number>=%s-1;"
+    ), (gtitle, rn)
+
+def getRelationsAndRNByCharacters(cnames: Tuple) -> Query:
+    """Return a query to get the relations and Ryu Numbers of many characters.
+
+    The query retrieves every game that any of the given characters appear
+    in, alongside that game's Ryu Number.
+
+    The resulting tuple takes the following form for game_character as C
+    and game as G: `(C.name: str, G.title: str, G.ryu_number: int)`
+    """
+    names, params = inList(cnames)
+    return (f"SELECT C.name, G.title, G.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE C.name IN {names};"
+    ), params
+
+def getRelationsAndRNByGames(gtitles: Tuple) -> Query:
+    """Return a query to get the relations and Ryu Numbers of many games.
+
+    The query retrieves every character that appears in any of the given
+    games, alongside that character's Ryu Number.
+
+    The resulting tuple takes the following form for game_character as C
+    and game as G: `(C.name: str, G.title: str, C.ryu_number: int)`
+    """
+    titles, params = inList(gtitles)
+    return (f"SELECT C.name, G.title, C.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE G.title IN {titles};"
+    ), params
+
+def removeCharacterRelations(cname: str) -> Query:
+    """Return a query to remove all of a character's relations."""
+    return (f"DELETE AI FROM {APPEARS_IN} "
+            f"WHERE C.name=%s;"
+    ), (cname,)
+
+def removeGameRelations(gtitle: str) -> Query:
+    """Return a query to remove all of a game's relations."""
+    return (f"DELETE AI FROM {APPEARS_IN} "
+            f"WHERE G.title=%s;"
+    ), (gtitle,)
+
+def removeRelation(cname: str, gtitle: str) -> Query:
+    """Return a query to remove a specific relation."""
+    return (f"DELETE AI FROM {APPEARS_IN} "
+            f"WHERE C.name=%s AND G.title=%s;"
+    ), (cname, gtitle)
+
+
+#====================#
+# RYU NUMBER QUERIES #
+#====================#
+def getGameFromCharacter(cname: str) -> Query:
+    """Return a query to get games with equal Ryu Number to a character.
+    
+    The query will retrieve the title and Ryu Number of a game whose Ryu 
+    Number is exactly equal to the Ryu Number of the character whose name is
+    passed. This is used primarily for path-finding towards Ryu.
+
+    The resulting query takes the following form for game as G:
+    `(G.title: str, G.ryu_number: int, G.release_date: date)`
+    """
+    return (f"SELECT DISTINCT G.title, G.ryu_number, G.release_date "
+            f"FROM {APPEARS_IN} "
+            f"WHERE C.name=%s AND G.ryu_number=C.ryu_number;"
+    ), (cname,)
+
+def getCharacterFromGame(gtitle: str) -> Query:
+    """Return a query to get characters with lower Ryu Number to a game.
+    
+    The query will retrieve the name and Ryu Number of a character whose Ryu
+    Number is exactly one less than the Ryu Number of the game whose title
+    is passed. This is used primarily for path-finding towards Ryu.
+
+    The resulting query takes the following form for game_character as C:
+    `(C.name: str, C.ryu_number: int)`
+    """
+    return (f"SELECT DISTINCT C.name, C.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE G.title=%s AND C.ryu_number=G.ryu_number-1;"
+    ), (gtitle,)
+
+def getNumCharactersWithRN(rn: int) -> Query:
+    """Return a query to get the count of characters with a given Ryu Number.
+    
+    The resulting query takes the form: `(COUNT(*): int)`
+    """
+    return (f"SELECT COUNT(*) FROM game_character "
+            f"WHERE ryu_number=%s;"
+    ), (rn,)
+
+def getNumGamesWithRN(rn: int) -> Query:
+    """Return a query to get the count of games with a given Ryu Number.
+    
+    The resulting query takes the form: `(COUNT(*): int)`
+    """
+    return (f"SELECT COUNT(*) FROM game "
+            f"WHERE ryu_number=%s;"
+    ), (rn,)
+
+def getStatistics() -> Query:
+    """Return a query to get every distribution of the database at once.
+
+    Each resulting tuple takes the form `(distribution: str, value: int,
+    count: int)`, where distribution is one of:
+    'character_rn' -- how many characters have each Ryu Number
+    'game_rn' -- how many games have each Ryu Number
+    'character_degree' -- how many characters appear in each number of games
+    'game_degree' -- how many games have each number of characters
+    """
+    return (f"SELECT 'character_rn', ryu_number, COUNT(*) "
+            f"FROM game_character "
+            f"GROUP BY ryu_number "
+            f"UNION ALL "
+            f"SELECT 'game_rn', ryu_number, COUNT(*) "
+            f"FROM game "
+            f"GROUP BY ryu_number "
+            f"UNION ALL "
+            f"SELECT 'character_degree', degree, COUNT(*) "
+            f"FROM (SELECT COUNT(gid) AS degree "
+                f"FROM game_character "
+                f"LEFT JOIN appears_in ON id=cid "
+                f"GROUP BY id) AS C "
+            f"GROUP BY degree "
+            f"UNION ALL "
+            f"SELECT 'game_degree', degree, COUNT(*) "
+            f"FROM (SELECT COUNT(cid) AS degree "
+                f"FROM game "
+                f"LEFT JOIN appears_in ON id=gid "
+                f"GROUP BY id) AS G "
+            f"GROUP BY degree;"
+    ), ()
+
+
+def getRNByCharacterNames(cnames: Tuple) -> Query:
+    """Return a query to get the Ryu Numbers of the given characters.
+
+    Unlike `getCharactersByNames()`, aliases are not matched.
+
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    names, params = inList(cnames)
+    return (f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"WHERE name IN {names};"
+    ), params
+
+def getRNByGameTitles(gtitles: Tuple) -> Query:
+    """Return a query to get the Ryu Numbers of the given games.
+
+    The resulting tuple takes the form: `(title: str, ryu_number: int)`
+    """
+    titles, params = inList(gtitles)
+    return (f"SELECT title, ryu_number "
+            f"FROM game "
+            f"WHERE title IN {titles};"
+    ), params
+
+def updateCharactersRN(cnames: Tuple, rn: int) -> Query:
+    """Return a query to set the Ryu Number of the given characters."""
+    names, params = inList(cnames)
+    return (f"UPDATE game_character "
+            f"SET ryu_number=%s "
+            f"WHERE name IN {names};"
+    ), (rn,) + params
+
+def updateGamesRN(gtitles: Tuple, rn: int) -> Query:
+    """Return a query to set the Ryu Number of the given games."""
+    titles, params = inList(gtitles)
+    return (f"UPDATE game "
+            f"SET ryu_number=%s "
+            f"WHERE title IN {titles};"
+    ), (rn,) + params
+
+# The following queries write Ryu Numbers computed outside of the database
+# in bulk. The numbers are first loaded into a temporary table (using
+# `insertNewRyuNumbers()` with `executemany`), then copied over with a
+# single joined update per table.
+
+def createNewRyuNumbers() -> Query:
+    """Return a query to create the temporary table of new Ryu Numbers.
+    
+    The `kind` field is 'c' for characters and 'g' for games, and `pk` is the
+    character's name or the game's title.
+    """
+    return (f"CREATE TEMPORARY TABLE new_ryu_number ("
+            f"kind        CHAR(1)     NOT NULL, "
+            f"pk          VARCHAR(64) NOT NULL, "
+            f"ryu_number  INTEGER     NOT NULL, "
+            f"PRIMARY KEY (kind, pk));"
+    ), ()
+
+def insertNewRyuNumbers() -> str:
+    """Return a parameterized statement to insert rows of new Ryu Numbers.
+
+    The statement takes parameters of the form `(kind, pk, ryu_number)`, and
+    is meant to be used with `executemany`.
+    """
+    return (f"INSERT IGNORE INTO new_ryu_number (kind, pk, ryu_number) "
+            f"VALUES (%s, %s, %s);"
+    )
+
+def applyNewCharacterRyuNumbers() -> Query:
+    """Return a query to copy new Ryu Numbers into the `game_character` table."""
+    return (f"UPDATE game_character AS C "
+            f"JOIN new_ryu_number AS N ON N.kind='c' AND N.pk=C.name "
+            f"SET C.ryu_number=N.ryu_number;"
+    ), ()
+
+def applyNewGameRyuNumbers() -> Query:
+    """Return a query to copy new Ryu Numbers into the `game` table."""
+    return (f"UPDATE game AS G "
+            f"JOIN new_ryu_number AS N ON N.kind='g' AND N.pk=G.title "
+            f"SET G.ryu_number=N.ryu_number;"
+    ), ()
+
+def dropNewRyuNumbers() -> Query:
+    """Return a query to drop the temporary table of new Ryu Numbers."""
+    return "DROP TEMPORARY TABLE IF EXISTS new_ryu_number;", ()
+
+
+#===================#
+# PAGINATED QUERIES #
+#===================#
+# The following queries each return one page of a list query, using keyset
+# (seek) pagination: rows are ordered by name (or title), and each page
+# starts right after the last name of the page before it, rather than at
+# an offset. Every page is therefore read straight from an index, however
+# far into the results it is. The first page starts after "", which comes
+# before every name.
+
+def getCharacterByRyuPage(rn: int, after: str, limit: int) -> Query:
+    """Return a query to get one page of the characters who have the given Ryu Number.
+
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT {ALL_GAME_CHARACTER} "
+            f"FROM game_character "
+            f"WHERE ryu_number=%s AND name>%s "
+            f"ORDER BY name ASC "
+            f"LIMIT %s;"
+    ), (rn, after, limit)
+
+def getCharactersByGamePage(gtitle: str, after: str, limit: int) -> Query:
+    """Return a query to get one page of the characters who appear in the given game.
+
+    The resulting tuple gets fields from, and in order of 
+    `ALL_GAME_CHARACTER`.
+    """
+    return (f"SELECT C.name, C.ryu_number "
+            f"FROM {APPEARS_IN} "
+            f"WHERE G.title=%s AND C.name>%s "
+            f"ORDER BY C.name ASC "
+            f"LIMIT %s;"
+    ), (gtitle, after, limit)
+
+def getGamesByRyuPage(rn: int, after: str, limit: int) -> Query:
+    """Return a query to get one page of the games with the given Ryu Number.
+
+    The resulting tuple gets fields from, and in order of `ALL_GAME`.
+    """
+    return (f"SELECT {ALL_GAME} "
+            f"FROM game "
+            f"WHERE ryu_number=%s AND title>%s "
+            f"ORDER BY title ASC "
+            f"LIMIT %s;"
+    ), (rn, after, limit)
+
+#===============#
+# ALIAS QUERIES #
+#===============#
+def insertAlias(cname: str, aname: str) -> Query:
+    """Return a query to insert an `alias` relation.
+
+    Nothing is inserted if the character doesn't exist.
+    """
+    return (f"INSERT IGNORE INTO alias (cid, aname) "
+            f"SELECT id, %s "
+            f"FROM game_character "
+            f"WHERE name=%s;"
+    ), (aname, cname)
+
+def getAllAliases() -> Query:
+    """Return a query to retrieve every `alias` relation in the database.
+
+    The resulting tuple gets fields from, and in order of `ALL_ALIAS`.
+    """
+    return f"SELECT {ALL_ALIAS} FROM {ALIAS};", ()
+
+def getAliasesFromName(cname: str) -> Query:
+    """Return a query to get all the aliases of a character.
+    
+    The resulting tuple gets fields from, and in order of `ALL_ALIAS`.
+    """
+    return (f"SELECT {ALL_ALIAS} "
+            f"FROM {ALIAS} "
+            f"WHERE C.name=%s;"
+    ), (cname,)
+
+def getAliasesFromNames(cnames: Tuple) -> Query:
+    """Return a query to get all the aliases of any of the given characters.
+
+    The resulting tuple gets fields from, and in order of `ALL_ALIAS`.
+    """
+    names, params = inList(cnames)
+    return (f"SELECT {ALL_ALIAS} "
+            f"FROM {ALIAS} "
+            f"WHERE C.name IN {names};"
+    ), params
+
+def getNameFromAlias(aname: str) -> Query:
+    """Return a query to get a character's name, given their alias.
+    
+    The resulting tuple gets fields from, and in order of `ALL_ALIAS`.
+    """
+    return (f"SELECT {ALL_ALIAS} "
+            f"FROM {ALIAS} "
+            f"WHERE A.aname=%s;"
+    ), (aname,)
+
+def removeAlias(aname: str) -> Query:
+    """Return a query to remove a character's alias."""
+    return (f"DELETE FROM alias "
+            f"WHERE aname=%s;"
+    ), (aname,)
+
+def updateAlias(old_alias: str, new_alias: str) -> Query:
+    """Return a query to update a character's alias."""
+    return (f"UPDATE alias "
+            f"SET aname=%s "
+            f"WHERE aname=%s;"
+    ), (new_alias, old_alias)
+
+
+#===================#
+# BULK LOAD QUERIES #
+#===================#
+# The following statements are parameterized, and are meant to be used
+# with `executemany` to load many rows at once. The connector rewrites each
+# of them into a single multi-row insert per call, which is parsed once per
+# batch rather than once per row.
+
+def disableTriggers() -> Query:
+    """Return a query to stop the `appears_in` triggers from firing in this session."""
+    return "SET @disable_triggers=1;", ()
+
+def enableTriggers() -> Query:
+    """Return a query to let the `appears_in` triggers fire again in this session."""
+    return "SET @disable_triggers=NULL;", ()
+
+def insertCharacters() -> str:
+    """Return a parameterized statement to insert rows of characters.
+
+    The statement takes parameters of the form `(name, ryu_number)`.
+    Characters that already exist have their Ryu Number overwritten.
+    """
+    return (f"INSERT INTO game_character (name, ryu_number) "
+            f"VALUES (%s, %s) "
+            f"ON DUPLICATE KEY UPDATE ryu_number=VALUES(ryu_number);"
+    )
+
+def insertGames() -> str:
+    """Return a parameterized statement to insert rows of games.
+
+    The statement takes parameters of the form `(title, ryu_number,
+    release_date)`. Games that already exist have their Ryu Number and
+    release date overwritten.
+    """
+    return (f"INSERT INTO game (title, ryu_number, release_date) "
+            f"VALUES (%s, %s, %s) "
+            f"ON DUPLICATE KEY UPDATE ryu_number=VALUES(ryu_number), release_date=VALUES(release_date);"
+    )
+
+def insertRelations() -> str:
+    """Return a parameterized statement to insert rows of `appears_in` relations.
+
+    The statement takes parameters of the form `(cid, gid)`, where each ID
+    comes from `getCharacterIds()` and `getGameIds()`.
+    """
+    return (f"INSERT IGNORE INTO appears_in (cid, gid) "
+            f"VALUES (%s, %s);"
+    )
+
+def insertAliases() -> str:
+    """Return a parameterized statement to insert rows of `alias` relations.
+
+    The statement takes parameters of the form `(cid, aname)`, where each ID
+    comes from `getCharacterIds()`.
+    """
+    return (f"INSERT IGNORE INTO alias (cid, aname) "
+            f"VALUES (%s, %s);"
+    )
+
+def getCharacterIds() -> Query:
+    """Return a query to get the ID of every character, for loading relations in bulk.
+
+    The resulting tuple takes the form: `(name: str, id: int)`
+    """
+    return "SELECT name, id FROM game_character;", ()
+
+def getGameIds() -> Query:
+    """Return a query to get the ID of every game, for loading relations in bulk.
+
+    The resulting tuple takes the form: `(title: str, id: int)`
+    """
+    return "SELECT title, id FROM game;", ()
+
+
+#================#
+# SCHEMA QUERIES #
+#================#
+def getSchemaVersion() -> Query:
+    """Return a query to get the version of the database's schema.
+
+    The resulting tuple is of the form: `(MAX(version): int | None,)`
+    """
+    return "SELECT MAX(version) FROM schema_version;", ()
+
+def insertSchemaVersion(version: int, description: str) -> Query:
+    """Return a query to record that a schema migration has been applied."""
+    return (f"INSERT INTO schema_version (version, description) "
+            f"VALUES (%s, %s);"
+    ), (version, description)
+
+def getIndex(table: str, index: str) -> Query:
+    """Return a query to check whether a table of the database has an index.
+
+    The resulting tuple is of the form: `(COUNT(*): int,)`, which is 0 if
+    the index doesn't exist.
+    """
+    return (f"SELECT COUNT(*) "
+            f"FROM information_schema.statistics "
+            f"WHERE table_schema=DATABASE() AND table_name=%s AND index_name=%s;"
+    ), (table, index)
+
+def getTable(table: str) -> Query:
+    """Return a query to check whether the database has a table.
+
+    The resulting tuple is of the form: `(COUNT(*): int,)`, which is 0 if
+    the table doesn't exist.
+    """
+    return (f"SELECT COUNT(*) "
+            f"FROM information_schema.tables "
+            f"WHERE table_schema=DATABASE() AND table_name=%s;"
+    ), (table,)
+
+def getColumn(table: str, column: str) -> Query:
+    """Return a query to check whether a table of the database has a column.
+
+    The resulting tuple is of the form: `(COUNT(*): int,)`, which is 0 if
+    the column doesn't exist.
+    """
+    return (f"SELECT COUNT(*) "
+            f"FROM information_schema.columns "
+            f"WHERE table_schema=DATABASE() AND table_name=%s AND column_name=%s;"
+    ), (table, column)
+
+def getConstraint(table: str, constraint: str) -> Query:
+    """Return a query to check whether a table of the database has a constraint.
+
+    The resulting tuple is of the form: `(COUNT(*): int,)`, which is 0 if
+    the constraint doesn't exist.
+    """
+    return (f"SELECT COUNT(*) "
+            f"FROM information_schema.table_constraints "
+            f"WHERE table_schema=DATABASE() AND table_name=%s AND constraint_name=%s;"
+    ), (table, constraint)
+
+def explain(query: Query) -> Query:
+    """Return a query to get the plan MySQL would use to run another query.
+
+    Each resulting tuple describes one table of the plan, and takes the
+    form `(id, select_type, table, partitions, type, possible_keys, key,
+    key_len, ref, rows, filtered, Extra)`.
+    """
+    sql, params = query
+    return f"EXPLAIN {sql}", params
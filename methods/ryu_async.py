@@ -0,0 +1,210 @@
+"""Module for reading the Ryu database concurrently with asyncio.
+
+Every method of `ryu_database` that only reads has a coroutine of the same
+name here, which runs it on a bounded pool of worker threads (see
+`getExecutor()`) so that it doesn't block the event loop. Since each read
+borrows its own connection from the shared `ConnectionPool`, reads that
+are awaited together, such as with `asyncio.gather()`, run on the server
+at the same time, and take about as long as the slowest of them rather
+than all of them added together.
+
+Writes are not mirrored, as each one propagates Ryu Numbers through the
+database, and concurrent writes would only contend for the same rows. They
+should still be made through `ryu_database` (or a `UnitOfWork`).
+
+Methods
+-------
+getExecutor() -> ThreadPoolExecutor
+    Return the thread pool that every coroutine runs its reads on.
+shutdown() -> None
+    Stop the thread pool, once every read already started has finished.
+hydrateCharacters(List[GameCharacter]) -> None
+    Fill in the games and aliases of many characters, with every query run concurrently.
+getPathsFromCharacters(Iterable[str]) -> List[Optional[List[Node]]]
+    Get a path to Ryu from each of many characters concurrently.
+getStatsByRyuNumber(Iterable[int]) -> Dict[int, Tuple[Optional[int], Optional[int]]]
+    Count the characters and games with each of many Ryu Numbers concurrently.
+
+Along with a coroutine for each read of `ryu_database`, such as
+`getCharacterByName()`, `getGamesByRyuNumber()` or `getStats()`.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from classes.nodes import Node, GameCharacter
+from classes.ryu_connector import POOL_SIZE, RyuConnector
+from methods import queries, ryu_database
+
+
+ERROR_MESSAGES = {
+    "default_error": lambda e: f"Error: {e}"    # The default error message, which simply prints the passed Exception
+}
+
+ASYNC_WORKERS = POOL_SIZE   # How many reads may run at once, which is as many as the pool has connections
+
+T = TypeVar('T')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def getExecutor() -> ThreadPoolExecutor:
+    """Return the thread pool that every coroutine runs its reads on.
+
+    The pool is created the first time it is needed. It holds at most
+    `ASYNC_WORKERS` threads, so no more reads run at once than there are
+    connections for them; any more wait their turn in the pool's queue,
+    rather than holding a thread while waiting for a connection.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=ASYNC_WORKERS, thread_name_prefix="ryu")
+        return _executor
+
+def shutdown() -> None:
+    """Stop the thread pool, once every read already started has finished.
+
+    A new pool is created if any coroutine is awaited afterwards.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+async def _run(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking function on the thread pool, and return its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(getExecutor(), functools.partial(func, *args, **kwargs))
+
+def _mirror(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Return a coroutine function that runs `func` on the thread pool."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await _run(func, *args, **kwargs)
+    return wrapper
+
+#===========================#
+# MIRRORED DATABASE METHODS #
+#===========================#
+# Each of these takes the same arguments, and returns the same result, as
+# the method of the same name in `ryu_database`.
+# CHARACTERS
+getCharacterByName = _mirror(ryu_database.getCharacterByName)
+getCharactersLikeName = _mirror(ryu_database.getCharactersLikeName)
+getCharactersCloseToName = _mirror(ryu_database.getCharactersCloseToName)
+getCharactersByNames = _mirror(ryu_database.getCharactersByNames)
+getCharactersByGame = _mirror(ryu_database.getCharactersByGame)
+getCharactersByRyuNumber = _mirror(ryu_database.getCharactersByRyuNumber)
+getCharacterByAlias = _mirror(ryu_database.getCharacterByAlias)
+getCharactersLikeAlias = _mirror(ryu_database.getCharactersLikeAlias)
+getNumCharacters = _mirror(ryu_database.getNumCharacters)
+getNumCharactersWithRN = _mirror(ryu_database.getNumCharactersWithRN)
+
+# GAMES
+getGameByTitle = _mirror(ryu_database.getGameByTitle)
+getGamesLikeTitle = _mirror(ryu_database.getGamesLikeTitle)
+getGamesCloseToTitle = _mirror(ryu_database.getGamesCloseToTitle)
+getGamesByTitles = _mirror(ryu_database.getGamesByTitles)
+getGamesByCharacter = _mirror(ryu_database.getGamesByCharacter)
+getGamesByRyuNumber = _mirror(ryu_database.getGamesByRyuNumber)
+getNumGames = _mirror(ryu_database.getNumGames)
+getNumGamesWithRN = _mirror(ryu_database.getNumGamesWithRN)
+
+# ALIASES
+getAliasesFromName = _mirror(ryu_database.getAliasesFromName)
+getNameFromAlias = _mirror(ryu_database.getNameFromAlias)
+
+# RYU NUMBERS
+stepTowardsRyu = _mirror(ryu_database.stepTowardsRyu)
+getPathFromCharacter = _mirror(ryu_database.getPathFromCharacter)
+countPathsToRyu = _mirror(ryu_database.countPathsToRyu)
+getStats = _mirror(ryu_database.getStats)
+
+# PAGES
+getCharactersByRyuNumberPage = _mirror(ryu_database.getCharactersByRyuNumberPage)
+getCharactersByGamePage = _mirror(ryu_database.getCharactersByGamePage)
+getGamesByRyuNumberPage = _mirror(ryu_database.getGamesByRyuNumberPage)
+
+#=================#
+# FAN-OUT METHODS #
+#=================#
+def _fetchPairs(query: queries.Query) -> Dict[str, List[str]]:
+    """Run a query of `(key, value)` rows on its own connection, and group the values by key."""
+    pairs: Dict[str, List[str]] = {}
+    with RyuConnector() as rdb:
+        rdb.execute(*query)
+        for key, value in rdb.fetchall():
+            pairs.setdefault(key, []).append(value)
+    return pairs
+
+async def hydrateCharacters(characters: List[GameCharacter]) -> None:
+    """Fill in the `appears_in` and `aliases` fields of many characters at once.
+
+    This works as `ryu_database.hydrateCharacters()` does, except that the
+    games query and aliases query of every batch are all run concurrently,
+    each on its own connection, rather than one after another. Characters
+    whose games and aliases are already known will not be changed. If any
+    errors occur, they are printed, and the characters are left to be filled
+    in when read.
+
+    Parameters
+    ----------
+    characters: List[GameCharacter]
+        The characters to fill in.
+    """
+    byName: Dict[str, List[GameCharacter]] = {}
+    for c in characters:
+        if not c.isLoaded():
+            byName.setdefault(c.name, []).append(c)
+    names = list(byName)
+    if not names:
+        return
+    batches = [tuple(names[i:i + ryu_database.HYDRATION_BATCH_SIZE])
+               for i in range(0, len(names), ryu_database.HYDRATION_BATCH_SIZE)]
+    try:
+        results = await asyncio.gather(*(
+            _run(_fetchPairs, query(batch))
+            for batch in batches
+            for query in (queries.getGamesByCharacters, queries.getAliasesFromNames)
+        ))
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return
+    games: Dict[str, List[str]] = {}
+    aliases: Dict[str, List[str]] = {}
+    for i in range(0, len(results), 2):
+        games.update(results[i])
+        aliases.update(results[i + 1])
+    for name, group in byName.items():
+        for c in group:
+            if not c.isLoaded():
+                c.appears_in = games.get(name, [])
+                c.aliases = aliases.get(name, [])
+
+async def getPathsFromCharacters(names: Iterable[str]) -> List[Optional[List[Node]]]:
+    """Get a path to Ryu from each of many characters concurrently.
+
+    Each path is found as by `ryu_database.getPathFromCharacter()`, and the
+    paths are returned in the same order as the names. A character who
+    doesn't exist (or whose path cannot be read) has None in place of a path.
+    """
+    return list(await asyncio.gather(*(getPathFromCharacter(name) for name in names)))
+
+async def getStatsByRyuNumber(rns: Iterable[int]) -> Dict[int, Tuple[Optional[int], Optional[int]]]:
+    """Count the characters and games with each of many Ryu Numbers concurrently.
+
+    Returns a dictionary of each Ryu Number to a tuple of how many
+    characters, and how many games, have it. Either count is None if it
+    could not be read.
+    """
+    rns = list(rns)
+    counts = await asyncio.gather(*(
+        count(rn) for rn in rns for count in (getNumCharactersWithRN, getNumGamesWithRN)
+    ))
+    return {rn: (counts[2 * i], counts[2 * i + 1]) for i, rn in enumerate(rns)}
@@ -1,613 +1,1337 @@
-"""Module for employing queries in conjunction with actual objects.
-
-There are methods employed for inserting, removing, retrieving, and
-updating both characters and games. In addition, there are also methods
-to retrieve paths from a given character towards Ryu, and its related
-helper method.
-
-All parameters of methods are named in such a way that they are either
-self-explanatory, or relate directly to a given field of a table. 
-
-Most methods takes a form similar to <action><object>[specification], 
-where <action> can include (insert, remove, get, update), <object> can
-include (Character, Game, etc.), and [specification] can be things such
-as (FromGame, ByName, LikeTitle, etc.), with the exceptions of Ryu
-Number methods.
-"""
-
-from typing import Optional, List, Tuple
-from random import choice
-
-from classes.nodes import Node, Game, GameCharacter
-from classes.ryu_connector import RyuConnector
-from methods import queries
-
-
-ERROR_MESSAGES = {
-    "default_error": lambda e: f"Error: {e}"    # The default error message, which simply prints the passed Exception
-}
-
-
-def tupleToCharacter(t: Tuple[str, int]) -> Optional[GameCharacter]:
-    """Return a GameCharacter object directly related to a tuple.
-    
-    The anticipated tuple input is the result of a query for a character.
-    That is, it is expected to be (name, ryu_number). If the passed tuple is
-    invalid or errors occur during connection, nothing is returned.
-    """
-    try:
-        c = GameCharacter(t[0], t[1])
-        with RyuConnector() as rdb:
-            c.getMissingData(rdb)
-        return c
-    except Exception as e:
-        print(f"ERROR: {e}")
-        return None
-
-def tupleToGame(t: Tuple[str, int, str]) -> Optional[Game]:
-    """Return a Game object directly related to a tuple.
-    
-    The anticipated tuple input is the result of a query for a game.
-    That is, it is expected to be (title, ryu_number, release_date). If the
-    passed tuple is invalid, nothing is returned.
-    """
-    try:
-        return Game(t[0], t[1], t[2])
-    except Exception as e:
-        print(f"ERROR: {e}")
-        return None
-
-
-#============================#
-# CHARACTER DATABASE METHODS #
-#============================#
-# INSERT
-def insertCharacter(name: str) -> bool:
-    """Insert a character to the database.
-    
-    The method will return a boolean value as to whether or not the 
-    character has been successfully inserted.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.insertCharacter(name))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-def insertCharactersToGame(names: List[str], title: str) -> bool:
-    """Insert a list of characters into a Game.
-    
-    The method will return a boolean value as to whether or not all
-    characters have been successfully inserted.
-    """
-    try:
-        with RyuConnector() as rdb:
-            for n in names:
-                rdb.execute(queries.insertCharacter(n))
-                rdb.execute(queries.insertRelation(n, title))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-# REMOVE
-def removeCharacter(name: str) -> bool:
-    """Remove a character from the database.
-    
-    The method will return a boolean value as to whether or not the
-    character has been successfully removed.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.removeCharacter(name))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-def removeCharacterFromGame(name: str, title: str) -> bool:
-    """Remove a character's appears_in relation from a given Game.
-    
-    The method will return a boolean value as to whether or not the
-    relation has been successfully removed.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.removeRelation(name, title))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-# RETRIEVE
-def getCharacterByName(name: str) -> Optional[GameCharacter]:
-    """Get a character from the database using their name."""
-    result: Optional[GameCharacter] = None
-    try:
-        with RyuConnector() as rdb:
-            # Get the character
-            rdb.execute(queries.getCharacterByName(name))
-            for row in rdb.fetchall():
-                result = GameCharacter(row[0], row[1])
-            # Fill missing fields
-            if result:
-                result.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getCharactersLikeName(name: str) -> Optional[List[GameCharacter]]:
-    """Get characters from the database whose names are similar to the arg.
-
-    Returns an empty array if no characters can be found, but returns None 
-    if any sorts of errors occur.
-    """
-    result: List[GameCharacter] = []
-    try:
-        with RyuConnector() as rdb:
-            # Get the character(s)
-            rdb.execute(queries.getCharacterLikeName(name))
-            for row in rdb.fetchall():
-                result.append(GameCharacter(row[0], row[1]))
-            # Fill missing data
-            for c in result:
-                c.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getCharactersByNames(names: Tuple[str]) -> Optional[List[GameCharacter]]:
-    """Get characters from the database whose names are in the passed tuple.
-    
-    Returns an empty array if no characters can be found, but returns None
-    if any sorts of errors occur.
-    """
-    result: List[GameCharacter] = []
-    try:
-        with RyuConnector() as rdb:
-            # Get the characters
-            rdb.execute(queries.getCharactersByNames(names))
-            for row in rdb.fetchall():
-                result.append(GameCharacter(row[0], row[1]))
-            # Fill missing data
-            for c in result:
-                c.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getCharactersByGame(title: str) -> Optional[List[GameCharacter]]:
-    """Get a list of all characters who appear in a given Game.
-    
-    Returns an empty array if no characters exist in the game, or if the
-    game doesn't exist, and returns None if errors occur.
-    """
-    result: List[GameCharacter] = []
-    try:
-        with RyuConnector() as rdb:
-            # Get the characters
-            rdb.execute(queries.getCharactersByGame(title))
-            for row in rdb.fetchall():
-                result.append(GameCharacter(row[0], row[1]))
-            # Fill missing data
-            for c in result:
-                c.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getCharactersByRyuNumber(rn: int) -> Optional[List[GameCharacter]]:
-    """Get a list of all characters who have a given Ryu Number.
-    
-    Returns an empty array if no characters can be found, but returns None
-    if any sorts of errors occur.
-    """
-    result: List[GameCharacter] = []
-    try:
-        with RyuConnector() as rdb:
-            # Get the characters
-            rdb.execute(queries.getCharacterByRyu(int(rn)))
-            for row in rdb.fetchall():
-                result.append(GameCharacter(row[0], row[1]))
-            # Fill missing data
-            for c in result:
-                c.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getCharacterByAlias(aname: str) -> Optional[GameCharacter]:
-    """Get a character object based on that character's alias."""
-    result: Optional[GameCharacter] = None
-    try:
-        with RyuConnector() as rdb:
-            # Get the character
-            rdb.execute(queries.getCharacterByAlias(aname))
-            for row in rdb.fetchall():
-                result = GameCharacter(row[0], row[1])
-            # Fill missing data
-            if result:
-                result.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getCharactersLikeAlias(aname: str) -> Optional[List[GameCharacter]]:
-    """Get characters from the database whose names are similar to the arg.
-    
-    Returns an empty array if no characters can be found, but returns None 
-    if any sorts of errors occur.
-    """
-    result: List[GameCharacter] = []
-    try:
-        with RyuConnector() as rdb:
-            # Get the character(s)
-            rdb.execute(queries.getCharactersLikeAlias(aname))
-            for row in rdb.fetchall():
-                result.append(GameCharacter(row[0], row[1]))
-            # Fill missing data
-            for c in result:
-                c.getMissingData(rdb)
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getNumCharacters() -> Optional[int]:
-    """Get the total number of characters in the database."""
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getNumCharacters())
-            for row in rdb.fetchall():
-                return int(row[0])
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getNumCharactersWithRN(rn: int) -> Optional[int]:
-    """Get the number of characters in the database with a given Ryu Number."""
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getNumCharactersWithRN(rn))
-            for row in rdb.fetchall():
-                return int(row[0])
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-# UPDATE
-def updateCharacterName(oldName: str, newName: str) -> bool:
-    """Update the name of a character in the database.
-    
-    The method will return a boolean value as to whether or not the
-    character's name has been successfully updated.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.updateCharacterName(oldName, newName))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-
-#=======================#
-# GAME DATABASE METHODS #
-#=======================#
-# INSERT
-def insertGame(title: str, release_date: str="0000-00-00") -> bool:
-    """Insert a Game to the database.
-    
-    The method will return a boolean value as to whether or not the
-    game has been successfully inserted.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.insertGame(title, release_date))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-# REMOVE
-def removeGame(title: str) -> bool:
-    """Remove a Game from the database
-    
-    The method will return a boolean value as to whether or not the
-    game has been successfully removed.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.removeGame(title))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-# RETRIEVE
-def getGameByTitle(title: str) -> Optional[Game]:
-    """Get a Game from the database using its title."""
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getGameByTitle(title))
-            for row in rdb:
-                return Game(row[0], row[1], row[2])
-            return None
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getGamesLikeTitle(title: str) -> Optional[List[Game]]:
-    """Get games from the database whose titles are similar to the arg.
-    
-    Returns an empty array if no games can be found, but returns None if any
-    sorts of errors occur.
-    """
-    result: List[Game] = []
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getGameLikeTitle(title))
-            for row in rdb.fetchall():
-                result.append(Game(row[0], row[1], row[2]))
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getGamesByTitles(titles: Tuple[str]) -> Optional[List[Game]]:
-    """Get games from the database whose titles are in the passed tuple.
-    
-    Returns an empty array if no games can be found, but returns None if any
-    sorts of errors occur.
-    """
-    result: List[Game] = []
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getGamesByTitles(titles))
-            for row in rdb.fetchall():
-                result.append(Game(row[0], row[1], row[2]))
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getGamesByCharacter(name: str) -> Optional[List[Game]]:
-    """Get a list of all the games a given character appears in.
-    
-    Returns an empty array if the character does not exist in any games, and
-    returns None if errors occur.
-    """
-    result: List[Game] = []
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getGamesByCharacter(name))
-            for row in rdb.fetchall():
-                result.append(Game(row[0], row[1], row[2]))
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getGamesByRyuNumber(rn: int) -> Optional[List[Game]]:
-    """Get a list of all games that have a given Ryu Number.
-    
-    Returns an empty array if no games can be found, but returns None if any
-    sorts of errors occur.
-    """
-    result: List[Game] = []
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getGamesByRyu(rn))
-            for row in rdb.fetchall():
-                result.append(Game(row[0], row[1], row[2]))
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getNumGames() -> Optional[int]:
-    """Get the total number of games in the database."""
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getNumGames())
-            for row in rdb.fetchall():
-                return int(row[0])
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getNumGamesWithRN(rn: int) -> int:
-    """Get the number of games in the database with a given Ryu Number."""
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getNumGamesWithRN(rn))
-            for row in rdb.fetchall():
-                return int(row[0])
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-# UPDATE
-def updateGameTitle(oldTitle: str, newTitle: str) -> bool:
-    """Update the title of a Game in the database.
-    
-    The method will return a boolean value as to whether or not the
-    game's title has been successfully updated.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.updateGameTitle(oldTitle, newTitle))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-def updateGameReleaseDate(title: str, release_date: str) -> bool:
-    """Update the release date of a Game in the database.
-    
-    The method will return a boolean value as to whether or not the
-    game's release date has been successfully updated.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.updateGameReleaseDate(title, release_date))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-
-#===============#
-# ALIAS METHODS #
-#===============#
-# INSERT
-def insertAlias(cname: str, aname: str) -> bool:
-    """Insert an alias to the database.
-    
-    Returns whether or not the insertion was successful.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.insertAlias(cname, aname))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-# REMOVE
-def removeAlias(aname: str) -> bool:
-    """Remove an alias from the database.
-    
-    Since each alias is only mapped to one character, we only need the
-    alias to remove the relation.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.removeAlias(aname))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-# RETRIEVE
-def getAliasesFromName(cname: str) -> Optional[List[str]]:
-    """Get a list of aliases that a character goes by.
-    
-    An empty array is returned if the character has no aliases, 
-    but None is returned if any errors occur.
-    """
-    result: List[str] = []
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getAliasesFromName(cname))
-            for row in rdb.fetchall():
-                result.append(row[1])
-            return result
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-def getNameFromAlias(aname: str) -> Optional[str]:
-    """Get a character's name from their alias."""
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getNameFromAlias(aname))
-            for row in rdb.fetchall():
-                return row[0]
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
-
-# UPDATE
-def updateAlias(old_alias: str, new_alias: str) -> bool:
-    """Update the name of an alias in the database.
-    
-    Returns whether or not the alias has been updated successfully.
-    """
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.updateAlias(old_alias, new_alias))
-            return True
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return False
-
-
-#====================#
-# RYU NUMBER METHODS #
-#====================#
-def stepTowardsRyu(item: Node) -> Optional[List[str]]:
-    """Get one step of a path towards Ryu.
-    
-    If the passed item is a Game, then a list of all characters with a Ryu 
-    Number exactly one less than the game's is returned (if possible).
-    If the passed item is a character, then a list of all games with a Ryu 
-    Number exactly equal to the character's is returned (if possible).
-    """
-    with RyuConnector() as rdb:
-        if type(item) is Game:
-            # We're looking for the next character down (RN = this - 1)
-            rdb.execute(queries.getCharacterFromGame(item.primary_key))
-            cs = rdb.fetchall()
-            chars: List[str] = []
-            for c in cs:
-                chars.append(c[0])
-            return chars
-        elif type(item) is GameCharacter:
-            # Base case
-            if item.primary_key == "Ryu": return None
-            # We're looking for the next game down (RN = this)
-            rdb.execute(queries.getGameFromCharacter(item.primary_key))
-            gs = rdb.fetchall()
-            games: List[str] = []
-            for g in gs:
-                games.append(g[0])
-            return games
-        else:
-            # Something got borked
-            return None
-
-def getPathFromCharacter(name: str) -> Optional[List[Node]]:
-    """Get a list of characters and games, including the passed one, to Ryu.
-    
-    The method repeatedly calls the above `stepTowardsRyu()`, looping the
-    given character with games they appear in, and the characters in that
-    game, until Ryu (whose Ryu Number is 0) is reached.
-
-    The returned list is in alternating form of the pattern Character-Game-
-    Character-Game-...-Ryu. The length of the list is dependent on the Ryu
-    Number of the character queried. For a queried character with a Ryu
-    Number of `n`, the list will be of size `2n+1`.
-    """
-    # Get our first character
-    path: List[Node] = []
-    try:
-        with RyuConnector() as rdb:
-            rdb.execute(queries.getCharacterByName(name))
-            c: GameCharacter = tupleToCharacter(rdb.fetchone())
-            path.append(c)
-            if name == "Ryu": return path
-            x: Node = c
-            while (path[-1].ryu_number != 0):
-                rdb.execute(queries.getGameByTitle(choice(stepTowardsRyu(x))))
-                g = rdb.fetchone()
-                if not g: return None
-                path.append(tupleToGame(g))
-                x = path[-1]
-                rdb.execute(queries.getCharacterByName(choice(stepTowardsRyu(x))))
-                c = rdb.fetchone()
-                if not c: return None
-                path.append(tupleToCharacter(c))
-                x = path[-1]
-            return path
-    except Exception as e:
-        print(ERROR_MESSAGES["default_error"](e))
-        return None
+"""Module for employing queries in conjunction with actual objects.
+
+There are methods employed for inserting, removing, retrieving, and
+updating both characters and games. In addition, there are also methods
+to retrieve paths from a given character towards Ryu, and its related
+helper method.
+
+All parameters of methods are named in such a way that they are either
+self-explanatory, or relate directly to a given field of a table. 
+
+Most methods takes a form similar to <action><object>[specification], 
+where <action> can include (insert, remove, get, update), <object> can
+include (Character, Game, etc.), and [specification] can be things such
+as (FromGame, ByName, LikeTitle, etc.), with the exceptions of Ryu
+Number methods.
+
+Every method that only reads from the database is answered by the
+current backend (see `setBackend()`), which is the MySQL database unless
+changed. Methods that write always go to the MySQL database. Several
+writes can be made together, in one transaction, with a `UnitOfWork`.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, List, Set, Tuple, TypeVar
+from random import choice
+
+from classes.name_index import FuzzyIndex, fold, rankByTier
+from classes.nodes import Node, Game, GameCharacter, RelationLoader
+from classes.ryu_backend import LIKE_LIMIT, RyuBackend
+from classes.ryu_cache import CachedBackend, Tag, aliasTag, characterTag, gameTag
+from classes.ryu_cache import CHARACTERS, GAMES, NAMES, RELATIONS, RYU_NUMBERS, TITLES
+from classes.ryu_connector import RyuConnector
+from classes.ryu_graph import RyuGraph, RyuStats, UNLINKED_RN
+from methods import propagation, queries
+
+
+ERROR_MESSAGES = {
+    "default_error": lambda e: f"Error: {e}"    # The default error message, which simply prints the passed Exception
+}
+
+HYDRATION_BATCH_SIZE = 500  # How many characters' relations to fetch per query when hydrating
+LOADER_BATCH_SIZE = 50      # How many characters of a result are filled in together once one of them is read
+PAGE_SIZE = 100             # How many results each page read by the `iter...()` methods holds
+
+T = TypeVar('T')
+NGRAM_TOKEN_SIZE = 2        # MySQL's `ngram_token_size`, the shortest word the FULLTEXT indexes can find
+NO_FULLTEXT_INDEX = 1191    # MySQL's error number for a MATCH without a FULLTEXT index
+
+
+def hydrateCharacters(characters: List[GameCharacter], rdb) -> None:
+    """Fill in the `appears_in` and `aliases` fields of many characters at once.
+
+    Rather than having every character run its own queries through
+    `getMissingData()`, the games and aliases of the whole list are fetched
+    with two set-based queries (per `HYDRATION_BATCH_SIZE` characters), and
+    assigned to each character in memory.
+
+    Parameters
+    ----------
+    characters: List[GameCharacter]
+        The characters to fill in. Characters whose games and aliases are
+        already known will not be changed.
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    """
+    byName: Dict[str, List[GameCharacter]] = {}
+    for c in characters:
+        byName.setdefault(c.name, []).append(c)
+    names = list(byName)
+    for i in range(0, len(names), HYDRATION_BATCH_SIZE):
+        batch = tuple(names[i:i + HYDRATION_BATCH_SIZE])
+        games: Dict[str, List[str]] = {}
+        aliases: Dict[str, List[str]] = {}
+        # Get appears_in relations
+        rdb.execute(*queries.getGamesByCharacters(batch))
+        for row in rdb.fetchall():
+            games.setdefault(row[0], []).append(row[1])
+        # Get alias relations
+        rdb.execute(*queries.getAliasesFromNames(batch))
+        for row in rdb.fetchall():
+            aliases.setdefault(row[0], []).append(row[1])
+        # Assign them to their characters
+        for name in batch:
+            for c in byName[name]:
+                if not c.isLoaded():
+                    c.appears_in = games.get(name, [])
+                    c.aliases = aliases.get(name, [])
+
+def previewCharacters(characters: List[GameCharacter], limit: int) -> None:
+    """Fetch only what is needed to show each character with `printSelf(limit)`.
+
+    That is, each character's aliases, their first `limit` games, and how
+    many games they appear in, for every character that doesn't already
+    have them. A negative `limit` fills every character in completely.
+    Characters from an in-memory backend always have everything already,
+    so this only ever reads from the MySQL database. If any errors occur,
+    they are printed, and the characters are left to be filled in when read.
+
+    Parameters
+    ----------
+    characters: List[GameCharacter]
+        The characters about to be shown, such as one page of results.
+    limit: int
+        How many games of each character will be shown.
+    """
+    missing = [c for c in characters if not c.hasPreview(limit)]
+    if not missing:
+        return
+    try:
+        with RyuConnector() as rdb:
+            if limit < 0:
+                hydrateCharacters(missing, rdb)
+                return
+            names = tuple({c.name for c in missing})
+            games: Dict[str, List[str]] = {}
+            totals: Dict[str, int] = {}
+            aliases: Dict[str, List[str]] = {}
+            rdb.execute(*queries.getFirstGamesByCharacters(names, limit))
+            for cname, gtitle, total in rdb.fetchall():
+                games.setdefault(cname, []).append(gtitle)
+                totals[cname] = total
+            rdb.execute(*queries.getAliasesFromNames(names))
+            for cname, aname in rdb.fetchall():
+                aliases.setdefault(cname, []).append(aname)
+            for c in missing:
+                c.setPreview(games.get(c.name, []), totals.get(c.name, 0))
+                c.aliases = aliases.get(c.name, [])
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+
+def fetchRelations(characters: List[GameCharacter]) -> None:
+    """Fill in the games and aliases of many characters with a new connection.
+
+    This is the `fetch` of the `RelationLoader` given to every group of
+    characters read by a `MySQLBackend`. If any errors occur, they are
+    printed, and the characters are left without games or aliases.
+    """
+    try:
+        with RyuConnector() as rdb:
+            hydrateCharacters(characters, rdb)
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+
+def fetchMatches(rdb, name: str, search: Callable[[str], queries.Query], scan: Callable[[str], queries.Query]) -> List[Tuple]:
+    """Return the rows of every name that may contain a search.
+
+    The FULLTEXT query `search` is used whenever it can find the name, and
+    otherwise the `scan` query is, such as when a word of the search is
+    shorter than `NGRAM_TOKEN_SIZE`, or the database was created before its
+    FULLTEXT indexes were.
+
+    Parameters
+    ----------
+    rdb: RyuConnector.cursor
+        A cursor object opened by a RyuConnector.
+    name: str
+        What was searched for.
+    search: Callable[[str], queries.Query]
+        A query function that uses the FULLTEXT indexes, e.g.
+        `queries.searchCharactersByName`.
+    scan: Callable[[str], queries.Query]
+        A query function that gets the same rows by scanning every name, e.g.
+        `queries.getCharacterLikeName`.
+    """
+    words = name.split()
+    if words and min(len(w) for w in words) >= NGRAM_TOKEN_SIZE:
+        try:
+            rdb.execute(*search(name))
+            return rdb.fetchall()
+        except Exception as e:
+            # Only a MySQL error has this number, so the driver needn't be imported to check it
+            if getattr(e, "errno", None) != NO_FULLTEXT_INDEX: raise
+    rdb.execute(*scan(name))
+    return rdb.fetchall()
+
+def tupleToCharacter(t: Tuple[str, int], rdb=None) -> Optional[GameCharacter]:
+    """Return a GameCharacter object directly related to a tuple.
+    
+    The anticipated tuple input is the result of a query for a character.
+    That is, it is expected to be (name, ryu_number). If a cursor is passed
+    as `rdb`, it is used to fill in the character's data; otherwise, a new
+    connection is borrowed. If the passed tuple is invalid or errors occur
+    during connection, nothing is returned.
+    """
+    try:
+        c = GameCharacter(t[0], t[1])
+        if rdb is None:
+            with RyuConnector() as rdb:
+                hydrateCharacters([c], rdb)
+        else:
+            hydrateCharacters([c], rdb)
+        return c
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return None
+
+def tupleToGame(t: Tuple[str, int, str]) -> Optional[Game]:
+    """Return a Game object directly related to a tuple.
+    
+    The anticipated tuple input is the result of a query for a game.
+    That is, it is expected to be (title, ryu_number, release_date). If the
+    passed tuple is invalid, nothing is returned.
+    """
+    try:
+        return Game(t[0], t[1], t[2])
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return None
+
+
+class MySQLBackend(RyuBackend):
+    """A backend that answers every read by querying the MySQL database.
+
+    Each read borrows a connection through a `RyuConnector`, and characters
+    are given a `RelationLoader` that fills them in with `fetchRelations()`
+    once their games or aliases are first read. Fuzzy searches are answered by
+    `FuzzyIndex`es of every name, alias, and title, which are read from the
+    database on first use and dropped whenever it is written to.
+    """
+    def __init__(self) -> None:
+        self._fuzzy: Optional[Tuple[FuzzyIndex[str], FuzzyIndex[str]]] = None
+
+    def invalidate(self, tags: Optional[Iterable[Tag]]=None) -> None:
+        if tags is None or NAMES in tags or TITLES in tags:
+            self._fuzzy = None
+
+    def _fuzzyIndexes(self, rdb) -> Tuple[FuzzyIndex[str], FuzzyIndex[str]]:
+        """Return fuzzy indexes of every character (by name and alias) and game, building them if needed."""
+        if self._fuzzy is None:
+            names: FuzzyIndex[str] = FuzzyIndex()
+            titles: FuzzyIndex[str] = FuzzyIndex()
+            rdb.execute(*queries.getAllCharacters())
+            for cname, _ in rdb.fetchall():
+                names.add(cname, cname)
+            rdb.execute(*queries.getAllAliases())
+            for cname, aname in rdb.fetchall():
+                names.add(aname, cname)
+            rdb.execute(*queries.getAllGames())
+            for gtitle, _, _ in rdb.fetchall():
+                titles.add(gtitle, gtitle)
+            self._fuzzy = (names, titles)
+        return self._fuzzy
+
+    def getCharacterByName(self, name: str) -> Optional[GameCharacter]:
+        result: Optional[GameCharacter] = None
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the character
+                rdb.execute(*queries.getCharacterByName(name))
+                for row in rdb.fetchall():
+                    result = GameCharacter(row[0], row[1], loader=loader)
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersLikeName(self, name: str) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the character(s), then rank them in order of relevance
+                rows = fetchMatches(rdb, name, queries.searchCharactersByName, queries.getCharacterLikeName)
+                rns = {row[0]: row[1] for row in rows}
+                for cname in rankByTier(((row[2], row[0]) for row in rows), name, LIKE_LIMIT):
+                    result.append(GameCharacter(cname, rns[cname], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersCloseToName(self, name: str) -> Optional[List[GameCharacter]]:
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                matches = self._fuzzyIndexes(rdb)[0].search(name)
+                if not matches:
+                    return []
+                # Get the characters, keeping the order they were ranked in
+                rdb.execute(*queries.getCharactersByNames(tuple(matches)))
+                found = {row[0]: GameCharacter(row[0], row[1], loader=loader) for row in rdb.fetchall()}
+                result = [found[cname] for cname in matches if cname in found]
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersByNames(self, names: Tuple[str]) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the characters
+                rdb.execute(*queries.getCharactersByNames(names))
+                for row in rdb.fetchall():
+                    result.append(GameCharacter(row[0], row[1], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersByGame(self, title: str) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the characters
+                rdb.execute(*queries.getCharactersByGame(title))
+                for row in rdb.fetchall():
+                    result.append(GameCharacter(row[0], row[1], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersByRyuNumber(self, rn: int) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the characters
+                rdb.execute(*queries.getCharacterByRyu(int(rn)))
+                for row in rdb.fetchall():
+                    result.append(GameCharacter(row[0], row[1], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharacterByAlias(self, aname: str) -> Optional[GameCharacter]:
+        result: Optional[GameCharacter] = None
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the character
+                rdb.execute(*queries.getCharacterByAlias(aname))
+                for row in rdb.fetchall():
+                    result = GameCharacter(row[0], row[1], loader=loader)
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersLikeAlias(self, aname: str) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                # Get the character(s)
+                rdb.execute(*queries.getCharactersLikeAlias(aname))
+                for row in rdb.fetchall():
+                    result.append(GameCharacter(row[0], row[1], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getNumCharacters(self) -> Optional[int]:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getNumCharacters())
+                for row in rdb.fetchall():
+                    return int(row[0])
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getNumCharactersWithRN(self, rn: int) -> Optional[int]:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getNumCharactersWithRN(rn))
+                for row in rdb.fetchall():
+                    return int(row[0])
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGameByTitle(self, title: str) -> Optional[Game]:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getGameByTitle(title))
+                for row in rdb.fetchall():
+                    return Game(row[0], row[1], row[2])
+                return None
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGamesLikeTitle(self, title: str) -> Optional[List[Game]]:
+        result: List[Game] = []
+        try:
+            with RyuConnector() as rdb:
+                key = fold(title)
+                for row in fetchMatches(rdb, title, queries.searchGamesByTitle, queries.getGameLikeTitle):
+                    if key in fold(row[0]):
+                        result.append(Game(row[0], row[1], row[2]))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGamesCloseToTitle(self, title: str) -> Optional[List[Game]]:
+        try:
+            with RyuConnector() as rdb:
+                matches = self._fuzzyIndexes(rdb)[1].search(title)
+                if not matches:
+                    return []
+                rdb.execute(*queries.getGamesByTitles(tuple(matches)))
+                found = {row[0]: Game(row[0], row[1], row[2]) for row in rdb.fetchall()}
+                return [found[gtitle] for gtitle in matches if gtitle in found]
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGamesByTitles(self, titles: Tuple[str]) -> Optional[List[Game]]:
+        result: List[Game] = []
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getGamesByTitles(titles))
+                for row in rdb.fetchall():
+                    result.append(Game(row[0], row[1], row[2]))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGamesByCharacter(self, name: str) -> Optional[List[Game]]:
+        result: List[Game] = []
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getGamesByCharacter(name))
+                for row in rdb.fetchall():
+                    result.append(Game(row[0], row[1], row[2]))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGamesByRyuNumber(self, rn: int) -> Optional[List[Game]]:
+        result: List[Game] = []
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getGamesByRyu(rn))
+                for row in rdb.fetchall():
+                    result.append(Game(row[0], row[1], row[2]))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getNumGames(self) -> Optional[int]:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getNumGames())
+                for row in rdb.fetchall():
+                    return int(row[0])
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getNumGamesWithRN(self, rn: int) -> int:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getNumGamesWithRN(rn))
+                for row in rdb.fetchall():
+                    return int(row[0])
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getCharacterByRyuPage(int(rn), after, limit))
+                for row in rdb.stream():
+                    result.append(GameCharacter(row[0], row[1], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getCharactersByGamePage(self, title: str, after: str, limit: int) -> Optional[List[GameCharacter]]:
+        result: List[GameCharacter] = []
+        try:
+            loader = RelationLoader(fetchRelations, LOADER_BATCH_SIZE)
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getCharactersByGamePage(title, after, limit))
+                for row in rdb.stream():
+                    result.append(GameCharacter(row[0], row[1], loader=loader))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getGamesByRyuNumberPage(self, rn: int, after: str, limit: int) -> Optional[List[Game]]:
+        result: List[Game] = []
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getGamesByRyuPage(int(rn), after, limit))
+                for row in rdb.stream():
+                    result.append(Game(row[0], row[1], row[2]))
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getStats(self) -> Optional[RyuStats]:
+        distributions: Dict[str, Dict[int, int]] = {
+            "character_rn": {}, "game_rn": {}, "character_degree": {}, "game_degree": {}
+        }
+        graph = RyuGraph()
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getStatistics())
+                for row in rdb.fetchall():
+                    distributions[row[0]][int(row[1])] = int(row[2])
+                # Components need the relations themselves
+                rdb.execute(*queries.getAllRelations())
+                for row in rdb.fetchall():
+                    graph.addRelation(row[0], row[1])
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+        largestComponent = graph.largestComponent()
+        # Characters and games without relations are components of their own
+        if largestComponent == (0, 0):
+            if distributions["character_rn"]: largestComponent = (1, 0)
+            elif distributions["game_rn"]: largestComponent = (0, 1)
+        return RyuStats(distributions["character_rn"], distributions["game_rn"],
+                        distributions["character_degree"], distributions["game_degree"], largestComponent)
+
+    def getAliasesFromName(self, cname: str) -> Optional[List[str]]:
+        result: List[str] = []
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getAliasesFromName(cname))
+                for row in rdb.fetchall():
+                    result.append(row[1])
+                return result
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getNameFromAlias(self, aname: str) -> Optional[str]:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getNameFromAlias(aname))
+                for row in rdb.fetchall():
+                    return row[0]
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def stepTowardsRyu(self, item: Node) -> Optional[List[str]]:
+        with RyuConnector() as rdb:
+            if type(item) is Game:
+                # We're looking for the next character down (RN = this - 1)
+                rdb.execute(*queries.getCharacterFromGame(item.primary_key))
+                cs = rdb.fetchall()
+                chars: List[str] = []
+                for c in cs:
+                    chars.append(c[0])
+                return chars
+            elif type(item) is GameCharacter:
+                # Base case
+                if item.primary_key == "Ryu": return None
+                # We're looking for the next game down (RN = this)
+                rdb.execute(*queries.getGameFromCharacter(item.primary_key))
+                gs = rdb.fetchall()
+                games: List[str] = []
+                for g in gs:
+                    games.append(g[0])
+                return games
+            else:
+                # Something got borked
+                return None
+
+    def getPathFromCharacter(self, name: str) -> Optional[List[Node]]:
+        try:
+            with RyuConnector() as rdb:
+                # Get our first character
+                rdb.execute(*queries.getCharacterByName(name))
+                c = next(iter(rdb.fetchall()), None)    # Read every row so the cursor can be reused
+                if not c: return None
+                path: List[Node] = [GameCharacter(c[0], c[1])]
+                # Each step's query already returns everything needed for the next node
+                while path[-1].ryu_number != 0:
+                    rdb.execute(*queries.getGameFromCharacter(path[-1].primary_key))
+                    gs = rdb.fetchall()
+                    if not gs: return None
+                    path.append(tupleToGame(choice(gs)))
+                    rdb.execute(*queries.getCharacterFromGame(path[-1].primary_key))
+                    cs = rdb.fetchall()
+                    if not cs: return None
+                    c = choice(cs)
+                    path.append(GameCharacter(c[0], c[1]))
+                # Fill in every character on the path at once
+                hydrateCharacters([x for x in path if isinstance(x, GameCharacter)], rdb)
+                return path
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+    def getShortestPathGraph(self, name: str) -> Optional[Tuple[str, RyuGraph]]:
+        try:
+            with RyuConnector() as rdb:
+                rdb.execute(*queries.getCharacterByName(name))
+                c = next(iter(rdb.fetchall()), None)
+                if not c: return None
+                graph = RyuGraph()
+                graph.addCharacter(c[0])
+                graph.characterRN[c[0]] = c[1]
+                # Walk towards Ryu one Ryu Number at a time, keeping only edges on shortest paths
+                characters: Dict[str, int] = {c[0]: c[1]} if 0 < c[1] < UNLINKED_RN else {}
+                while characters:
+                    games: Dict[str, int] = {}
+                    names = list(characters)
+                    for i in range(0, len(names), HYDRATION_BATCH_SIZE):
+                        rdb.execute(*queries.getRelationsAndRNByCharacters(tuple(names[i:i + HYDRATION_BATCH_SIZE])))
+                        for cname, gtitle, grn in rdb.fetchall():
+                            if grn == characters[cname]:
+                                graph.addRelation(cname, gtitle)
+                                graph.gameRN[gtitle] = games[gtitle] = grn
+                    characters = {}
+                    titles = list(games)
+                    for i in range(0, len(titles), HYDRATION_BATCH_SIZE):
+                        rdb.execute(*queries.getRelationsAndRNByGames(tuple(titles[i:i + HYDRATION_BATCH_SIZE])))
+                        for cname, gtitle, crn in rdb.fetchall():
+                            if crn == games[gtitle] - 1:
+                                graph.addRelation(cname, gtitle)
+                                graph.characterRN[cname] = crn
+                                if crn > 0: characters[cname] = crn
+                return c[0], graph
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return None
+
+_backend: RyuBackend = CachedBackend(MySQLBackend())
+
+def getBackend() -> RyuBackend:
+    """Return the backend that currently answers every read."""
+    return _backend
+
+def setBackend(backend: RyuBackend) -> None:
+    """Change the backend that answers every read.
+
+    Passing a `MemoryBackend` allows reads to be served without a database
+    server. Writes always go to the MySQL database. By default, reads are
+    answered by the MySQL database through a `CachedBackend`.
+    """
+    global _backend
+    _backend = backend
+
+def getCacheStats() -> Optional[Dict[str, int]]:
+    """Return the hit/miss counters of the read cache, or None if reads aren't cached."""
+    if isinstance(_backend, CachedBackend):
+        return _backend.cache.stats()
+    return None
+
+def invalidate(characters: Iterable[str]=(), games: Iterable[str]=(), aliases: Iterable[str]=(),
+               aggregates: Iterable[Tag]=()) -> None:
+    """Tell the current backend exactly what a write has changed.
+
+    Anything the backend cached or derived from those characters, games,
+    aliases, or aggregate tags (see `classes.ryu_cache`) is forgotten. This
+    should be called once the write has been committed.
+    """
+    tags = [characterTag(c) for c in characters] + [gameTag(g) for g in games] + [aliasTag(a) for a in aliases]
+    _backend.invalidate(tags + list(aggregates))
+
+#============================#
+# CHARACTER DATABASE METHODS #
+#============================#
+# INSERT
+def insertCharacter(name: str) -> bool:
+    """Insert a character to the database.
+    
+    The method will return a boolean value as to whether or not the 
+    character has been successfully inserted.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.insertCharacter(name))
+        invalidate(characters=[name], aggregates=[CHARACTERS, NAMES, RYU_NUMBERS])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+def insertCharactersToGame(names: List[str], title: str) -> bool:
+    """Insert a list of characters into a Game.
+    
+    Every character and relation is inserted in one transaction, with one
+    batched statement for the characters and one for the relations (see
+    `UnitOfWork`). The method will return a boolean value as to whether or
+    not all characters have been successfully inserted.
+    """
+    return UnitOfWork().insertCharactersToGame(names, title).commit()
+
+# REMOVE
+def removeCharacter(name: str) -> bool:
+    """Remove a character from the database.
+    
+    Any Ryu Numbers that relied on the character are recomputed. The method
+    will return a boolean value as to whether or not the character has been
+    successfully removed.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.getRelationsByCharacter(name))
+            titles = [row[1] for row in rdb.fetchall()]
+            rdb.execute(*queries.removeCharacter(name))
+            changedCharacters, changedGames = propagation.propagateRemoval(rdb, [], titles)
+        invalidate(characters=[name, *changedCharacters], games=[*titles, *changedGames],
+                   aggregates=[CHARACTERS, NAMES, RELATIONS, RYU_NUMBERS])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+def removeCharacterFromGame(name: str, title: str) -> bool:
+    """Remove a character's appears_in relation from a given Game.
+    
+    Any Ryu Numbers that relied on the relation are recomputed. The method
+    will return a boolean value as to whether or not the relation has been
+    successfully removed.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.removeRelation(name, title))
+            changedCharacters, changedGames = propagation.propagateRemoval(rdb, [name], [title])
+        invalidate(characters=[name, *changedCharacters], games=[title, *changedGames],
+                   aggregates=[RELATIONS, RYU_NUMBERS] if changedCharacters or changedGames else [RELATIONS])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+# RETRIEVE
+def getCharacterByName(name: str) -> Optional[GameCharacter]:
+    """Get a character from the database using their name."""
+    return _backend.getCharacterByName(name)
+
+def getCharactersLikeName(name: str) -> Optional[List[GameCharacter]]:
+    """Get characters from the database whose names are similar to the arg.
+
+    Returns an empty array if no characters can be found, but returns None 
+    if any sorts of errors occur.
+    """
+    return _backend.getCharactersLikeName(name)
+
+def getCharactersCloseToName(name: str) -> Optional[List[GameCharacter]]:
+    """Get characters from the database whose names are close to the arg.
+
+    Unlike `getCharactersLikeName()`, this allows for typos in each word of
+    the name, and returns at most `FUZZY_LIMIT` characters, closest first.
+    Returns an empty array if no characters can be found, but returns None
+    if any sorts of errors occur.
+    """
+    return _backend.getCharactersCloseToName(name)
+
+def getCharactersByNames(names: Tuple[str]) -> Optional[List[GameCharacter]]:
+    """Get characters from the database whose names are in the passed tuple.
+    
+    Returns an empty array if no characters can be found, but returns None
+    if any sorts of errors occur.
+    """
+    return _backend.getCharactersByNames(names)
+
+def getCharactersByGame(title: str) -> Optional[List[GameCharacter]]:
+    """Get a list of all characters who appear in a given Game.
+    
+    Returns an empty array if no characters exist in the game, or if the
+    game doesn't exist, and returns None if errors occur.
+    """
+    return _backend.getCharactersByGame(title)
+
+def getCharactersByRyuNumber(rn: int) -> Optional[List[GameCharacter]]:
+    """Get a list of all characters who have a given Ryu Number.
+    
+    Returns an empty array if no characters can be found, but returns None
+    if any sorts of errors occur.
+    """
+    return _backend.getCharactersByRyuNumber(rn)
+
+def getCharacterByAlias(aname: str) -> Optional[GameCharacter]:
+    """Get a character object based on that character's alias."""
+    return _backend.getCharacterByAlias(aname)
+
+def getCharactersLikeAlias(aname: str) -> Optional[List[GameCharacter]]:
+    """Get characters from the database whose names are similar to the arg.
+    
+    Returns an empty array if no characters can be found, but returns None 
+    if any sorts of errors occur.
+    """
+    return _backend.getCharactersLikeAlias(aname)
+
+def getNumCharacters() -> Optional[int]:
+    """Get the total number of characters in the database."""
+    return _backend.getNumCharacters()
+
+def getNumCharactersWithRN(rn: int) -> Optional[int]:
+    """Get the number of characters in the database with a given Ryu Number."""
+    return _backend.getNumCharactersWithRN(rn)
+
+# UPDATE
+def updateCharacterName(oldName: str, newName: str) -> bool:
+    """Update the name of a character in the database.
+    
+    The method will return a boolean value as to whether or not the
+    character's name has been successfully updated.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.updateCharacterName(oldName, newName))
+        invalidate(characters=[oldName, newName], aggregates=[NAMES])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+
+#=======================#
+# GAME DATABASE METHODS #
+#=======================#
+# INSERT
+def insertGame(title: str, release_date: str="0000-00-00") -> bool:
+    """Insert a Game to the database.
+    
+    The method will return a boolean value as to whether or not the
+    game has been successfully inserted.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.insertGame(title, release_date))
+        invalidate(games=[title], aggregates=[GAMES, TITLES, RYU_NUMBERS])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+# REMOVE
+def removeGame(title: str) -> bool:
+    """Remove a Game from the database
+    
+    Any Ryu Numbers that relied on the game are recomputed. The method will
+    return a boolean value as to whether or not the game has been
+    successfully removed.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.getRelationsByGame(title))
+            names = [row[0] for row in rdb.fetchall()]
+            rdb.execute(*queries.removeGame(title))
+            changedCharacters, changedGames = propagation.propagateRemoval(rdb, names, [])
+        invalidate(characters=[*names, *changedCharacters], games=[title, *changedGames],
+                   aggregates=[GAMES, TITLES, RELATIONS, RYU_NUMBERS])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+# RETRIEVE
+def getGameByTitle(title: str) -> Optional[Game]:
+    """Get a Game from the database using its title."""
+    return _backend.getGameByTitle(title)
+
+def getGamesLikeTitle(title: str) -> Optional[List[Game]]:
+    """Get games from the database whose titles are similar to the arg.
+    
+    Returns an empty array if no games can be found, but returns None if any
+    sorts of errors occur.
+    """
+    return _backend.getGamesLikeTitle(title)
+
+def getGamesCloseToTitle(title: str) -> Optional[List[Game]]:
+    """Get games from the database whose titles are close to the arg.
+
+    Unlike `getGamesLikeTitle()`, this allows for typos in each word of the
+    title, and returns at most `FUZZY_LIMIT` games, closest first. Returns
+    an empty array if no games can be found, but returns None if any sorts
+    of errors occur.
+    """
+    return _backend.getGamesCloseToTitle(title)
+
+def getGamesByTitles(titles: Tuple[str]) -> Optional[List[Game]]:
+    """Get games from the database whose titles are in the passed tuple.
+    
+    Returns an empty array if no games can be found, but returns None if any
+    sorts of errors occur.
+    """
+    return _backend.getGamesByTitles(titles)
+
+def getGamesByCharacter(name: str) -> Optional[List[Game]]:
+    """Get a list of all the games a given character appears in.
+    
+    Returns an empty array if the character does not exist in any games, and
+    returns None if errors occur.
+    """
+    return _backend.getGamesByCharacter(name)
+
+def getGamesByRyuNumber(rn: int) -> Optional[List[Game]]:
+    """Get a list of all games that have a given Ryu Number.
+    
+    Returns an empty array if no games can be found, but returns None if any
+    sorts of errors occur.
+    """
+    return _backend.getGamesByRyuNumber(rn)
+
+def getNumGames() -> Optional[int]:
+    """Get the total number of games in the database."""
+    return _backend.getNumGames()
+
+def getNumGamesWithRN(rn: int) -> int:
+    """Get the number of games in the database with a given Ryu Number."""
+    return _backend.getNumGamesWithRN(rn)
+
+# UPDATE
+def updateGameTitle(oldTitle: str, newTitle: str) -> bool:
+    """Update the title of a Game in the database.
+    
+    The method will return a boolean value as to whether or not the
+    game's title has been successfully updated.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.updateGameTitle(oldTitle, newTitle))
+        invalidate(games=[oldTitle, newTitle], aggregates=[TITLES])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+def updateGameReleaseDate(title: str, release_date: str) -> bool:
+    """Update the release date of a Game in the database.
+    
+    The method will return a boolean value as to whether or not the
+    game's release date has been successfully updated.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.updateGameReleaseDate(title, release_date))
+        invalidate(games=[title], aggregates=[RELATIONS])   # Each character's games are in order of release
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+
+#===============#
+# ALIAS METHODS #
+#===============#
+# INSERT
+def insertAlias(cname: str, aname: str) -> bool:
+    """Insert an alias to the database.
+    
+    Returns whether or not the insertion was successful.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.insertAlias(cname, aname))
+        invalidate(characters=[cname], aliases=[aname], aggregates=[NAMES])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+# REMOVE
+def removeAlias(aname: str) -> bool:
+    """Remove an alias from the database.
+    
+    Since each alias is only mapped to one character, we only need the
+    alias to remove the relation.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.removeAlias(aname))
+        invalidate(aliases=[aname], aggregates=[NAMES])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+# RETRIEVE
+def getAliasesFromName(cname: str) -> Optional[List[str]]:
+    """Get a list of aliases that a character goes by.
+    
+    An empty array is returned if the character has no aliases, 
+    but None is returned if any errors occur.
+    """
+    return _backend.getAliasesFromName(cname)
+
+def getNameFromAlias(aname: str) -> Optional[str]:
+    """Get a character's name from their alias."""
+    return _backend.getNameFromAlias(aname)
+
+# UPDATE
+def updateAlias(old_alias: str, new_alias: str) -> bool:
+    """Update the name of an alias in the database.
+    
+    Returns whether or not the alias has been updated successfully.
+    """
+    try:
+        with RyuConnector() as rdb:
+            rdb.execute(*queries.updateAlias(old_alias, new_alias))
+        invalidate(aliases=[old_alias, new_alias], aggregates=[NAMES])
+        return True
+    except Exception as e:
+        print(ERROR_MESSAGES["default_error"](e))
+        return False
+
+
+#====================#
+# RYU NUMBER METHODS #
+#====================#
+def stepTowardsRyu(item: Node) -> Optional[List[str]]:
+    """Get one step of a path towards Ryu.
+    
+    If the passed item is a Game, then a list of all characters with a Ryu 
+    Number exactly one less than the game's is returned (if possible).
+    If the passed item is a character, then a list of all games with a Ryu 
+    Number exactly equal to the character's is returned (if possible).
+    """
+    return _backend.stepTowardsRyu(item)
+
+def getPathFromCharacter(name: str) -> Optional[List[Node]]:
+    """Get a list of characters and games, including the passed one, to Ryu.
+    
+    The method repeatedly takes a random step as in the above
+    `stepTowardsRyu()`, looping the given character with games they appear
+    in, and the characters in that game, until Ryu (whose Ryu Number is 0)
+    is reached. The MySQL backend runs two queries per step on a single
+    connection, while the in-memory backend follows the precomputed parents
+    of each node (see `RyuGraph.computeParents()`).
+
+    The returned list is in alternating form of the pattern Character-Game-
+    Character-Game-...-Ryu. The length of the list is dependent on the Ryu
+    Number of the character queried. For a queried character with a Ryu
+    Number of `n`, the list will be of size `2n+1`.
+    """
+    return _backend.getPathFromCharacter(name)
+
+def countPathsToRyu(name: str) -> Optional[int]:
+    """Get the number of distinct shortest paths from a character to Ryu.
+
+    Paths are counted with dynamic programming over the nodes one step
+    closer to Ryu (see `RyuGraph.countPaths()`), so no paths are actually
+    built. Returns 0 if the character cannot be linked to Ryu, and None if
+    they don't exist or errors occur.
+    """
+    result = _backend.getShortestPathGraph(name)
+    if result is None: return None
+    cname, graph = result
+    return graph.countPaths().get(cname, 0)
+
+def iterPathsToRyu(name: str, limit: Optional[int]=None) -> Iterator[List[str]]:
+    """Yield every distinct shortest path from a character to Ryu.
+
+    Each path is a list of names and titles, in the same alternating form
+    as `getPathFromCharacter()`. Paths are built lazily and always come in
+    the same order, so taking the first few is cheap even when there are
+    millions. Nothing is yielded if the character doesn't exist, or cannot
+    be linked to Ryu.
+
+    Parameters
+    ----------
+    name: str
+        The name (or alias) of the character to start from.
+    limit: int | None
+        The most paths to yield. (Default is None, which yields them all)
+    """
+    result = _backend.getShortestPathGraph(name)
+    if result is None: return
+    cname, graph = result
+    yield from graph.iterPathsToRyu(cname, limit)
+
+
+#===================#
+# STATISTICS METHOD #
+#===================#
+def getStats() -> Optional[RyuStats]:
+    """Get every statistic about the database at once.
+
+    This includes how many characters and games have each Ryu Number, how
+    many games each character appears in (and vice versa), and the size of
+    the largest connected component. Against the MySQL database, the
+    distributions come from a single grouped query over one connection,
+    rather than one query per Ryu Number. Returns None if errors occur.
+    """
+    return _backend.getStats()
+
+#===============#
+# PAGED METHODS #
+#===============#
+# Each list can be read one page at a time, in order of name (or title),
+# with each page starting after the last name of the page before it. The
+# `iter...()` methods read every page in turn, so that only one page of
+# results is held at once, however many results there are.
+
+def _iterPages(getPage: Callable[[str, int], Optional[List[T]]], key: Callable[[T], str], pageSize: int) -> Iterator[T]:
+    """Yield every result of a paged method, reading `pageSize` results at a time.
+
+    The results stop early if a page cannot be read (its error is printed).
+    """
+    after = ""
+    while True:
+        page = getPage(after, pageSize)
+        if not page:
+            return
+        yield from page
+        if len(page) < pageSize:
+            return
+        after = key(page[-1])
+
+def getCharactersByRyuNumberPage(rn: int, after: str="", limit: int=PAGE_SIZE) -> Optional[List[GameCharacter]]:
+    """Get a page of the characters who have a given Ryu Number, in order of name.
+
+    The page holds the first `limit` characters whose names come after
+    `after` (or from the start, if `after` is empty), so passing the last
+    name of a page gets the next one. Returns an empty array past the last
+    page, but returns None if any sorts of errors occur.
+    """
+    return _backend.getCharactersByRyuNumberPage(rn, after, limit)
+
+def getCharactersByGamePage(title: str, after: str="", limit: int=PAGE_SIZE) -> Optional[List[GameCharacter]]:
+    """Get a page of the characters who appear in a given game, in order of name.
+
+    Pages work as they do for `getCharactersByRyuNumberPage()`.
+    """
+    return _backend.getCharactersByGamePage(title, after, limit)
+
+def getGamesByRyuNumberPage(rn: int, after: str="", limit: int=PAGE_SIZE) -> Optional[List[Game]]:
+    """Get a page of the games that have a given Ryu Number, in order of title.
+
+    Pages work as they do for `getCharactersByRyuNumberPage()`, by title.
+    """
+    return _backend.getGamesByRyuNumberPage(rn, after, limit)
+
+def iterCharactersByRyuNumber(rn: int, pageSize: int=PAGE_SIZE) -> Iterator[GameCharacter]:
+    """Yield every character who has a given Ryu Number, in order of name, one page at a time."""
+    return _iterPages(lambda after, limit: getCharactersByRyuNumberPage(rn, after, limit), lambda c: c.name, pageSize)
+
+def iterCharactersByGame(title: str, pageSize: int=PAGE_SIZE) -> Iterator[GameCharacter]:
+    """Yield every character who appears in a given game, in order of name, one page at a time."""
+    return _iterPages(lambda after, limit: getCharactersByGamePage(title, after, limit), lambda c: c.name, pageSize)
+
+def iterGamesByRyuNumber(rn: int, pageSize: int=PAGE_SIZE) -> Iterator[Game]:
+    """Yield every game that has a given Ryu Number, in order of title, one page at a time."""
+    return _iterPages(lambda after, limit: getGamesByRyuNumberPage(rn, after, limit), lambda g: g.title, pageSize)
+
+
+#================#
+# BATCHED WRITES #
+#================#
+# Kinds of write, by how they affect Ryu Numbers
+RELATE = "relate"                       # Inserts relations
+UNRELATE = "unrelate"                   # Removes relations
+DELETE_CHARACTER = "delete_character"   # Removes a character, and all of their relations
+DELETE_GAME = "delete_game"             # Removes a game, and all of its relations
+
+class Write(NamedTuple):
+    """A single write queued by a `UnitOfWork`.
+
+    Attributes
+    ----------
+    query: queries.Query
+        The query that makes the write.
+    kind: str | None
+        How the write affects Ryu Numbers (one of `RELATE`, `UNRELATE`,
+        `DELETE_CHARACTER`, or `DELETE_GAME`), or None if it doesn't.
+    characters: Tuple[str, ...]
+        The names of the characters written to.
+    games: Tuple[str, ...]
+        The titles of the games written to.
+    aliases: Tuple[str, ...]
+        The aliases written to.
+    aggregates: Tuple[Tag, ...]
+        The aggregate cache tags the write changes (see `classes.ryu_cache`).
+    """
+    query: queries.Query
+    kind: Optional[str] = None
+    characters: Tuple[str, ...] = ()
+    games: Tuple[str, ...] = ()
+    aliases: Tuple[str, ...] = ()
+    aggregates: Tuple[Tag, ...] = ()
+
+class UnitOfWork:
+    """A set of writes to the database, applied together in one transaction.
+
+    Writes are queued with the methods named after this module's write
+    functions (each of which returns the unit of work, so they can be
+    chained), and nothing is sent to the database until `commit()`. The
+    writes are then made in the order they were queued, on one connection,
+    with consecutive writes of the same query sent together through
+    `executemany`. If any of them fails, none of them are applied.
+
+    Ryu Numbers are propagated once per run of insertions or removals,
+    rather than once per write, and the read cache is invalidated once.
+
+    Example
+    -------
+    >>> work = UnitOfWork()
+    >>> for title in character.appears_in:
+    ...     work.removeCharacterFromGame(character.name, title)
+    >>> work.removeCharacter(character.name).commit()
+    """
+    def __init__(self) -> None:
+        self.writes: List[Write] = []
+
+    def __len__(self) -> int:
+        return len(self.writes)
+
+    def _queue(self, write: Write) -> "UnitOfWork":
+        self.writes.append(write)
+        return self
+
+    # CHARACTERS
+    def insertCharacter(self, name: str) -> "UnitOfWork":
+        return self._queue(Write(queries.insertCharacter(name), None, (name,), aggregates=(CHARACTERS, NAMES, RYU_NUMBERS)))
+
+    def insertCharactersToGame(self, names: List[str], title: str) -> "UnitOfWork":
+        # Every character first, so that their relations are sent together
+        for n in names:
+            self.insertCharacter(n)
+        for n in names:
+            self._queue(Write(queries.insertRelation(n, title), RELATE, (n,), (title,), aggregates=(RELATIONS,)))
+        return self
+
+    def removeCharacter(self, name: str) -> "UnitOfWork":
+        return self._queue(Write(queries.removeCharacter(name), DELETE_CHARACTER, (name,),
+                                 aggregates=(CHARACTERS, NAMES, RELATIONS, RYU_NUMBERS)))
+
+    def removeCharacterFromGame(self, name: str, title: str) -> "UnitOfWork":
+        return self._queue(Write(queries.removeRelation(name, title), UNRELATE, (name,), (title,), aggregates=(RELATIONS,)))
+
+    def updateCharacterName(self, oldName: str, newName: str) -> "UnitOfWork":
+        return self._queue(Write(queries.updateCharacterName(oldName, newName), None, (oldName, newName), aggregates=(NAMES,)))
+
+    # GAMES
+    def insertGame(self, title: str, release_date: str="0000-00-00") -> "UnitOfWork":
+        return self._queue(Write(queries.insertGame(title, release_date), None, games=(title,), aggregates=(GAMES, TITLES, RYU_NUMBERS)))
+
+    def removeGame(self, title: str) -> "UnitOfWork":
+        return self._queue(Write(queries.removeGame(title), DELETE_GAME, games=(title,),
+                                 aggregates=(GAMES, TITLES, RELATIONS, RYU_NUMBERS)))
+
+    def updateGameTitle(self, oldTitle: str, newTitle: str) -> "UnitOfWork":
+        return self._queue(Write(queries.updateGameTitle(oldTitle, newTitle), None, games=(oldTitle, newTitle), aggregates=(TITLES,)))
+
+    def updateGameReleaseDate(self, title: str, release_date: str) -> "UnitOfWork":
+        return self._queue(Write(queries.updateGameReleaseDate(title, release_date), None, games=(title,), aggregates=(RELATIONS,)))
+
+    # ALIASES
+    def insertAlias(self, cname: str, aname: str) -> "UnitOfWork":
+        return self._queue(Write(queries.insertAlias(cname, aname), None, (cname,), aliases=(aname,), aggregates=(NAMES,)))
+
+    def removeAlias(self, aname: str) -> "UnitOfWork":
+        return self._queue(Write(queries.removeAlias(aname), None, aliases=(aname,), aggregates=(NAMES,)))
+
+    def updateAlias(self, old_alias: str, new_alias: str) -> "UnitOfWork":
+        return self._queue(Write(queries.updateAlias(old_alias, new_alias), None, aliases=(old_alias, new_alias), aggregates=(NAMES,)))
+
+    def _runs(self) -> Iterator[Tuple[Optional[str], List[Write]]]:
+        """Split the queued writes into runs that only insert, or only remove, relations.
+
+        Writes that don't affect Ryu Numbers join whichever run they fall in.
+        Each run is yielded alongside RELATE, UNRELATE, or None (if no write
+        of the run affects Ryu Numbers).
+        """
+        phase: Optional[str] = None
+        run: List[Write] = []
+        for write in self.writes:
+            writePhase = None if write.kind is None else (RELATE if write.kind == RELATE else UNRELATE)
+            if writePhase is not None and phase is not None and writePhase != phase:
+                yield phase, run
+                run = []
+            if writePhase is not None: phase = writePhase
+            run.append(write)
+        if run:
+            yield phase, run
+
+    def commit(self) -> bool:
+        """Make every queued write in one transaction, and propagate their Ryu Numbers.
+
+        The queue is emptied either way. The read cache is only invalidated
+        once the transaction has been committed; if any write, propagation,
+        or the commit itself fails, the error is printed, nothing is
+        invalidated, and False is returned. Otherwise, True is returned.
+        """
+        writes = self.writes
+        changedCharacters: Set[str] = set()
+        changedGames: Set[str] = set()
+        try:
+            with RyuConnector() as rdb:
+                for phase, run in self._runs():
+                    # Removed characters and games take their relations with them
+                    deletedCharacters = [w.characters[0] for w in run if w.kind == DELETE_CHARACTER]
+                    deletedGames = [w.games[0] for w in run if w.kind == DELETE_GAME]
+                    neighbours = propagation.neighboursOf(rdb, deletedCharacters, deletedGames) if deletedCharacters or deletedGames else (set(), set())
+                    changedCharacters |= neighbours[0]
+                    changedGames |= neighbours[1]
+                    # Send consecutive writes of the same query together
+                    i = 0
+                    while i < len(run):
+                        j = i + 1
+                        while j < len(run) and run[j].query[0] == run[i].query[0]:
+                            j += 1
+                        if j - i == 1:
+                            rdb.execute(*run[i].query)
+                        else:
+                            rdb.executemany(run[i].query[0], [w.query[1] for w in run[i:j]])
+                        i = j
+                    # Propagate from the ends of every relation the run changed
+                    names = {n for w in run if w.kind in (RELATE, UNRELATE) for n in w.characters} | neighbours[0]
+                    titles = {t for w in run if w.kind in (RELATE, UNRELATE) for t in w.games} | neighbours[1]
+                    if phase == RELATE:
+                        changed = propagation.propagateInsertion(rdb, names, titles)
+                    elif phase == UNRELATE:
+                        changed = propagation.propagateRemoval(rdb, names - set(deletedCharacters), titles - set(deletedGames))
+                    else:
+                        changed = (set(), set())
+                    changedCharacters |= changed[0]
+                    changedGames |= changed[1]
+        except Exception as e:
+            print(ERROR_MESSAGES["default_error"](e))
+            return False
+        finally:
+            self.writes = []
+        aggregates = {a for w in writes for a in w.aggregates}
+        if changedCharacters or changedGames: aggregates.add(RYU_NUMBERS)
+        invalidate(characters=[*(c for w in writes for c in w.characters), *changedCharacters],
+                   games=[*(g for w in writes for g in w.games), *changedGames],
+                   aliases=[a for w in writes for a in w.aliases],
+                   aggregates=aggregates)
+        return True
@@ -0,0 +1,55 @@
+"""The Ryu Database as a library, without the interactive menu of `main`.
+
+Every module of `classes` and `methods` can be reached as an attribute of
+this package, e.g. `ryu.ryu_database.getCharacterByName("Ryu")`. Modules
+are only imported the first time they are used, so a program that only
+reads the local files never imports the MySQL connector, and one that only
+queries the database never imports the snapshot or file code it doesn't
+reach. Nothing here imports `main`.
+
+Modules
+-------
+config
+    Settings shared by every part of the Ryu Database.
+
+Along with every module of `classes` (such as `file_manager` or `nodes`)
+and of `methods` (such as `ryu_database` or `ryu_async`).
+"""
+
+import importlib
+from typing import Dict, List
+
+
+MODULES: Dict[str, str] = {
+    "config": "ryu.config",
+    # classes
+    "file_manager": "classes.file_manager",
+    "name_index": "classes.name_index",
+    "nodes": "classes.nodes",
+    "ryu_backend": "classes.ryu_backend",
+    "ryu_cache": "classes.ryu_cache",
+    "ryu_connector": "classes.ryu_connector",
+    "ryu_graph": "classes.ryu_graph",
+    "ryu_snapshot": "classes.ryu_snapshot",
+    # methods
+    "maintenance": "methods.maintenance",
+    "migrations": "methods.migrations",
+    "propagation": "methods.propagation",
+    "queries": "methods.queries",
+    "ryu_async": "methods.ryu_async",
+    "ryu_database": "methods.ryu_database",
+}
+
+__all__ = list(MODULES)
+
+
+def __getattr__(name: str):
+    """Import a module of the library the first time it is used."""
+    if name not in MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(MODULES[name])
+    globals()[name] = module
+    return module
+
+def __dir__() -> List[str]:
+    return sorted(MODULES)
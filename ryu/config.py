@@ -0,0 +1,22 @@
+"""Settings shared by every part of the Ryu Database.
+
+These were previously defined by `main`, which meant that anything using
+the local files had to import the whole interactive menu. They are kept
+here instead, so that the data layer depends on nothing but this module.
+
+Methods
+-------
+validDate(str) -> bool
+    Return whether a string follows the format of ####-##-##.
+"""
+
+GAMES_PATH = "data/games"       # The folder holding a text file for every game
+TABLES_PATH = "data/tables"     # The folder holding the alias table, change log and snapshot
+CREDENTIALS_FILE = "db.txt"     # The file holding the host, user, password and database names
+
+
+def validDate(date: str) -> bool:
+    """Return whether a string follows the format of ####-##-##."""
+    if len(date) == 10:
+        return date[0:4].isnumeric() and date[5:7].isnumeric() and date[8:10].isnumeric() and date[4] == "-" and date[7] == "-"
+    return False
@@ -0,0 +1 @@
+"""Tests of the Ryu Database, none of which need a MySQL server."""
@@ -0,0 +1,142 @@
+"""Stand-ins for MySQL connections, and a small graph, for testing without a server or driver.
+
+Classes
+-------
+StubCursor
+    An unbuffered cursor that answers every query with the same rows.
+StubConnection
+    A connection whose cursors are all `StubCursor`s over the same rows.
+
+Methods
+-------
+usePool(Callable[[], StubConnection]) -> ConnectionPool
+    Make every `RyuConnector` borrow connections made by a function.
+sampleGraph() -> RyuGraph
+    Return a small graph of `SAMPLE_GAMES`, with its Ryu Numbers computed.
+"""
+
+from typing import Callable, Iterable, List, Optional
+
+from classes import ryu_connector
+from classes.ryu_graph import RyuGraph
+from ryu.config import CREDENTIALS_FILE
+
+
+# Each game's title, release date, and characters. Tekken cannot be linked to Ryu.
+SAMPLE_GAMES = [
+    ("Street Fighter", "1987-08-30", ["Ryu", "Ken"]),
+    ("Final Fight", "1989-12-01", ["Guy", "Haggar"]),
+    ("Street Fighter II", "1991-02-06", ["Ryu", "Ken", "Guile", "Chun-Li"]),
+    ("Tekken", "1994-12-09", ["Kazuya"]),
+    ("Street Fighter Alpha", "1995-06-05", ["Ken", "Guy", "Chun-Li"]),
+    ("Marvel vs. Capcom", "1998-01-23", ["Chun-Li", "Mega Man"]),
+]
+SAMPLE_ALIASES = [("Ryu", "Hoshi"), ("Ken", "Ken Masters"), ("Mega Man", "Rockman")]
+
+
+class StubCursor:
+    """An unbuffered cursor that answers every query with the same rows.
+
+    Like a real unbuffered cursor, it cannot be closed (nor its connection
+    committed) while rows of its last query are still unread.
+    """
+    def __init__(self, rows: List[tuple]) -> None:
+        self.rows = rows
+        self.executed: List[str] = []
+        self._pending: List[tuple] = []
+
+    def execute(self, sql: str, params=None) -> None:
+        self.executed.append(sql)
+        self._pending = list(self.rows)
+
+    def executemany(self, sql: str, rows) -> None:
+        self.executed.append(sql)
+        self._pending = []
+
+    def fetchall(self) -> List[tuple]:
+        rows, self._pending = self._pending, []
+        return rows
+
+    def fetchone(self) -> Optional[tuple]:
+        return self._pending.pop(0) if self._pending else None
+
+    def fetchmany(self, size: int) -> List[tuple]:
+        rows, self._pending = self._pending[:size], self._pending[size:]
+        return rows
+
+    @property
+    def rowcount(self) -> int:
+        return len(self._pending)
+
+    def close(self) -> None:
+        if self._pending:
+            raise RuntimeError("Unread result found")
+
+
+class StubConnection:
+    """A connection whose cursors are all `StubCursor`s over the same rows.
+
+    Attributes
+    ----------
+    rows: List[tuple]
+        The rows every query is answered with.
+    failOn: Set[str]
+        The names of the methods (`"commit"` or `"rollback"`) that should
+        raise an error.
+    committed, rolledBack, closed: bool
+        Whether the connection has been committed, rolled back, or closed.
+    """
+    def __init__(self, rows: Iterable[tuple]=(), failOn: Iterable[str]=()) -> None:
+        self.rows = list(rows)
+        self.failOn = set(failOn)
+        self.cursors: List[StubCursor] = []
+        self.committed = self.rolledBack = self.closed = False
+
+    def cursor(self, prepared: bool=False) -> StubCursor:
+        cursor = StubCursor(self.rows)
+        self.cursors.append(cursor)
+        return cursor
+
+    @property
+    def unread_result(self) -> bool:
+        return any(c._pending for c in self.cursors)
+
+    def consume_results(self) -> None:
+        for c in self.cursors:
+            c._pending = []
+
+    def ping(self, reconnect: bool=False) -> None:
+        pass
+
+    def commit(self) -> None:
+        if self.unread_result:
+            raise RuntimeError("Unread result found")
+        if "commit" in self.failOn:
+            raise RuntimeError("Commit failed")
+        self.committed = True
+
+    def rollback(self) -> None:
+        if "rollback" in self.failOn:
+            raise RuntimeError("Rollback failed")
+        self.rolledBack = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def usePool(connect: Callable[[], StubConnection]) -> ryu_connector.ConnectionPool:
+    """Make every `RyuConnector` borrow connections made by `connect`, and return their pool."""
+    pool = ryu_connector.ConnectionPool(["host", "user", "password", "database"])
+    pool._connect = connect
+    ryu_connector._pools[CREDENTIALS_FILE] = pool
+    return pool
+
+def sampleGraph() -> RyuGraph:
+    """Return a small graph of `SAMPLE_GAMES`, with its Ryu Numbers computed."""
+    graph = RyuGraph()
+    for title, date, characters in SAMPLE_GAMES:
+        graph.addGame(title, date)
+        for cname in characters:
+            graph.addRelation(cname, title)
+    graph.computeRyuNumbers()
+    return graph
@@ -0,0 +1,60 @@
+"""Tests of how the change log is compacted into the local files."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from classes import file_manager as fm
+
+
+class ApplyChangesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        games = os.path.join(self.dir.name, "games")
+        os.mkdir(games)
+        for name, value in (("GAMES_PATH", games),
+                            ("ALIAS_FILE", os.path.join(self.dir.name, "alias.csv")),
+                            ("TEMP_FILE", os.path.join(self.dir.name, "temp.csv")),
+                            ("CHANGE_LOG", os.path.join(self.dir.name, "changes.log"))):
+            patcher = mock.patch.object(fm, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.dir.cleanup)
+        with open(fm.ALIAS_FILE, "w") as f:
+            f.write("cname,aname\nRyu,Hoshi\nKen,Masters\n")
+
+    def aliasRows(self):
+        with open(fm.ALIAS_FILE, "r") as f:
+            return [line.rstrip("\n") for line in f if line.strip()]
+
+    def testAliasIsMovedNotDuplicated(self) -> None:
+        fm._applyChanges([[fm.APPEND_ALIASES, [["Ken", "Hoshi"]]]])
+        self.assertEqual(self.aliasRows(), ["cname,aname", "Ken,Masters", "Ken,Hoshi"])
+
+    def testReplayingAPartlyAppliedLogChangesNothing(self) -> None:
+        log = [
+            [fm.APPEND_ALIASES, [["Ryu", "Satsui"], ["Ken", "Guy"]]],
+            [fm.RENAME_ALIAS, "Guy", "Ken Masters"],
+            [fm.RENAME_ALIAS_CNAME, "Ryu", "Ryu (Street Fighter)"],
+            [fm.REMOVE_ALIAS, "Masters"],
+        ]
+        fm._applyChanges(log)
+        once = self.aliasRows()
+        fm._applyChanges(log[:2])
+        fm._applyChanges(log)
+        self.assertEqual(self.aliasRows(), once)
+        self.assertEqual(sorted(once[1:]), ["Ken,Ken Masters", "Ryu (Street Fighter),Hoshi", "Ryu (Street Fighter),Satsui"])
+
+    def testReplayingCharacterAppendsChangesNothing(self) -> None:
+        log = [
+            [fm.WRITE_GAME, "Street Fighter", "1987-08-30", ["Ryu"]],
+            [fm.APPEND_CHARACTERS, "Street Fighter", ["Ken", "Ryu"]],
+        ]
+        fm._applyChanges(log)
+        fm._applyChanges(log[1:])
+        self.assertEqual(fm._readGameLines("Street Fighter"), ["1987-08-30", "Ryu", "Ken"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Tests of which tables and triggers `init.create_tables()` creates."""
+
+import unittest
+
+from init import create_tables
+from methods import migrations
+from tests.stubs import StubCursor
+
+
+class UnmigratedCursor(StubCursor):
+    """A cursor of a database without a `schema_version` table."""
+    def execute(self, sql: str, params=None) -> None:
+        super().execute(sql, params)
+        if "schema_version" in sql:
+            error = RuntimeError("Table 'schema_version' doesn't exist")
+            error.errno = migrations.NO_SUCH_TABLE
+            raise error
+
+
+class CreateTablesTest(unittest.TestCase):
+    def testNewDatabaseGetsVersionZero(self) -> None:
+        rdb = UnmigratedCursor([])
+        create_tables(rdb)
+        created = [sql for sql in rdb.executed if sql.startswith("CREATE")]
+        self.assertEqual(len(created), 6)
+        self.assertTrue(all("NEW.gtitle" in sql for sql in created if sql.startswith("CREATE TRIGGER")))
+
+    def testMigratedDatabaseIsLeftAlone(self) -> None:
+        rdb = StubCursor([(migrations.SCHEMA_VERSION,)])
+        create_tables(rdb)
+        self.assertEqual(len(rdb.executed), 1)
+        self.assertIn("schema_version", rdb.executed[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests of the schema migrations, against stub cursors."""
+
+import unittest
+
+from classes.ryu_connector import RyuConnector
+from methods import migrations
+from tests.stubs import StubCursor
+
+
+class MySQLError(Exception):
+    """An error carrying a MySQL error number, as the driver's errors do."""
+    def __init__(self, errno: int) -> None:
+        super().__init__(f"MySQL error {errno}")
+        self.errno = errno
+
+
+class ErrorCursor:
+    """A cursor whose every query raises an error."""
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    def execute(self, sql: str, params=None) -> None:
+        raise self.error
+
+
+class VersionCursor:
+    """A cursor that answers every query with one value."""
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def execute(self, sql: str, params=None) -> None:
+        pass
+
+    def fetchall(self):
+        return [(self.value,)]
+
+
+class GetVersionTest(unittest.TestCase):
+    def testVersion(self) -> None:
+        self.assertEqual(migrations.getVersion(VersionCursor(2)), 2)
+
+    def testNoMigrationApplied(self) -> None:
+        self.assertEqual(migrations.getVersion(VersionCursor(None)), 0)
+
+    def testNoVersionTable(self) -> None:
+        self.assertEqual(migrations.getVersion(ErrorCursor(MySQLError(migrations.NO_SUCH_TABLE))), 0)
+
+    def testOtherErrorsAreRaised(self) -> None:
+        with self.assertRaises(MySQLError):
+            migrations.getVersion(ErrorCursor(MySQLError(2013)))
+
+
+# The queries that each index of the migrations was added for
+INDEXED_QUERIES = [
+    "getCharacterByRyu", "getNumCharactersWithRN", "getStatistics",        # character_rn(_name)
+    "getGamesByRyu", "getNumGamesWithRN",                                   # game_rn
+    "getCharactersByGame", "getRelationsByGame", "removeGame",              # appears_in_gid
+    "getNameFromAlias", "getCharacterByAlias", "removeAlias", "updateAlias",    # alias_aname
+    "getCharacterByRyuPage", "getCharactersByGamePage", "getGamesByRyuPage",    # keyset indexes
+]
+
+def planRow(table: str, access: str, key=None) -> tuple:
+    """Return a row of EXPLAIN's output for one table."""
+    return (1, "SIMPLE", table, None, access, key, key, None, None, 1, 100.0, None)
+
+
+class QueryPlanTest(unittest.TestCase):
+    def testIndexedQueriesArePlanned(self) -> None:
+        for name in INDEXED_QUERIES:
+            self.assertIn(name, migrations.PLANNED_QUERIES)
+
+    def testPlannedQueriesArePrepared(self) -> None:
+        for name, (sql, params) in migrations.PLANNED_QUERIES.items():
+            with self.subTest(query=name):
+                self.assertEqual(sql.count("%s"), len(params))
+
+    def testEveryQueryIsExplained(self) -> None:
+        rdb = StubCursor([planRow("game_character", "ref", "character_rn_name")])
+        plans = migrations.explainQueries(rdb)
+        self.assertEqual(list(plans), list(migrations.PLANNED_QUERIES))
+        self.assertTrue(all(sql.startswith("EXPLAIN ") for sql in rdb.executed))
+        self.assertEqual(migrations.fullScans(plans), [])
+
+    def testFullScansAreFound(self) -> None:
+        plans = {
+            "byIndex": [planRow("game", "ref", "game_rn"), planRow("appears_in", "eq_ref", "PRIMARY")],
+            "byScan": [planRow("game", "ref", "game_rn"), planRow("appears_in", "ALL")],
+            "derived": [planRow("<derived2>", "ALL"), planRow("game_character", "index", "PRIMARY")],
+        }
+        self.assertEqual(migrations.fullScans(plans), ["byScan"])
+
+
+class LiveQueryPlanTest(unittest.TestCase):
+    """Checks the plans of a real, filled database, if one can be connected to."""
+    @classmethod
+    def setUpClass(cls) -> None:
+        try:
+            with RyuConnector() as rdb:
+                version = migrations.getVersion(rdb)
+        except Exception as e:
+            raise unittest.SkipTest(f"No database is available ({e})")
+        if version < migrations.SCHEMA_VERSION:
+            raise unittest.SkipTest("The database has not been migrated")
+
+    def testNoQueryScansATable(self) -> None:
+        with RyuConnector() as rdb:
+            plans = migrations.explainQueries(rdb)
+        for name, plan in plans.items():
+            with self.subTest(query=name):
+                self.assertEqual(migrations.fullScans({name: plan}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests that every read of the `MySQLBackend` runs against a stub connection.
+
+No MySQL server (or driver) is needed: the connection pool is given stub
+connections whose cursors return canned rows. Every read catches its own
+errors and prints them, so a read is taken to have failed if it printed
+anything.
+"""
+
+import contextlib
+import inspect
+import io
+import unittest
+from typing import List
+
+from classes import ryu_connector
+from classes.nodes import Game, GameCharacter
+from classes.ryu_backend import RyuBackend
+from methods.ryu_database import MySQLBackend
+from tests.stubs import StubConnection, usePool
+
+
+# Arguments to call each read with, by parameter name
+ARGUMENTS = {
+    "name": "Ryu",
+    "cname": "Ryu",
+    "aname": "Ryu",
+    "title": "Street Fighter",
+    "names": ("Ryu",),
+    "titles": ("Street Fighter",),
+    "rn": 1,
+    "after": "",
+    "limit": 10,
+    "item": Game("Street Fighter", 1, "1987-08-30"),
+}
+
+
+class MySQLBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._pools = dict(ryu_connector._pools)
+        self.useRows([])
+
+    def tearDown(self) -> None:
+        ryu_connector._pools.clear()
+        ryu_connector._pools.update(self._pools)
+
+    def useRows(self, rows: List[tuple]) -> None:
+        """Make every connection borrowed from now on answer with `rows`."""
+        usePool(lambda: StubConnection(rows))
+
+    def call(self, backend: MySQLBackend, name: str):
+        """Call a read of the backend, failing if it printed an error."""
+        method = getattr(backend, name)
+        args = [ARGUMENTS[p] for p in inspect.signature(method).parameters]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = method(*args)
+        self.assertEqual(output.getvalue(), "", f"{name}() failed")
+        return result
+
+    def testEveryReadRuns(self) -> None:
+        reads = [name for name, member in inspect.getmembers(RyuBackend, inspect.isfunction)
+                 if not name.startswith("_") and name != "invalidate"]
+        self.assertTrue(reads)
+        for name in reads:
+            with self.subTest(read=name):
+                self.call(MySQLBackend(), name)
+
+    def testGetGameByTitle(self) -> None:
+        self.useRows([("Street Fighter", 1, "1987-08-30")])
+        game = self.call(MySQLBackend(), "getGameByTitle")
+        self.assertIsInstance(game, Game)
+        self.assertEqual((game.title, game.ryu_number, game.release_date), ("Street Fighter", 1, "1987-08-30"))
+
+    def testGetCharacterByName(self) -> None:
+        self.useRows([("Ryu", 0)])
+        character = self.call(MySQLBackend(), "getCharacterByName")
+        self.assertIsInstance(character, GameCharacter)
+        self.assertEqual((character.name, character.ryu_number), ("Ryu", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests of how the name indexes find and rank names."""
+
+import unittest
+
+from classes.name_index import FuzzyIndex, NameIndex, rankByTier
+from tests.stubs import SAMPLE_GAMES
+
+
+class NameIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = NameIndex()
+        for name in ("Tekken", "Shadow Kenji", "Kenji", "The Ken Doll", "Barbie and Ken",
+                     "Ken Masters", "Ken (Tekken)", "Ken", "Pokémon Trainer"):
+            self.index.add(name, name)
+
+    def testRankedByTier(self) -> None:
+        self.assertEqual(self.index.search("KEN"), [
+            "Ken", "Ken (Tekken)", "Ken Masters", "Barbie and Ken", "The Ken Doll",
+            "Kenji", "Shadow Kenji", "Tekken",
+        ])
+        self.assertEqual(self.index.search("ken", limit=2), ["Ken", "Ken (Tekken)"])
+
+    def testAccentsAreIgnored(self) -> None:
+        self.assertEqual(self.index.search("pokemon"), ["Pokémon Trainer"])
+
+    def testNoMatches(self) -> None:
+        self.assertEqual(self.index.search("Ryu"), [])
+        self.assertEqual(self.index.search(""), [])
+
+    def testKeyRankedByClosestName(self) -> None:
+        matches = [("Ken Masters", "Ken"), ("Ken", "Ken"), ("Kenji", "Kenji")]
+        self.assertEqual(rankByTier(matches, "ken"), ["Ken", "Kenji"])
+
+
+class FuzzyIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = FuzzyIndex()
+        for title, _, characters in SAMPLE_GAMES:
+            self.index.add(title, title)
+            for cname in characters:
+                self.index.add(cname, cname)
+
+    def testRankedByEditsThenExtraWords(self) -> None:
+        self.assertEqual(self.index.search("Stret Fighter"),
+                         ["Street Fighter", "Street Fighter Alpha", "Street Fighter II"])
+
+    def testMisspelledWord(self) -> None:
+        self.assertEqual(self.index.search("Tekkn"), ["Tekken"])
+        self.assertEqual(self.index.search("Kazyua"), ["Kazuya"])
+
+    def testMissingSpace(self) -> None:
+        self.assertEqual(self.index.search("megaman"), ["Mega Man"])
+
+    def testTooFarIsNotFound(self) -> None:
+        self.assertEqual(self.index.search("Zangief"), [])
+
+    def testLimit(self) -> None:
+        self.assertEqual(self.index.search("street fighter", limit=1), ["Street Fighter"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests that propagating a change gives the same Ryu Numbers as recomputing them all.
+
+The database is stood in for by a `RyuGraph`, whose edges are the stored
+relations and whose Ryu Numbers are the stored numbers. Each query that
+`propagation` builds is answered from the graph by `GraphCursor`.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from classes.ryu_graph import RyuGraph, UNLINKED_RN
+from methods import propagation
+from tests.stubs import sampleGraph
+
+
+def _query(name: str):
+    """Return a stand-in for a query function, which records its name and arguments."""
+    return lambda *args: (name, args)
+
+FAKE_QUERIES = SimpleNamespace(**{name: _query(name) for name in (
+    "getRelationsAndRNByCharacters", "getRelationsAndRNByGames",
+    "getRNByCharacterNames", "getRNByGameTitles", "updateCharactersRN", "updateGamesRN",
+)})
+
+
+class GraphCursor:
+    """A cursor that answers the queries of `FAKE_QUERIES` from a graph."""
+    def __init__(self, graph: RyuGraph) -> None:
+        self.graph = graph
+        self.rows = []
+
+    def execute(self, name: str, args: tuple) -> None:
+        g = self.graph
+        if name == "getRelationsAndRNByCharacters":
+            self.rows = [(c, t, g.gameRN[t]) for c in args[0] for t in g.characterGames.get(c, ())]
+        elif name == "getRelationsAndRNByGames":
+            self.rows = [(c, t, g.characterRN[c]) for t in args[0] for c in g.gameCharacters.get(t, ())]
+        elif name == "getRNByCharacterNames":
+            self.rows = [(c, g.characterRN[c]) for c in args[0] if c in g.characterRN]
+        elif name == "getRNByGameTitles":
+            self.rows = [(t, g.gameRN[t]) for t in args[0] if t in g.gameRN]
+        elif name == "updateCharactersRN":
+            g.characterRN.update((c, args[1]) for c in args[0])
+            self.rows = []
+        elif name == "updateGamesRN":
+            g.gameRN.update((t, args[1]) for t in args[0])
+            self.rows = []
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+
+class PropagationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(propagation, "queries", FAKE_QUERIES)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.graph = sampleGraph()
+        self.rdb = GraphCursor(self.graph)
+
+    def assertRecomputed(self) -> None:
+        """Check that the stored Ryu Numbers are what a full recomputation would give."""
+        stored = (dict(self.graph.characterRN), dict(self.graph.gameRN))
+        self.graph.computeRyuNumbers()
+        self.assertEqual(stored, (self.graph.characterRN, self.graph.gameRN))
+
+    def testInsertionLowersWhatItShortened(self) -> None:
+        self.graph.addRelation("Kazuya", "Street Fighter II")
+        changed = propagation.propagateInsertion(self.rdb, ["Kazuya"], ["Street Fighter II"])
+        self.assertEqual(changed, ({"Kazuya"}, {"Tekken"}))
+        self.assertEqual(self.graph.gameRN["Tekken"], 2)
+        self.assertRecomputed()
+
+    def testInsertionThatShortensNothing(self) -> None:
+        self.graph.addRelation("Mega Man", "Final Fight")
+        self.assertEqual(propagation.propagateInsertion(self.rdb, ["Mega Man"], ["Final Fight"]), (set(), set()))
+        self.assertRecomputed()
+
+    def testRemovalReroutesWhatItLengthened(self) -> None:
+        self.graph.characterGames["Chun-Li"].discard("Street Fighter II")
+        self.graph.gameCharacters["Street Fighter II"].discard("Chun-Li")
+        changed = propagation.propagateRemoval(self.rdb, ["Chun-Li"], ["Street Fighter II"])
+        self.assertEqual(changed, ({"Chun-Li", "Mega Man"}, {"Marvel vs. Capcom"}))
+        self.assertEqual(self.graph.characterRN["Mega Man"], 3)
+        self.assertRecomputed()
+
+    def testRemovalThatUnlinks(self) -> None:
+        for cname in ("Ken", "Chun-Li"):
+            self.graph.characterGames[cname].discard("Street Fighter Alpha")
+            self.graph.gameCharacters["Street Fighter Alpha"].discard(cname)
+        propagation.propagateRemoval(self.rdb, ["Ken", "Chun-Li"], ["Street Fighter Alpha"])
+        self.assertEqual(self.graph.characterRN["Haggar"], UNLINKED_RN)
+        self.assertRecomputed()
+
+    def testRemovalOfAnAlternativeChangesNothing(self) -> None:
+        self.graph.characterGames["Ken"].discard("Street Fighter")
+        self.graph.gameCharacters["Street Fighter"].discard("Ken")
+        self.assertEqual(propagation.propagateRemoval(self.rdb, ["Ken"], ["Street Fighter"]), (set(), set()))
+        self.assertRecomputed()
+
+    def testNeighboursOf(self) -> None:
+        self.assertEqual(propagation.neighboursOf(self.rdb, ["Guy"], ["Marvel vs. Capcom"]),
+                         ({"Chun-Li", "Mega Man"}, {"Final Fight", "Street Fighter Alpha"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests of the reads answered by the in-memory backend, including keyset pagination."""
+
+import unittest
+
+from classes.nodes import Game, GameCharacter
+from classes.ryu_backend import MemoryBackend, pageOf
+from classes.ryu_graph import UNLINKED_RN
+from tests.stubs import SAMPLE_ALIASES, sampleGraph
+
+
+def names(nodes) -> list:
+    return [n.primary_key for n in nodes]
+
+
+class MemoryBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = MemoryBackend(sampleGraph(), SAMPLE_ALIASES + [("Zangief", "Red Cyclone")])
+
+    def testCharacterByNameOrAlias(self) -> None:
+        ken = self.backend.getCharacterByName("KEN")
+        self.assertEqual((ken.name, ken.ryu_number), ("Ken", 1))
+        self.assertEqual(ken.appears_in, ["Street Fighter", "Street Fighter II", "Street Fighter Alpha"])
+        self.assertEqual(ken.aliases, ["Ken Masters"])
+        self.assertEqual(self.backend.getCharacterByName("rockman").name, "Mega Man")
+        self.assertIsNone(self.backend.getCharacterByName("Zangief"))
+        self.assertIsNone(self.backend.getNameFromAlias("Red Cyclone"))
+
+    def testSearches(self) -> None:
+        self.assertEqual(names(self.backend.getCharactersLikeName("ken")), ["Ken"])
+        self.assertEqual(names(self.backend.getCharactersCloseToName("Haggr")), ["Haggar"])
+        self.assertEqual(names(self.backend.getGamesLikeTitle("fighter")),
+                         ["Street Fighter", "Street Fighter II", "Street Fighter Alpha"])
+
+    def testByRyuNumber(self) -> None:
+        self.assertEqual(sorted(names(self.backend.getCharactersByRyuNumber(1))), ["Chun-Li", "Guile", "Ken"])
+        self.assertEqual(self.backend.getNumGamesWithRN(UNLINKED_RN), 1)
+        self.assertEqual(self.backend.getStats().numRelations, 14)
+
+    def testStepsAndPath(self) -> None:
+        guy = self.backend.getCharacterByName("Guy")
+        self.assertEqual(self.backend.stepTowardsRyu(guy), ["Street Fighter Alpha"])
+        alpha = self.backend.getGameByTitle("street fighter alpha")
+        self.assertEqual(self.backend.stepTowardsRyu(alpha), ["Chun-Li", "Ken"])
+        path = self.backend.getPathFromCharacter("Haggar")
+        self.assertEqual([type(n) for n in path], [GameCharacter, Game] * 3 + [GameCharacter])
+        self.assertEqual(names(path)[:3], ["Haggar", "Final Fight", "Guy"])
+        self.assertIsNone(self.backend.getPathFromCharacter("Kazuya"))
+
+
+class KeysetPaginationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = MemoryBackend(sampleGraph(), SAMPLE_ALIASES)
+
+    def testPagesFollowOnWithoutRepeats(self) -> None:
+        seen, after = [], ""
+        while True:
+            page = names(self.backend.getCharactersByGamePage("Street Fighter II", after, 3))
+            if not page: break
+            seen.extend(page)
+            after = page[-1]
+        self.assertEqual(seen, ["Chun-Li", "Guile", "Ken", "Ryu"])
+
+    def testPagesByRyuNumber(self) -> None:
+        self.assertEqual(names(self.backend.getCharactersByRyuNumberPage(1, "", 2)), ["Chun-Li", "Guile"])
+        self.assertEqual(names(self.backend.getCharactersByRyuNumberPage(1, "Guile", 2)), ["Ken"])
+        self.assertEqual(names(self.backend.getGamesByRyuNumberPage(2, "marvel vs. capcom", 5)), ["Street Fighter Alpha"])
+        self.assertEqual(self.backend.getCharactersByGamePage("Street Fighter 6", "", 5), [])
+
+    def testPageOfFoldsKeys(self) -> None:
+        items = ["beta", "Alpha", "Émile", "delta", "Charlie"]
+        self.assertEqual(pageOf(items, str, "", 3), ["Alpha", "beta", "Charlie"])
+        self.assertEqual(pageOf(items, str, "CHARLIE", 3), ["delta", "Émile"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests of caching results, and of invalidating them when the data behind them changes."""
+
+import unittest
+from typing import List
+
+from classes.nodes import GameCharacter
+from classes.ryu_backend import MemoryBackend
+from classes.ryu_cache import (CachedBackend, ResultCache, RELATIONS, RYU_NUMBERS,
+                               aliasTag, characterTag, gameTag)
+from tests.stubs import SAMPLE_ALIASES, sampleGraph
+
+
+def fieldsOf(c: GameCharacter) -> tuple:
+    """Return everything shown about a character, for comparing them."""
+    return (c.name, c.ryu_number, c.appears_in, c.aliases)
+
+
+class Clock:
+    """A clock that only moves when told to."""
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = Clock()
+        self.cache = ResultCache(maxSize=2, ttl=10, clock=self.clock)
+
+    def testMissThenHit(self) -> None:
+        self.assertEqual(self.cache.get("a"), (False, None))
+        self.cache.put("a", [1], ["t"])
+        self.assertEqual(self.cache.get("a"), (True, [1]))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def testResultsAreCopies(self) -> None:
+        result = [1]
+        self.cache.put("a", result, [])
+        result.append(2)
+        self.cache.get("a")[1].append(3)
+        self.assertEqual(self.cache.get("a"), (True, [1]))
+
+    def testLeastRecentlyUsedIsEvicted(self) -> None:
+        self.cache.put("a", 1, [])
+        self.cache.put("b", 2, [])
+        self.cache.get("a")
+        self.cache.put("c", 3, [])
+        self.assertEqual([self.cache.get(k)[0] for k in "abc"], [True, False, True])
+        self.assertEqual(self.cache.evictions, 1)
+
+    def testResultsExpire(self) -> None:
+        self.cache.put("a", 1, [])
+        self.clock.now = 9.9
+        self.assertTrue(self.cache.get("a")[0])
+        self.clock.now = 10
+        self.assertFalse(self.cache.get("a")[0])
+        self.assertEqual(len(self.cache), 0)
+
+    def testInvalidateByTag(self) -> None:
+        self.cache.put("a", 1, ["x", "y"])
+        self.cache.put("b", 2, ["y"])
+        self.cache.invalidate(["x"])
+        self.assertEqual([self.cache.get(k)[0] for k in "ab"], [False, True])
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.invalidations, 2)
+
+
+class CountingBackend(MemoryBackend):
+    """A `MemoryBackend` that records which reads reach it."""
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.calls: List[str] = []
+
+    def getCharacterByName(self, name):
+        self.calls.append(name)
+        return super().getCharacterByName(name)
+
+
+class CachedBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = CountingBackend(sampleGraph(), SAMPLE_ALIASES)
+        self.cached = CachedBackend(self.backend, ResultCache())
+
+    def read(self, name: str = "Ken"):
+        return self.cached.getCharacterByName(name)
+
+    def testRepeatedReadsAreCached(self) -> None:
+        self.assertEqual(fieldsOf(self.read()), fieldsOf(self.read()))
+        self.assertEqual(self.backend.calls, ["Ken"])
+
+    def testMissingResultsAreNotCached(self) -> None:
+        self.assertIsNone(self.read("Zangief"))
+        self.assertIsNone(self.read("Zangief"))
+        self.assertEqual(self.backend.calls, ["Zangief", "Zangief"])
+
+    def testWritesInvalidateWhatTheyTouch(self) -> None:
+        for tag in (characterTag("KEN"), gameTag("Street Fighter II"), aliasTag("Ken Masters")):
+            self.read()
+            self.cached.invalidate([tag])
+        self.read()
+        self.assertEqual(len(self.backend.calls), 4)
+
+    def testOtherWritesKeepTheResult(self) -> None:
+        self.read()
+        self.cached.invalidate([characterTag("Guy"), gameTag("Tekken"), aliasTag("Rockman"), RELATIONS])
+        self.read()
+        self.assertEqual(self.backend.calls, ["Ken"])
+
+    def testRyuNumbersInvalidateSteps(self) -> None:
+        item = self.read()
+        self.assertEqual(self.cached.stepTowardsRyu(item), ["Street Fighter", "Street Fighter II"])
+        self.cached.invalidate([RYU_NUMBERS])
+        self.assertEqual(len(self.cached.cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
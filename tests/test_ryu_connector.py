@@ -0,0 +1,85 @@
+"""Tests of how a `RyuConnector` ends its transaction and returns its connection."""
+
+import unittest
+
+from classes import ryu_connector
+from classes.ryu_connector import RyuConnector
+from tests.stubs import StubConnection, usePool
+
+
+class RyuConnectorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._pools = dict(ryu_connector._pools)
+
+    def tearDown(self) -> None:
+        ryu_connector._pools.clear()
+        ryu_connector._pools.update(self._pools)
+
+    def connect(self, cnx: StubConnection) -> ryu_connector.ConnectionPool:
+        return usePool(lambda: cnx)
+
+    def testCommitsAndReusesConnection(self) -> None:
+        cnx = StubConnection([("Ryu", 0)])
+        pool = self.connect(cnx)
+        with RyuConnector() as rdb:
+            rdb.execute("SELECT 1", ())
+            rdb.fetchall()
+        self.assertTrue(cnx.committed)
+        self.assertFalse(cnx.closed)
+        self.assertEqual([c for c, _ in pool._idle], [cnx])
+
+    def testUnreadRowsAreDiscardedBeforeCommitting(self) -> None:
+        cnx = StubConnection([("Ryu", 0), ("Ken", 1)])
+        pool = self.connect(cnx)
+        with RyuConnector() as rdb:
+            rdb.execute("SELECT 1", ())
+            rdb.fetchone()
+        self.assertTrue(cnx.committed)
+        self.assertEqual([c for c, _ in pool._idle], [cnx])
+
+    def testFailedCommitIsRaised(self) -> None:
+        cnx = StubConnection(failOn=["commit"])
+        pool = self.connect(cnx)
+        with self.assertRaisesRegex(RuntimeError, "Commit failed"):
+            with RyuConnector() as rdb:
+                rdb.execute("INSERT", ())
+        self.assertTrue(cnx.closed)
+        self.assertEqual(pool._idle, [])
+        self.assertEqual(pool._in_use, 0)
+
+    def testErrorRollsBack(self) -> None:
+        cnx = StubConnection()
+        self.connect(cnx)
+        with self.assertRaises(ValueError):
+            with RyuConnector() as rdb:
+                rdb.execute("INSERT", ())
+                raise ValueError()
+        self.assertTrue(cnx.rolledBack)
+        self.assertFalse(cnx.committed)
+
+    def testFailedRollbackKeepsOriginalError(self) -> None:
+        cnx = StubConnection(failOn=["rollback"])
+        pool = self.connect(cnx)
+        with self.assertRaises(ValueError):
+            with RyuConnector():
+                raise ValueError()
+        self.assertTrue(cnx.closed)
+        self.assertEqual(pool._in_use, 0)
+
+    def testStreamStoppedEarlyDiscardsRest(self) -> None:
+        cnx = StubConnection([(f"C{i}", 1) for i in range(10)])
+        pool = self.connect(cnx)
+        with RyuConnector() as rdb:
+            rdb.execute("SELECT 1")
+            stream = rdb.stream(3)
+            self.assertEqual([next(stream) for _ in range(4)], [(f"C{i}", 1) for i in range(4)])
+            stream.close()
+            self.assertFalse(cnx.unread_result)
+            rdb.execute("SELECT 2")
+            self.assertEqual(len(list(rdb.stream(3))), 10)
+        self.assertTrue(cnx.committed)
+        self.assertEqual([c for c, _ in pool._idle], [cnx])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests of the in-memory graph of characters and games."""
+
+import unittest
+
+from classes.ryu_graph import RyuGraph, UNLINKED_RN
+from tests.stubs import sampleGraph
+
+
+class RyuNumbersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.graph = sampleGraph()
+
+    def testBreadthFirstSearch(self) -> None:
+        self.assertEqual(self.graph.characterRN, {
+            "Ryu": 0, "Ken": 1, "Guile": 1, "Chun-Li": 1, "Guy": 2, "Mega Man": 2,
+            "Haggar": 3, "Kazuya": UNLINKED_RN,
+        })
+        self.assertEqual(self.graph.gameRN, {
+            "Street Fighter": 1, "Street Fighter II": 1, "Street Fighter Alpha": 2,
+            "Marvel vs. Capcom": 2, "Final Fight": 3, "Tekken": UNLINKED_RN,
+        })
+
+    def testParentsAreOneStepCloser(self) -> None:
+        self.graph.computeParents()
+        self.assertEqual(self.graph.characterParents["Ken"], ("Street Fighter", "Street Fighter II"))
+        self.assertEqual(self.graph.gameParents["Street Fighter Alpha"], ("Chun-Li", "Ken"))
+        self.assertNotIn("Ryu", self.graph.characterParents)
+        self.assertNotIn("Kazuya", self.graph.characterParents)
+
+    def testCountPaths(self) -> None:
+        self.assertEqual(self.graph.countPaths(), {
+            "Ryu": 1, "Ken": 2, "Guile": 1, "Chun-Li": 1, "Guy": 3, "Mega Man": 1,
+            "Haggar": 3, "Kazuya": 0,
+        })
+
+    def testIterPathsMatchesCount(self) -> None:
+        counts = self.graph.countPaths()
+        for cname, count in counts.items():
+            paths = list(self.graph.iterPathsToRyu(cname))
+            self.assertEqual(len(paths), count, cname)
+            self.assertEqual(len({tuple(p) for p in paths}), count, cname)
+            for path in paths:
+                self.assertEqual((path[0], path[-1]), (cname, "Ryu"))
+                self.assertEqual(len(path), 2 * self.graph.characterRN[cname] + 1)
+        self.assertEqual(len(list(self.graph.iterPathsToRyu("Haggar", limit=2))), 2)
+
+    def testStats(self) -> None:
+        stats = self.graph.stats()
+        self.assertEqual((stats.numCharacters, stats.numGames, stats.numRelations), (8, 6, 14))
+        self.assertEqual(stats.maxRN, 3)
+        self.assertEqual(stats.largestComponent, (7, 5))
+
+
+class PathToRyuTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.graph = RyuGraph()
+        self.graph.addRelation("Ryu", "Street Fighter")
+        self.graph.addRelation("Ken", "Street Fighter")
+        self.graph.addRelation("Ken", "Street Fighter II")
+        self.graph.addRelation("Guile", "Street Fighter II")
+        self.graph.computeRyuNumbers()
+
+    def testPathAlternatesToRyu(self) -> None:
+        self.assertEqual(self.graph.pathToRyu("Guile", pick=min),
+                         ["Guile", "Street Fighter II", "Ken", "Street Fighter", "Ryu"])
+        self.assertEqual(self.graph.pathToRyu("Ryu"), ["Ryu"])
+
+    def testUnknownCharacterHasNoPath(self) -> None:
+        self.assertIsNone(self.graph.pathToRyu("Akuma"))
+
+    def testNodeWithoutParentsHasNoPath(self) -> None:
+        self.graph.computeParents()
+        # Ken's parents are stale once his only game to Ryu is removed
+        self.graph.characterParents["Ken"] = ()
+        self.assertIsNone(self.graph.pathToRyu("Guile"))
+        self.assertEqual(list(self.graph.iterPathsToRyu("Guile")), [])
+        self.graph.computeParents()
+        self.graph.gameParents["Street Fighter"] = ()
+        self.assertIsNone(self.graph.pathToRyu("Guile"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests that a graph written to a snapshot reads back the same."""
+
+import os
+import tempfile
+import unittest
+
+from classes.ryu_backend import MemoryBackend
+from classes.ryu_snapshot import RyuSnapshot
+from tests.stubs import SAMPLE_ALIASES, sampleGraph
+
+
+class RyuSnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, "ryu.snap")
+        self.graph = sampleGraph()
+        RyuSnapshot.write(self.path, self.graph, SAMPLE_ALIASES + [("Zangief", "Red Cyclone")])
+
+    def testRoundTrip(self) -> None:
+        with RyuSnapshot(self.path) as snapshot:
+            self.assertEqual((snapshot.numCharacters, snapshot.numGames, snapshot.numAliases, snapshot.numRelations),
+                             (8, 6, 3, 14))
+            graph = snapshot.toGraph()
+            self.assertEqual(sorted(snapshot.aliases()), sorted(SAMPLE_ALIASES))
+        self.assertEqual(graph.characterGames, self.graph.characterGames)
+        self.assertEqual(graph.gameCharacters, self.graph.gameCharacters)
+        self.assertEqual(graph.releaseDates, self.graph.releaseDates)
+        self.assertEqual((graph.characterRN, graph.gameRN), (self.graph.characterRN, self.graph.gameRN))
+
+    def testLookups(self) -> None:
+        with RyuSnapshot(self.path) as snapshot:
+            ken = snapshot.characterId("Ken")
+            self.assertEqual(snapshot.characterName(ken), "Ken")
+            self.assertEqual(snapshot.characterIdByAlias("Ken Masters"), ken)
+            self.assertEqual(snapshot.aliasesOf(ken), ["Ken Masters"])
+            self.assertEqual(sorted(snapshot.gameTitle(g) for g in snapshot.gamesOf(ken)),
+                             ["Street Fighter", "Street Fighter Alpha", "Street Fighter II"])
+            tekken = snapshot.gameId("Tekken")
+            self.assertEqual((snapshot.releaseDate(tekken), snapshot.gameRN(tekken)), ("1994-12-09", 99))
+            self.assertIsNone(snapshot.characterId("Zangief"))
+            self.assertIsNone(snapshot.gameId("Street Fighter 6"))
+
+    def testMemoryBackendFromSnapshot(self) -> None:
+        backend = MemoryBackend.fromSnapshot(self.path)
+        self.assertEqual(backend.getNameFromAlias("rockman"), "Mega Man")
+        self.assertEqual(backend.getCharacterByName("Haggar").ryu_number, 3)
+
+    def testNotASnapshot(self) -> None:
+        with open(self.path, "wb") as f:
+            f.write(b"cname,aname\n" * 4)
+        with self.assertRaises(ValueError):
+            RyuSnapshot(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests of how a `UnitOfWork` batches its writes and reports their outcome."""
+
+import contextlib
+import io
+import unittest
+from typing import List
+
+from classes import ryu_connector
+from classes.ryu_cache import RYU_NUMBERS
+from methods import ryu_database
+from methods.ryu_database import UnitOfWork, RELATE, UNRELATE
+from tests.stubs import StubConnection, usePool
+
+
+class RecordingBackend(ryu_database.MySQLBackend):
+    """A MySQL backend that records every set of tags it is told to invalidate."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.invalidated: List[list] = []
+
+    def invalidate(self, tags=None) -> None:
+        self.invalidated.append(list(tags or []))
+
+
+class UnitOfWorkTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._pools = dict(ryu_connector._pools)
+        self._backend = ryu_database.getBackend()
+        self.backend = RecordingBackend()
+        ryu_database.setBackend(self.backend)
+
+    def tearDown(self) -> None:
+        ryu_connector._pools.clear()
+        ryu_connector._pools.update(self._pools)
+        ryu_database.setBackend(self._backend)
+
+    def commit(self, work: UnitOfWork, cnx: StubConnection) -> bool:
+        usePool(lambda: cnx)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return work.commit()
+
+    def testRunsSplitByPhase(self) -> None:
+        work = (UnitOfWork()
+                .insertGame("Street Fighter")
+                .insertCharactersToGame(["Ryu", "Ken"], "Street Fighter")
+                .removeCharacterFromGame("Ken", "Street Fighter")
+                .insertAlias("Ryu", "Hoshi"))
+        phases = [(phase, len(run)) for phase, run in work._runs()]
+        self.assertEqual(phases, [(RELATE, 5), (UNRELATE, 2)])
+
+    def testConsecutiveWritesAreBatched(self) -> None:
+        cnx = StubConnection()
+        work = UnitOfWork().insertCharacter("Ryu").insertCharacter("Ken").insertCharacter("Chun-Li")
+        self.assertTrue(self.commit(work, cnx))
+        self.assertEqual(len(work), 0)
+        self.assertTrue(cnx.committed)
+        self.assertEqual(sum(len(c.executed) for c in cnx.cursors), 1)
+        tags = self.backend.invalidated[-1]
+        self.assertIn(RYU_NUMBERS, tags)
+
+    def testFailedCommitIsNotInvalidated(self) -> None:
+        cnx = StubConnection(failOn=["commit"])
+        work = UnitOfWork().insertCharacter("Ryu")
+        self.assertFalse(self.commit(work, cnx))
+        self.assertEqual(len(work), 0)
+        self.assertEqual(self.backend.invalidated, [])
+        self.assertFalse(cnx.committed)
+
+
+if __name__ == "__main__":
+    unittest.main()